@@ -4,10 +4,16 @@ import base64
 import io
 import json
 import re
+import sqlite3
+import colorsys
+import unicodedata
 from pathlib import Path
 from pypdf import PdfReader
-from PIL import Image
-import tempfile
+import numpy as np
+import threading
+import atexit
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Load environment variables and OpenAI with multiple sources
 try:
@@ -37,36 +43,216 @@ except ImportError:
         OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
         print(f"🔑 Using environment variable for API key (no dotenv)")
 
-# Initialize OpenAI client with deployment debugging
-OPENAI_AVAILABLE = False
+# The OpenAI client is created on first use (see get_openai_client) so runs served from the
+# cache never pay for importing openai/httpx; a key counts as available until creation fails
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
+OPENAI_AVAILABLE = bool(OPENAI_API_KEY)
+openai_client = None
+_OPENAI_CLIENT_LOCK = threading.Lock()
 
 print(f"🔍 OpenAI Setup Debug:")
 print(f"   - API Key exists: {bool(OPENAI_API_KEY)}")
 print(f"   - API Key length: {len(OPENAI_API_KEY) if OPENAI_API_KEY else 0}")
-
-if OPENAI_API_KEY:
-    try:
-        from openai import OpenAI
-        print(f"   - OpenAI package imported successfully")
-        openai_client = OpenAI(api_key=OPENAI_API_KEY)
-        print(f"   - OpenAI client created successfully")
-        OPENAI_AVAILABLE = True
-        print(f"   - OpenAI status: AVAILABLE ✅")
-    except ImportError as e:
-        print(f"   - OpenAI import failed: {e}")
-        openai_client = None
-    except Exception as e:
-        print(f"   - OpenAI client creation failed: {e}")
-        openai_client = None
-else:
+if not OPENAI_API_KEY:
     print(f"   - No API key found")
-    openai_client = None
+
+
+def get_openai_client():
+    """Return the shared OpenAI client, importing and creating it on the first call"""
+    global openai_client, OPENAI_AVAILABLE
+    if openai_client is not None or not OPENAI_AVAILABLE:
+        return openai_client
+    
+    with _OPENAI_CLIENT_LOCK:
+        if openai_client is None and OPENAI_AVAILABLE:
+            try:
+                from openai import OpenAI
+                import httpx
+                # One pooled keep-alive HTTP client shared by every request (including preload worker threads)
+                openai_client = OpenAI(
+                    api_key=OPENAI_API_KEY,
+                    max_retries=4,  # Jittered backoff on 429/5xx/timeouts that respects Retry-After
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                        timeout=60
+                    )
+                )
+                print(f"✅ OpenAI client created")
+            except ImportError as e:
+                print(f"❌ OpenAI import failed: {e}")
+                OPENAI_AVAILABLE = False
+            except Exception as e:
+                print(f"❌ OpenAI client creation failed: {e}")
+                OPENAI_AVAILABLE = False
+    return openai_client
 
 print(f"   - Final status: {'AVAILABLE' if OPENAI_AVAILABLE else 'UNAVAILABLE'}")
 print(f"   - Current working directory: {os.getcwd()}")
 print(f"   - Environment variables containing 'OPENAI': {[k for k in os.environ.keys() if 'OPENAI' in k.upper()]}")
 
+# Use orjson for the cache and user data files when installed (several times faster than stdlib json)
+try:
+    import orjson
+    
+    def _json_loads(data):
+        return orjson.loads(data)
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    def _json_dumps_compact(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+    
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+    
+    def _json_dumps_compact(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Number of concurrent OpenAI requests used when preloading the cache
+PRELOAD_MAX_WORKERS = 8
+
+# Serializes PyMuPDF page rendering across preload worker threads
+_RENDER_LOCK = threading.Lock()
+
+# Rendered PDF pages (JPEG) sent to the vision API, reused across process restarts
+PAGE_IMAGE_CACHE_DIR = Path(".cache") / "pages"
+
+# PDF points kept above and below a booth row in single-booth images
+BOOTH_TILE_MARGIN = 60
+
+# Width in PDF points of the strip right of a booth label that holds its briefcase icon
+# (it stops short of the rule before the company column)
+BRIEFCASE_ICON_WIDTH = 40
+
+# Fewest briefcase-coloured pixels (at 2x zoom) needed before trusting a sampled colour
+BRIEFCASE_MIN_PIXELS = 200
+
+# Briefcase fill colours measured on the guide: (education level, hue range in degrees, saturation range).
+# Light pink is ~333/0.45, dark pink ~340/0.75 and orange ~18/0.73; anything outside these bands is unclear
+BRIEFCASE_COLOURS = (
+    ("Undergraduate", (320, 350), (0.35, 0.55)),
+    ("Both", (320, 350), (0.65, 0.85)),
+    ("Postgraduate", (5, 35), (0.6, 0.9)),
+)
+
+# Booths whose briefcase colour is known, keyed by (booth_number, page_num); if any of them is not
+# classified as listed, the sampler is off for this PDF and every booth goes to the vision model
+BRIEFCASE_REFERENCE_BOOTHS = {
+    ('A19', 11): "Both",
+    ('A37', 12): "Both",
+    ('B16', 14): "Both",
+    ('A04', 11): "Undergraduate",
+    ('C03', 17): "Postgraduate",
+}
+
+# Journaled vision cache entries between fsyncs of the append-only cache log (used without SQLite)
+CACHE_LOG_FSYNC_EVERY = 25
+
+# Extracted page text per (PDF path, mtime), shared by every reader in the process because
+# Streamlit builds a new reader on each script run
+_PAGE_TEXT_CACHE = {}
+
+# Readers with unsaved user interaction or cache changes, flushed on interpreter exit
+_PENDING_FLUSH = weakref.WeakSet()
+
+def _flush_pending_readers():
+    """Write out any user interaction data or cache entries that were not flushed explicitly"""
+    for reader in list(_PENDING_FLUSH):
+        reader.flush()
+
+atexit.register(_flush_pending_readers)
+
+# Booth list pages for each venue (the venue map is on the page before each range)
+VENUE_PAGES = {
+    # Day 1 venues
+    'SRC Hall A': (11, 12),
+    'SRC Hall B': (14, 15),
+    'SRC Hall C': (17, 18),
+    'EA Atrium': (20, 21),
+    # Day 2 venues
+    'SRC Hall A Day 2': (23, 24),
+    'SRC Hall B Day 2': (26, 27),
+    'SRC Hall C Day 2': (29, 30),
+    'EA Atrium Day 2': (32, 33, 34)
+}
+ALL_VENUES = tuple(VENUE_PAGES)
+
+# Page holding each booth, keyed by (is_day2, booth letter, A01-A22 half for Hall A)
+_BOOTH_PAGE = {
+    (False, 'A', True): 11, (False, 'A', False): 12,
+    (False, 'B', None): 14, (False, 'C', None): 17, (False, 'D', None): 20,
+    (True, 'A', True): 23, (True, 'A', False): 24,
+    (True, 'B', None): 26, (True, 'C', None): 29, (True, 'D', None): 32
+}
+
+# Booth numbers look like A01, B23, C105
+BOOTH_NUMBER_PATTERN = re.compile(r'([A-Z]\d{2,3})')
+
+# Industry labels that appear alongside company names in the booth tables
+INDUSTRY_KEYWORDS = [
+    'Banking & Finance', 'Technology & IT', 'Consulting',
+    'Engineering & Manufacturing', 'Energy & Renewables',
+    'Public Sector', 'Pharmaceutical, Healthcare, Biomedical Sciences',
+    'Chemicals', 'Education', 'Luxury, Retail & Consumer Goods'
+]
+INDUSTRY_KEYWORD_PATTERN = re.compile('|'.join(map(re.escape, INDUSTRY_KEYWORDS)))
+# Strips booth numbers and industry labels from a table row in a single pass
+BOOTH_OR_INDUSTRY_PATTERN = re.compile(r'[A-Z]\d{2,3}|' + INDUSTRY_KEYWORD_PATTERN.pattern)
+# Page headers in the booth tables, and words that mark a line as a bare company name
+TABLE_HEADER_PATTERN = re.compile(r'participating employers|day 1:|day 2:|hall|level|booth company sector', re.IGNORECASE)
+COMPANY_SUFFIX_PATTERN = re.compile(r'pte|ltd|inc|corp|singapore', re.IGNORECASE)
+
+# Valid answers for the vision analysis prompts
+EDUCATION_LEVELS = ["Undergraduate", "Postgraduate", "Both"]
+VALID_INDUSTRIES = [
+    'Banking & Finance', 'Technology & IT', 'Consulting',
+    'Engineering & Manufacturing', 'Energy & Renewables',
+    'Public Sector', 'Pharmaceutical, Healthcare, Biomedical Sciences',
+    'Chemicals', 'Education', 'Luxury, Retail & Consumer Goods',
+    'Real Estate & Construction', 'Financial Services', 'Banks (Local/Asia)',
+    'Transport, Maritime', 'Healthcare (standalone)'
+]
+VALID_INDUSTRY_SET = frozenset(VALID_INDUSTRIES)
+# One case-insensitive scan finds an industry anywhere in a model answer
+_INDUSTRY_PATTERN = re.compile('|'.join(map(re.escape, VALID_INDUSTRIES)), re.IGNORECASE)
+_INDUSTRY_BY_LOWER = {industry.lower(): industry for industry in VALID_INDUSTRIES}
+# Answers that are an industry label rather than a company name
+INDUSTRY_LABEL_SET = VALID_INDUSTRY_SET | {'Healthcare'}
+
+# Full Sector column labels in the guide and the industry each one is cached as. Labels mapped to
+# None are recognised but too broad to trust (e.g. IT firms listed under Consulting & Market Research),
+# so those booths, like any label missing here, are left to the vision model
+PDF_SECTOR_INDUSTRIES = {
+    'Banks (Local/Asia)': 'Banks (Local/Asia)',
+    'Chemicals': 'Chemicals',
+    'Consulting & Market Research': None,
+    'Education': 'Education',
+    'Energy & Renewables': 'Energy & Renewables',
+    'Engineering & Manufacturing': 'Engineering & Manufacturing',
+    'Engineering and Manufacturing': 'Engineering & Manufacturing',
+    'Financial Services': 'Financial Services',
+    'Information Communications Technology': 'Technology & IT',
+    'Luxury, Retail & Consumer Goods': 'Luxury, Retail & Consumer Goods',
+    'Pharmaceutical, Healthcare, Biomedical Sciences': 'Pharmaceutical, Healthcare, Biomedical Sciences',
+    'Public Sector': 'Public Sector',
+    'Real Estate & Construction': 'Real Estate & Construction',
+    'Transport, Maritime & Aerospace': 'Transport, Maritime',
+}
+# Any sector label or industry keyword, longest first so multi-word labels win over their prefixes
+SECTOR_LABEL_PATTERN = re.compile('|'.join(
+    map(re.escape, sorted(set(PDF_SECTOR_INDUSTRIES) | set(INDUSTRY_KEYWORDS), key=len, reverse=True))
+))
+
+
+def _match_valid_industry(industry):
+    """Map a model answer onto a valid industry name, or None if nothing matches"""
+    match = _INDUSTRY_PATTERN.search(industry or "")
+    return _INDUSTRY_BY_LOWER[match.group(0).lower()] if match else None
+
 class CareerFairPDFReader:
     def __init__(self, pdf_path):
         """Initialize the PDF reader with the path to the career fair PDF"""
@@ -76,131 +262,273 @@ class CareerFairPDFReader:
         
         # Initialize OpenAI vision cache
         self.cache_file = Path("openai_vision_cache.json")
-        self.vision_cache = self._load_cache()
+        # New entries are upserted into SQLite (shared with the modular app) and folded into cache_file on save
+        self.cache_db_file = Path("openai_vision_cache.db")
+        self._cache_db = self._open_cache_db()
+        # Append-only log used for new entries when SQLite is unavailable
+        self.cache_log_file = Path("openai_vision_cache.jsonl")
+        self._cache_dirty = 0  # Entries journaled since the cache file was last written
+        self._load_cache()
+        # Industry labels read by the company-name call, keyed by (booth_number, page_num), so the
+        # industry lookup that follows it does not need another vision call
+        self._industry_hints = {}
         
         # Initialize single user data for tracking booth interactions
         self.user_data_file = Path("user_interactions.json")
         self.user_data = self._load_user_data()
+        self._user_data_dirty = False
         
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
         self._load_pdf()
+        
+        # Persistent page -> booth numbers index, so venue pages are only text-extracted once
+        self.booth_index_file = Path("booth_index.json")
+        self._booth_page_index = self._load_booth_index()
     
     def _load_cache(self):
-        """Load the OpenAI vision analysis cache from file"""
+        """Load the OpenAI vision analysis cache from file, split into per-type buckets"""
+        # Buckets are keyed without the "company_"/"industry_" prefix used on disk
+        self._education_cache = {}
+        self._company_cache = {}
+        self._industry_cache = {}
+        self._other_cache = {}  # Entries written by other tools (e.g. website_ and content_ keys)
+        
+        cache_data = {}
         try:
             if self.cache_file.exists():
-                with open(self.cache_file, 'r') as f:
-                    return json.load(f)
+                cache_data = _json_loads(self.cache_file.read_bytes())
         except Exception:
             pass
-        return {}
+        
+        for key, value in cache_data.items():
+            self._store_cache_entry(key, value)
+        
+        # Apply entries written since the cache file was last saved
+        if self._cache_db is not None:
+            try:
+                for key, value in self._cache_db.execute("SELECT k, v FROM cache"):
+                    self._store_cache_entry(key, json.loads(value))
+            except Exception:
+                pass
+        
+        # Replay entries checkpointed by an interrupted preload
+        try:
+            if self.cache_log_file.exists():
+                with open(self.cache_log_file, 'r') as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue  # Partially written last line
+                        for key, value in entry.items():
+                            self._store_cache_entry(key, value)
+        except Exception:
+            pass
+        
+        self._refresh_cache_stat()
+    
+    def _open_cache_db(self):
+        """Open the SQLite store for incremental cache writes, or None to fall back to the JSONL log"""
+        try:
+            db = sqlite3.connect(str(self.cache_db_file), check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("CREATE TABLE IF NOT EXISTS cache (k TEXT PRIMARY KEY, v TEXT)")
+            db.commit()
+            return db
+        except Exception:
+            return None
+    
+    def _refresh_cache_stat(self):
+        """Stat the cache file once and keep the result for get_cache_stats"""
+        try:
+            self._cache_stat = self.cache_file.stat()
+        except OSError:
+            self._cache_stat = None
+    
+    def _store_cache_entry(self, key, value):
+        """Put an entry (in the on-disk key format) into its cache bucket"""
+        if key.startswith('industry_'):
+            self._industry_cache[key[len('industry_'):]] = value
+        elif key.startswith('company_'):
+            self._company_cache[key[len('company_'):]] = value
+        elif '_' in key and not key.startswith(('website_', 'content_')):
+            self._education_cache[key] = value
+        else:
+            self._other_cache[key] = value
     
     def _save_cache(self):
         """Save the OpenAI vision analysis cache to file"""
         try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.vision_cache, f, indent=2)
+            # Write to a temp file and swap it in, so a crash never leaves a truncated cache
+            temp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+            temp_file.write_bytes(_json_dumps(self.vision_cache))
+            os.replace(temp_file, self.cache_file)
+            self._cache_dirty = 0
+            if not self._user_data_dirty:
+                _PENDING_FLUSH.discard(self)
+            
+            # Everything in the checkpoint log is now in the cache file
+            if self.cache_log_file.exists():
+                self.cache_log_file.unlink()
+        except Exception:
+            pass
+        
+        self._refresh_cache_stat()
+    
+    def _journal_cache_entry(self, key, value):
+        """Record one new entry (on-disk key format) without rewriting the cache file
+        
+        The entry is a single SQLite upsert (or a JSONL append without SQLite), and is folded
+        into cache_file by flush(), which also runs at interpreter exit.
+        """
+        self._cache_dirty += 1
+        _PENDING_FLUSH.add(self)
+        if self._cache_db is not None:
+            self._append_cache_log([(key, value)])
+            return
+        try:
+            with open(self.cache_log_file, 'a') as f:
+                f.write(json.dumps({key: value}) + '\n')
+                if self._cache_dirty % CACHE_LOG_FSYNC_EVERY == 0:
+                    f.flush()
+                    os.fsync(f.fileno())
+        except Exception:
+            pass
+    
+    def _append_cache_log(self, entries):
+        """Checkpoint cache entries (on-disk key format) in one SQLite transaction, or one log write"""
+        if not entries:
+            return
+        if self._cache_db is not None:
+            try:
+                self._cache_db.executemany(
+                    "INSERT OR REPLACE INTO cache (k, v) VALUES (?, ?)",
+                    [(key, json.dumps(value)) for key, value in entries]
+                )
+                self._cache_db.commit()
+                return
+            except Exception:
+                pass
+        try:
+            with open(self.cache_log_file, 'a') as f:
+                f.write(''.join(json.dumps({key: value}) + '\n' for key, value in entries))
         except Exception:
             pass
     
+    @property
+    def vision_cache(self):
+        """Merged view of all cache buckets in the on-disk key format"""
+        merged = dict(self._education_cache)
+        merged.update((f"company_{key}", value) for key, value in self._company_cache.items())
+        merged.update((f"industry_{key}", value) for key, value in self._industry_cache.items())
+        merged.update(self._other_cache)
+        return merged
+    
     def _load_user_data(self):
         """Load user interaction data from file"""
         try:
             if self.user_data_file.exists():
-                with open(self.user_data_file, 'r') as f:
-                    return json.load(f)
+                return _json_loads(self.user_data_file.read_bytes())
         except Exception:
             pass
         return {}
     
     def _save_user_data(self):
-        """Save user interaction data to file"""
+        """Save user interaction data to file if it has unsaved changes"""
+        if not self._user_data_dirty:
+            return
         try:
-            with open(self.user_data_file, 'w') as f:
-                json.dump(self.user_data, f, indent=2)
+            # Compact JSON, swapped in atomically so a crash never leaves a truncated file
+            temp_file = self.user_data_file.with_name(self.user_data_file.name + '.tmp')
+            temp_file.write_bytes(_json_dumps_compact(self.user_data))
+            os.replace(temp_file, self.user_data_file)
+            self._user_data_dirty = False
+            if not self._cache_dirty:
+                _PENDING_FLUSH.discard(self)
         except Exception:
             pass
     
+    def flush(self):
+        """Persist pending user interaction changes and cache entries to disk"""
+        self._save_user_data()
+        if self._cache_dirty:
+            self._save_cache()
+    
     def _get_cache_key(self, booth_number, page_num):
-        """Generate a cache key for OpenAI vision analysis"""
+        """Generate the booth cache key shared by all buckets; on disk, company and industry entries add a prefix"""
         # Use a fixed timestamp for deployment compatibility
         # This ensures cache works across different environments
         return f"{booth_number}_{page_num}_1759480166.4307017"
     
-    def _get_company_cache_key(self, booth_number, page_num, cache_suffix=""):
-        """Generate a cache key for company name analysis"""
-        return f"company_{booth_number}_{page_num}_1759480166.4307017{cache_suffix}"
-    
-    def _get_industry_cache_key(self, booth_number, page_num, cache_suffix=""):
-        """Generate a cache key for industry analysis"""
-        return f"industry_{booth_number}_{page_num}_1759480166.4307017{cache_suffix}"
-    
     def get_cache_stats(self):
         """Get comprehensive statistics about the OpenAI vision cache"""
         
-        # Count different cache types
-        education_entries = 0
-        company_entries = 0
-        industry_entries = 0
-        other_entries = 0
-        
-        for key in self.vision_cache.keys():
-            if key.startswith('industry_'):
-                industry_entries += 1
-            elif key.startswith('company_'):
-                company_entries += 1
-            elif '_' in key and not key.startswith(('industry_', 'company_')):
-                education_entries += 1
-            else:
-                other_entries += 1
+        # Each cache type lives in its own bucket, so counts are just len()
+        education_entries = len(self._education_cache)
+        company_entries = len(self._company_cache)
+        industry_entries = len(self._industry_cache)
+        other_entries = len(self._other_cache)
         
         return {
-            'total_entries': len(self.vision_cache),
+            'total_entries': education_entries + company_entries + industry_entries + other_entries,
             'education_entries': education_entries,
             'company_entries': company_entries, 
             'industry_entries': industry_entries,
             'other_entries': other_entries,
-            'cache_file_exists': self.cache_file.exists(),
+            'cache_file_exists': self._cache_stat is not None,
             'cache_file_path': str(self.cache_file),
-            'cache_file_size_mb': round(self.cache_file.stat().st_size / 1024 / 1024, 2) if self.cache_file.exists() else 0
+            'cache_file_size_mb': round(self._cache_stat.st_size / 1024 / 1024, 2) if self._cache_stat else 0
         }
     
     def clear_cache(self):
         """Clear the OpenAI vision cache"""
-        self.vision_cache = {}
+        self._education_cache = {}
+        self._company_cache = {}
+        self._industry_cache = {}
+        self._other_cache = {}
         if self.cache_file.exists():
             self.cache_file.unlink()
+        if self.cache_log_file.exists():
+            self.cache_log_file.unlink()
+        if self._cache_db is not None:
+            try:
+                self._cache_db.execute("DELETE FROM cache")
+                self._cache_db.commit()
+            except Exception:
+                pass
+        self._cache_stat = None
+        self._cache_dirty = 0
 
     def update_user_interaction(self, booth_number, visited=None, resume_shared=None, applied_online=None, interested=None, comments=None, visa_sponsor=None):
         """Update user interaction data for a specific booth"""
-        if booth_number not in self.user_data:
-            self.user_data[booth_number] = {
-                'visited': False,
-                'resume_shared': False,
-                'applied_online': False,
-                'interested': False,
-                'comments': '',
-                'visa_sponsor': ''
-            }
+        entry = self.user_data.setdefault(booth_number, {
+            'visited': False,
+            'resume_shared': False,
+            'applied_online': False,
+            'interested': False,
+            'comments': '',
+            'visa_sponsor': ''
+        })
         
         # Update only the provided fields
-        if visited is not None:
-            self.user_data[booth_number]['visited'] = visited
-        if resume_shared is not None:
-            self.user_data[booth_number]['resume_shared'] = resume_shared
-        if applied_online is not None:
-            self.user_data[booth_number]['applied_online'] = applied_online
-        if interested is not None:
-            self.user_data[booth_number]['interested'] = interested
-        if comments is not None:
-            self.user_data[booth_number]['comments'] = comments
-        if visa_sponsor is not None:
-            self.user_data[booth_number]['visa_sponsor'] = visa_sponsor
+        for field, value in (
+            ('visited', visited),
+            ('resume_shared', resume_shared),
+            ('applied_online', applied_online),
+            ('interested', interested),
+            ('comments', comments),
+            ('visa_sponsor', visa_sponsor),
+        ):
+            if value is not None:
+                entry[field] = value
         
-        self._save_user_data()
-        return self.user_data[booth_number]
+        # Defer the file rewrite; changes are written on flush() or at exit
+        self._user_data_dirty = True
+        _PENDING_FLUSH.add(self)
+        return entry
     
     def get_user_interaction(self, booth_number):
         """Get user interaction data for a specific booth"""
@@ -221,8 +549,7 @@ class CareerFairPDFReader:
         if venue_name:
             venues = [venue_name]
         else:
-            venues = ['SRC Hall A', 'SRC Hall B', 'SRC Hall C', 'EA Atrium',
-                     'SRC Hall A Day 2', 'SRC Hall B Day 2', 'SRC Hall C Day 2', 'EA Atrium Day 2']
+            venues = ALL_VENUES
         
         total_booths = 0
         cached_education = 0
@@ -230,31 +557,8 @@ class CareerFairPDFReader:
         cached_industries = 0
         
         for venue in venues:
-            venue_page_mappings = {
-                # Day 1 venues
-                'SRC Hall A': [11, 12],
-                'SRC Hall B': [14, 15], 
-                'SRC Hall C': [17, 18],
-                'EA Atrium': [20, 21],
-                # Day 2 venues
-                'SRC Hall A Day 2': [23, 24],
-                'SRC Hall B Day 2': [26, 27],
-                'SRC Hall C Day 2': [29, 30],
-                'EA Atrium Day 2': [32, 33, 34]
-            }
-            
-            pages = venue_page_mappings.get(venue, [])
-            booth_numbers = []
-            
-            for page_num in pages:
-                try:
-                    text = self.get_page_text(page_num)
-                    booth_matches = re.findall(r'([A-Z]\d{2,3})', text)
-                    booth_numbers.extend(booth_matches)
-                except Exception:
-                    continue
-            
-            booth_numbers = list(set(booth_numbers))
+            pages = VENUE_PAGES.get(venue, ())
+            booth_numbers = self.get_venue_booth_numbers(pages)
             total_booths += len(booth_numbers)
             
             for booth_number in booth_numbers:
@@ -262,19 +566,13 @@ class CareerFairPDFReader:
                 if not page_num:
                     continue
                 
-                # Check education cache
-                education_key = self._get_cache_key(booth_number, page_num)
-                if education_key in self.vision_cache:
+                # Same fixed-timestamp key the preload writes, shared by all three buckets
+                booth_key = self._get_cache_key(booth_number, page_num)
+                if booth_key in self._education_cache:
                     cached_education += 1
-                
-                # Check company cache
-                company_key = f"company_{booth_number}_{page_num}_{os.path.getmtime(self.pdf_path) if self.pdf_path.exists() else 0}"
-                if company_key in self.vision_cache:
+                if booth_key in self._company_cache:
                     cached_companies += 1
-                
-                # Check industry cache
-                industry_key = f"industry_{booth_number}_{page_num}_{os.path.getmtime(self.pdf_path) if self.pdf_path.exists() else 0}"
-                if industry_key in self.vision_cache:
+                if booth_key in self._industry_cache:
                     cached_industries += 1
         
         if total_booths == 0:
@@ -321,13 +619,13 @@ class CareerFairPDFReader:
                 if page_num:
                     cache_key = self._get_cache_key(booth_number, page_num)
                     
-                    if cache_key in self.vision_cache:
+                    if cache_key in self._education_cache:
                         cache_hits += 1
                     else:
                         # This will trigger the OpenAI call and cache the result
                         education_level = self._analyze_with_openai_vision(booth_number, page_num)
                         if education_level:
-                            self.vision_cache[cache_key] = education_level
+                            self._education_cache[cache_key] = education_level
                             api_calls += 1
         
         if api_calls > 0:
@@ -335,14 +633,17 @@ class CareerFairPDFReader:
         
         return {'cache_hits': cache_hits, 'api_calls': api_calls}
 
-    def preload_all_openai_data(self, venue_name=None):
-        """Preload ALL OpenAI data (company names, industries, education levels) for complete offline operation"""
+    def preload_all_openai_data(self, venue_name=None, verbose=False):
+        """Preload ALL OpenAI data (company names, industries, education levels) for complete offline operation
+        
+        Per-booth status lines are only printed when verbose is True; otherwise progress is
+        reported every 50 analyzed booths.
+        """
         
         if venue_name:
             venues = [venue_name]
         else:
-            venues = ['SRC Hall A', 'SRC Hall B', 'SRC Hall C', 'EA Atrium',
-                     'SRC Hall A Day 2', 'SRC Hall B Day 2', 'SRC Hall C Day 2', 'EA Atrium Day 2']
+            venues = ALL_VENUES
         
         total_stats = {
             'education_cache_hits': 0,
@@ -354,104 +655,156 @@ class CareerFairPDFReader:
             'total_booths_processed': 0
         }
         
+        jobs = []
+        queued_booths = set()
+        
         for venue in venues:
             print(f"\n🏢 Processing {venue}...")
             
-            # Get all booth numbers for this venue
-            venue_page_mappings = {
-                # Day 1 venues
-                'SRC Hall A': [11, 12],
-                'SRC Hall B': [14, 15], 
-                'SRC Hall C': [17, 18],
-                'EA Atrium': [20, 21],
-                # Day 2 venues
-                'SRC Hall A Day 2': [23, 24],
-                'SRC Hall B Day 2': [26, 27],
-                'SRC Hall C Day 2': [29, 30],
-                'EA Atrium Day 2': [32, 33, 34]
-            }
-            
-            pages = venue_page_mappings.get(venue, [])
-            booth_numbers = []
+            pages = VENUE_PAGES.get(venue, ())
             
-            # Extract all booth numbers from pages
-            for page_num in pages:
-                try:
-                    text = self.get_page_text(page_num)
-                    booth_matches = re.findall(r'([A-Z]\d{2,3})', text)
-                    booth_numbers.extend(booth_matches)
-                except Exception as e:
-                    print(f"  ⚠️  Warning: Could not extract booths from page {page_num}: {e}")
-            
-            # Remove duplicates and sort
-            booth_numbers = sorted(list(set(booth_numbers)))
+            # Unique, sorted booth numbers from the persistent page index
+            booth_numbers = self.get_venue_booth_numbers(pages)
             print(f"  📍 Found {len(booth_numbers)} booths: {booth_numbers[:5]}{'...' if len(booth_numbers) > 5 else ''}")
             
-            # Process each booth for all three data types
+            # Queue the missing analyses for each booth; cache hits are counted up front
             for booth_number in booth_numbers:
                 page_num = self._find_booth_page(booth_number)
                 if not page_num:
                     continue
                 
-                print(f"  🔄 Processing {booth_number}...", end=" ")
+                # All three buckets share the same unprefixed booth key, so build it once
+                booth_key = self._get_cache_key(booth_number, page_num)
                 
-                # 1. Education Level Cache
-                education_cache_key = self._get_cache_key(booth_number, page_num)
-                if education_cache_key in self.vision_cache:
-                    total_stats['education_cache_hits'] += 1
-                    print("📚✓", end=" ")
-                else:
-                    education_level = self._analyze_with_openai_vision(booth_number, page_num)
-                    if education_level:
-                        self.vision_cache[education_cache_key] = education_level
-                        total_stats['education_api_calls'] += 1
-                        print(f"📚{education_level[:1]}", end=" ")
-                    else:
-                        print("📚❌", end=" ")
+                # A booth already queued from an earlier venue will be cached by the time it completes
+                already_queued = (booth_number, page_num) in queued_booths
+                need_education = not already_queued and booth_key not in self._education_cache
+                need_company = not already_queued and booth_key not in self._company_cache
+                need_industry = not already_queued and booth_key not in self._industry_cache
                 
-                # 2. Company Name Cache
-                company_cache_key = self._get_company_cache_key(booth_number, page_num)
-                if company_cache_key in self.vision_cache:
+                if not need_education:
+                    total_stats['education_cache_hits'] += 1
+                if not need_company:
                     total_stats['company_cache_hits'] += 1
-                    print("🏢✓", end=" ")
-                else:
-                    company_name = self._analyze_company_name_with_openai_vision(booth_number, page_num)
-                    if company_name and company_name != "Unknown":
-                        self.vision_cache[company_cache_key] = company_name
-                        total_stats['company_api_calls'] += 1
-                        print(f"🏢✓", end=" ")
-                    else:
-                        self.vision_cache[company_cache_key] = "Unknown"
-                        total_stats['company_api_calls'] += 1
-                        print("🏢❌", end=" ")
-                
-                # 3. Industry Cache  
-                industry_cache_key = self._get_industry_cache_key(booth_number, page_num)
-                if industry_cache_key in self.vision_cache:
+                if not need_industry:
                     total_stats['industry_cache_hits'] += 1
-                    print("🏭✓")
+                
+                if need_education or need_company or need_industry:
+                    queued_booths.add((booth_number, page_num))
+                    cached_company = self._company_cache.get(booth_key, "Unknown Company")
+                    jobs.append((booth_number, page_num, need_education, need_company, need_industry, cached_company))
                 else:
-                    # Use the company name we just extracted
-                    cached_company = self.vision_cache.get(company_cache_key, "Unknown Company")
-                    industry = self._analyze_industry_with_openai_vision(booth_number, cached_company, page_num)
-                    if industry and industry != "Unknown":
-                        self.vision_cache[industry_cache_key] = industry
-                        total_stats['industry_api_calls'] += 1
-                        print("🏭✓")
-                    else:
-                        self.vision_cache[industry_cache_key] = "Unknown"
-                        total_stats['industry_api_calls'] += 1
-                        print("🏭❌")
+                    total_stats['total_booths_processed'] += 1
+        
+        pending_log_entries = []
+        analyzed_count = 0
+        
+        def record_booth_results(booth_number, page_num, results):
+            """Merge one booth's analysis results into the cache buckets and stats"""
+            nonlocal analyzed_count
+            status = []
+            booth_key = self._get_cache_key(booth_number, page_num)
+            
+            # 1. Education Level Cache
+            if 'education' in results:
+                education_level = results['education']
+                if education_level:
+                    self._education_cache[booth_key] = education_level
+                    pending_log_entries.append((booth_key, education_level))
+                    total_stats['education_api_calls'] += 1
+                    status.append(f"📚{education_level[:1]}")
+                else:
+                    status.append("📚❌")
+            else:
+                status.append("📚✓")
+            
+            # 2. Company Name Cache
+            if 'company' in results:
+                self._company_cache[booth_key] = results['company']
+                pending_log_entries.append((f"company_{booth_key}", results['company']))
+                total_stats['company_api_calls'] += 1
+                status.append("🏢✓" if results['company'] != "Unknown" else "🏢❌")
+            else:
+                status.append("🏢✓")
+            
+            # 3. Industry Cache
+            if 'industry' in results:
+                self._industry_cache[booth_key] = results['industry']
+                pending_log_entries.append((f"industry_{booth_key}", results['industry']))
+                total_stats['industry_api_calls'] += 1
+                status.append("🏭✓" if results['industry'] != "Unknown" else "🏭❌")
+            else:
+                status.append("🏭✓")
+            
+            total_stats['total_booths_processed'] += 1
+            analyzed_count += 1
+            
+            if verbose:
+                print(f"  🔄 {booth_number}: {' '.join(status)}")
+            
+            # Checkpoint new entries every 50 booths to prevent data loss, without rewriting the whole cache
+            if analyzed_count % 50 == 0:
+                self._append_cache_log(pending_log_entries)
+                pending_log_entries.clear()
+                print(f"  🔄 Analyzed {analyzed_count}/{len(jobs)} booths")
+        
+        # Run the OpenAI calls concurrently; results are merged into the cache on this thread only
+        if jobs:
+            jobs_by_page = {}
+            for job in jobs:
+                jobs_by_page.setdefault(job[1], []).append(job)
+            
+            print(f"\n🚀 Analyzing {len(jobs)} booths on {len(jobs_by_page)} pages with {PRELOAD_MAX_WORKERS} parallel workers...")
+            
+            # Render every needed page up front in one pass over the open document
+            self._prerender_pages(sorted(jobs_by_page))
+            
+            with ThreadPoolExecutor(max_workers=PRELOAD_MAX_WORKERS) as executor:
+                # First pass: one batched vision call per page covers most booths
+                page_futures = {
+                    executor.submit(self._analyze_page_batch, page_num, [job[0] for job in page_jobs]): page_jobs
+                    for page_num, page_jobs in jobs_by_page.items()
+                }
                 
-                total_stats['total_booths_processed'] += 1
+                fallback_futures = {}
+                for future in as_completed(page_futures):
+                    page_results = future.result()
+                    
+                    for booth_number, page_num, need_education, need_company, need_industry, cached_company in page_futures[future]:
+                        batch_result = page_results.get(booth_number, {})
+                        results = {}
+                        if need_education and 'education' in batch_result:
+                            results['education'] = batch_result['education']
+                            need_education = False
+                        if need_company and 'company' in batch_result:
+                            results['company'] = batch_result['company']
+                            cached_company = batch_result['company']
+                            need_company = False
+                        if need_industry and 'industry' in batch_result:
+                            results['industry'] = batch_result['industry']
+                            need_industry = False
+                        
+                        if need_education or need_company or need_industry:
+                            # Second pass: per-booth calls for whatever the batch could not answer
+                            fallback = executor.submit(
+                                self._process_one_booth_all, booth_number, page_num,
+                                need_education, need_company, need_industry, cached_company
+                            )
+                            fallback_futures[fallback] = (booth_number, page_num, results)
+                        else:
+                            record_booth_results(booth_number, page_num, results)
                 
-                # Save cache every 10 booths to prevent data loss
-                if total_stats['total_booths_processed'] % 10 == 0:
-                    self._save_cache()
+                for future in as_completed(fallback_futures):
+                    booth_number, page_num, results = fallback_futures[future]
+                    results.update(future.result())
+                    record_booth_results(booth_number, page_num, results)
         
         # Final save
         self._save_cache()
         
+        # Each page was rendered once for the whole run; drop the images now (they stay on disk)
+        self._page_image_cache.clear()
+        
         # Print summary
         total_api_calls = (total_stats['education_api_calls'] + 
                           total_stats['company_api_calls'] + 
@@ -469,26 +822,420 @@ class CareerFairPDFReader:
         print(f"   • Company API calls: {total_stats['company_api_calls']}")
         print(f"   • Industry API calls: {total_stats['industry_api_calls']}")
         print(f"   • Cache file: {self.cache_file}")
-        print(f"   • Cache entries: {len(self.vision_cache)}")
+        print(f"   • Cache entries: {self.get_cache_stats()['total_entries']}")
         
         return total_stats
     
+    def preload_all_openai_data_batch(self, venue_name=None, poll_interval=30):
+        """Fill the cache through the OpenAI Batch API (half price, up to 24h turnaround)
+        
+        Sends one page request per page with missing data in a single batch job, blocks until it
+        finishes and returns the number of booths that received data. Anything the batch could
+        not answer is left for preload_all_openai_data or on-demand analysis.
+        """
+        if not OPENAI_AVAILABLE:
+            return 0
+        
+        venues = [venue_name] if venue_name else ALL_VENUES
+        
+        # Booths with at least one missing field, grouped by the page they are analyzed on
+        pending_by_page = {}
+        for venue in venues:
+            for booth_number in self.get_venue_booth_numbers(VENUE_PAGES.get(venue, ())):
+                # Same page and key scheme as preload_all_openai_data
+                page_num = self._find_booth_page(booth_number)
+                if not page_num:
+                    continue
+                booth_key = self._get_cache_key(booth_number, page_num)
+                if (booth_key not in self._education_cache or booth_key not in self._company_cache
+                        or booth_key not in self._industry_cache):
+                    booths = pending_by_page.setdefault(page_num, [])
+                    if booth_number not in booths:
+                        booths.append(booth_number)
+        
+        requests = {}
+        for page_num, booth_numbers in sorted(pending_by_page.items()):
+            request_body = self._build_page_batch_request(page_num, booth_numbers)
+            if request_body:
+                requests[f"page_{page_num}"] = (page_num, booth_numbers, request_body)
+        
+        if not requests:
+            print("✅ Cache already complete, no batch needed")
+            return 0
+        
+        client = get_openai_client()
+        if client is None:
+            return 0
+        
+        try:
+            batch_input = "".join(
+                json.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": request_body
+                }) + "\n"
+                for custom_id, (_, _, request_body) in requests.items()
+            )
+            input_file = client.files.create(
+                file=("batch_input.jsonl", batch_input.encode("utf-8")),
+                purpose="batch"
+            )
+            batch = client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            print(f"📦 Submitted batch {batch.id} with {len(requests)} page requests")
+            
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(poll_interval)
+                batch = client.batches.retrieve(batch.id)
+            
+            if batch.status != "completed" or not batch.output_file_id:
+                print(f"❌ Batch {batch.id} ended with status {batch.status}")
+                return 0
+            
+            output = client.files.content(batch.output_file_id).text
+        except Exception as e:
+            print(f"❌ Batch preload failed: {e}")
+            return 0
+        
+        updated = 0
+        for line in output.splitlines():
+            try:
+                result = json.loads(line)
+                page_num, booth_numbers, _ = requests[result["custom_id"]]
+                content = result["response"]["body"]["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue  # Failed request; these booths are analyzed on demand instead
+            
+            for booth_number, booth_result in self._parse_page_batch_response(content, booth_numbers).items():
+                booth_key = self._get_cache_key(booth_number, page_num)
+                # Only fill gaps, never overwrite answers that are already cached
+                if 'education' in booth_result:
+                    self._education_cache.setdefault(booth_key, booth_result['education'])
+                if 'company' in booth_result:
+                    self._company_cache.setdefault(booth_key, booth_result['company'])
+                if 'industry' in booth_result:
+                    self._industry_cache.setdefault(booth_key, booth_result['industry'])
+                if booth_result:
+                    updated += 1
+        
+        # One save for the whole batch
+        self._save_cache()
+        print(f"✅ Batch preload cached data for {updated} booths")
+        return updated
+    
+    def _analyze_page_batch(self, page_num, booth_numbers):
+        """Analyze all requested booths on one page with a single OpenAI vision call
+        
+        Returns {booth_number: {'education': ..., 'company': ..., 'industry': ...}} containing
+        only the fields that passed validation; callers fall back to per-booth calls for the rest.
+        """
+        if not OPENAI_AVAILABLE or not booth_numbers:
+            return {}
+        
+        request_body = self._build_page_batch_request(page_num, booth_numbers)
+        client = get_openai_client()
+        if not request_body or client is None:
+            return {}
+        
+        try:
+            response = client.chat.completions.create(**request_body, timeout=60)
+            content = response.choices[0].message.content
+        except Exception as e:
+            print(f"Batch analysis failed for page {page_num}, falling back to per-booth calls: {e}")
+            return {}
+        
+        return self._parse_page_batch_response(content, booth_numbers)
+    
+    def _build_page_batch_request(self, page_num, booth_numbers, tile_booth=None):
+        """Build the chat completion body that asks for every listed booth on a page, or None if the page cannot be rendered
+        
+        With tile_booth, only the band around that booth is sent instead of the whole page.
+        """
+        image_data = self._convert_pdf_page_to_image(page_num, tile_booth)
+        if not image_data:
+            return None
+        
+        booth_list = ", ".join(booth_numbers)
+        industry_list = "\n".join(f"- {industry}" for industry in VALID_INDUSTRIES)
+        
+        prompt = f"""Look carefully at this career fair page and find each of these booths: {booth_list}.
+
+For EACH booth, extract:
+
+1. "company": the COMPANY NAME for the booth, NOT the industry category.
+   For example, "Financial ServicesA34 DRW Trading Group" means the company name is "DRW Trading Group".
+
+2. "industry": the industry category, exactly one of:
+{industry_list}
+   The industry may be on the same line as the booth number, on a nearby line, a section header, or a table column.
+   Use "Unknown" if no clear industry is shown.
+
+3. "education": the COLOR of the small briefcase icon next to the booth:
+   - LIGHT PINK briefcase (pale/soft pink) = "Undergraduate" only
+   - DARK PINK briefcase (deeper/richer pink) = "Both" undergraduate and postgraduate
+   - ORANGE briefcase = "Postgraduate" only
+
+Respond ONLY with valid JSON:
+{{"booths": [{{"booth": "A01", "company": "Company Name", "industry": "Technology & IT", "education": "Both"}}]}}"""
+        
+        return {
+            "model": "gpt-4o",  # Full GPT-4o for layout parsing of company names and industries
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": prompt
+                        },
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:image/jpeg;base64,{image_data}",
+                                "detail": "high"
+                            }
+                        }
+                    ]
+                }
+            ],
+            "response_format": {"type": "json_object"},
+            "max_tokens": 60 * len(booth_numbers) + 100,  # Roughly one short JSON object per booth
+            "temperature": 0.1
+        }
+    
+    def _parse_page_batch_response(self, content, booth_numbers):
+        """Validate a page batch answer into {booth_number: {field: value}}, dropping unusable fields"""
+        try:
+            page_data = json.loads(content)
+        except (TypeError, ValueError):
+            return {}
+        if not isinstance(page_data, dict):
+            return {}
+        
+        requested_booths = set(booth_numbers)
+        results = {}
+        
+        for entry in page_data.get('booths', []):
+            if not isinstance(entry, dict):
+                continue
+            
+            booth_number = str(entry.get('booth', '')).strip().upper()
+            if booth_number not in requested_booths:
+                continue
+            
+            booth_result = {}
+            
+            education = str(entry.get('education') or '')
+            for level in EDUCATION_LEVELS:
+                if level.lower() in education.lower():
+                    booth_result['education'] = level
+                    break
+            
+            # Company name shouldn't be an industry and should have some text
+            company_name = str(entry.get('company') or '').strip()
+            if (company_name not in INDUSTRY_LABEL_SET and len(company_name) > 2 and
+                    company_name.lower() not in ['unknown', 'n/a', 'none']):
+                booth_result['company'] = company_name
+            
+            industry = _match_valid_industry(entry.get('industry'))
+            if industry:
+                booth_result['industry'] = industry
+            
+            results[booth_number] = booth_result
+        
+        return results
+    
+    def _prefill_from_page_batch(self, booth_numbers, venue_context=None):
+        """Cache company, industry and education for uncached booths with one vision call per page"""
+        if not OPENAI_AVAILABLE:
+            return
+        
+        cache_suffix = "_day2" if venue_context and "Day 2" in venue_context else ""
+        pending_by_page = {}
+        for booth_number in booth_numbers:
+            page_num = self._find_booth_page(booth_number, venue_context)
+            if not page_num:
+                continue
+            booth_key = self._get_cache_key(booth_number, page_num) + cache_suffix
+            if (booth_key not in self._education_cache or booth_key not in self._company_cache
+                    or booth_key not in self._industry_cache):
+                pending_by_page.setdefault(page_num, []).append(booth_number)
+        
+        for page_num, page_booths in pending_by_page.items():
+            for booth_number, booth_result in self._analyze_page_batch(page_num, page_booths).items():
+                booth_key = self._get_cache_key(booth_number, page_num) + cache_suffix
+                for field, bucket, prefix in (('education', self._education_cache, ''),
+                                              ('company', self._company_cache, 'company_'),
+                                              ('industry', self._industry_cache, 'industry_')):
+                    if field in booth_result and booth_key not in bucket:
+                        bucket[booth_key] = booth_result[field]
+                        self._journal_cache_entry(prefix + booth_key, booth_result[field])
+    
+    def _analyze_booth_all_with_openai_vision(self, booth_number, page_num):
+        """Ask for a booth's company, industry and education level in one vision call on its tile"""
+        request_body = self._build_page_batch_request(page_num, [booth_number], tile_booth=booth_number)
+        client = get_openai_client()
+        if not request_body or client is None:
+            return {}
+        
+        try:
+            response = client.chat.completions.create(**request_body, timeout=60)
+            content = response.choices[0].message.content
+        except Exception:
+            return {}
+        
+        return self._parse_page_batch_response(content, [booth_number]).get(booth_number, {})
+    
+    def _process_one_booth_all(self, booth_number, page_num, need_education, need_company, need_industry, cached_company):
+        """Run the missing OpenAI analyses for one booth (called from preload worker threads)"""
+        results = {}
+        pending = {field for field, needed in (('education', need_education), ('company', need_company), ('industry', need_industry)) if needed}
+        # Briefcase colours need vision, but name and industry often come straight from the text layer
+        text_row = self._extract_booth_rows(page_num).get(booth_number)
+        
+        if 'education' in pending:
+            education_level = self._classify_briefcase_color(booth_number, page_num)
+            if education_level:
+                results['education'] = education_level
+                pending.discard('education')
+        
+        if 'company' in pending and text_row:
+            results['company'] = text_row[0]
+            pending.discard('company')
+        
+        if 'industry' in pending:
+            industry = text_row[1] if text_row else self._industry_hints.pop((booth_number, page_num), None)
+            if industry:
+                results['industry'] = industry
+                pending.discard('industry')
+        
+        # Two or more fields left for vision share one combined call on the same image
+        if len(pending) >= 2:
+            combined = self._analyze_booth_all_with_openai_vision(booth_number, page_num)
+            for field in pending & combined.keys():
+                results[field] = combined[field]
+            pending -= combined.keys()
+        
+        # Single-field calls for whatever is still missing
+        if 'education' in pending:
+            results['education'] = self._analyze_with_openai_vision(booth_number, page_num)
+        
+        if 'company' in pending:
+            company_name = self._analyze_company_name_tiered(booth_number, page_num)
+            results['company'] = company_name if company_name and company_name != "Unknown" else "Unknown"
+        
+        if 'industry' in pending:
+            # Use the company name we just extracted for the industry prompt
+            industry = self._analyze_industry_tiered(booth_number, results.get('company', cached_company), page_num)
+            results['industry'] = industry if industry and industry != "Unknown" else "Unknown"
+        
+        return results
+    
     def _load_pdf(self):
         """Load the PDF file"""
+        # Rendered page images are memoized per reader; a reload starts fresh
+        self._page_image_cache = {}
+        self._booth_rows_cache = {}
+        # Whether the briefcase sampler agrees with BRIEFCASE_REFERENCE_BOOTHS (None until checked)
+        self._briefcase_calibrated = None
+        
         try:
             self.reader = PdfReader(str(self.pdf_path))
             self.total_pages = len(self.reader.pages)
+            # Stat the PDF once here instead of once per booth in the cache loops
+            self._pdf_mtime = self._get_pdf_mtime()
         except Exception as e:
             raise Exception(f"Error loading PDF: {str(e)}")
+        
+        # Page text outlives the reader, and is only thrown away when the PDF itself changes
+        text_key = (str(self.pdf_path.resolve()), self._pdf_mtime)
+        if text_key not in _PAGE_TEXT_CACHE:
+            _PAGE_TEXT_CACHE.clear()
+            _PAGE_TEXT_CACHE[text_key] = {}
+        self._page_text_cache = _PAGE_TEXT_CACHE[text_key]
+        
+        # Prefer PyMuPDF for text extraction (much faster than pypdf), fall back to pypdf
+        try:
+            import fitz  # PyMuPDF
+            self._fitz_doc = fitz.open(str(self.pdf_path))
+        except Exception:
+            self._fitz_doc = None
+    
+    def _get_pdf_mtime(self):
+        """Modification time of the PDF from a single stat call, 0 if it is missing"""
+        try:
+            return os.stat(self.pdf_path).st_mtime
+        except OSError:
+            return 0
+    
+    def _invalidate_if_pdf_changed(self):
+        """Reload the PDF if it was modified since it was loaded"""
+        if self._get_pdf_mtime() != self._pdf_mtime:
+            self._load_pdf()
+            self._booth_page_index = self._load_booth_index()
+            return True
+        return False
+    
+    def _load_booth_index(self):
+        """Load the page -> booth numbers index, discarding it if the PDF has changed"""
+        try:
+            if self.booth_index_file.exists():
+                with open(self.booth_index_file, 'r') as f:
+                    index_data = json.load(f)
+                if index_data.get('pdf_mtime') == self._pdf_mtime:
+                    return {int(page): booths for page, booths in index_data.get('pages', {}).items()}
+        except Exception:
+            pass
+        return {}
+    
+    def _save_booth_index(self):
+        """Save the page -> booth numbers index to file"""
+        try:
+            with open(self.booth_index_file, 'w') as f:
+                json.dump({'pdf_mtime': self._pdf_mtime, 'pages': self._booth_page_index}, f, indent=2)
+        except Exception:
+            pass
+    
+    def get_venue_booth_numbers(self, pages):
+        """Get the sorted booth numbers found on the given pages, extracting each page at most once"""
+        booth_numbers = set()
+        index_updated = False
+        
+        for page_num in pages:
+            if page_num not in self._booth_page_index:
+                try:
+                    text = self.get_page_text(page_num)
+                except Exception as e:
+                    print(f"  ⚠️  Warning: Could not extract booths from page {page_num}: {e}")
+                    continue
+                self._booth_page_index[page_num] = sorted(set(BOOTH_NUMBER_PATTERN.findall(text)))
+                index_updated = True
+            booth_numbers.update(self._booth_page_index[page_num])
+        
+        if index_updated:
+            self._save_booth_index()
+        
+        return sorted(booth_numbers)
     
     def get_page_text(self, page_number):
         """Extract text from a specific page (1-indexed)"""
         if page_number < 1 or page_number > self.total_pages:
             raise ValueError(f"Page number must be between 1 and {self.total_pages}")
         
+        if page_number in self._page_text_cache:
+            return self._page_text_cache[page_number]
+        
         try:
-            page = self.reader.pages[page_number - 1]  # Convert to 0-indexed
-            text = page.extract_text()
+            if self._fitz_doc is not None:
+                text = self._fitz_doc.load_page(page_number - 1).get_text("text")  # Convert to 0-indexed
+            else:
+                page = self.reader.pages[page_number - 1]  # Convert to 0-indexed
+                text = page.extract_text()
+            self._page_text_cache[page_number] = text
             return text
         except Exception as e:
             raise Exception(f"Error extracting text from page {page_number}: {str(e)}")
@@ -506,42 +1253,20 @@ class CareerFairPDFReader:
             booth_data = {}
             orphaned_companies = []
             
-            i = 0
-            while i < len(lines):
-                line = lines[i]
-                
+            for i, line in enumerate(lines):
                 # Skip headers and irrelevant lines
-                if any(skip in line.lower() for skip in ['participating employers', 'day 1:', 'day 2:', 'hall', 'level', 'booth company sector']):
-                    i += 1
+                if TABLE_HEADER_PATTERN.search(line):
                     continue
                 
                 # Look for booth numbers and extract company names
-                booth_pattern = r'([A-Z]\d{2,3})'
-                booth_matches = re.findall(booth_pattern, line)
+                booth_matches = BOOTH_NUMBER_PATTERN.findall(line)
                 
                 if booth_matches:
+                    # Extract company name from the line (remove booth numbers and industry keywords in one pass)
+                    company_name = ' '.join(BOOTH_OR_INDUSTRY_PATTERN.sub('', line).split())
+                    
                     # Found booth number(s) in this line
                     for booth in booth_matches:
-                        # Extract company name from the line (remove booth number and industry keywords)
-                        company_name = line
-                        
-                        # Remove booth number
-                        company_name = re.sub(r'[A-Z]\d{2,3}', '', company_name).strip()
-                        
-                        # Remove common industry keywords to isolate company name
-                        industry_keywords = [
-                            'Banking & Finance', 'Technology & IT', 'Consulting',
-                            'Engineering & Manufacturing', 'Energy & Renewables',
-                            'Public Sector', 'Pharmaceutical, Healthcare, Biomedical Sciences',
-                            'Chemicals', 'Education', 'Luxury, Retail & Consumer Goods'
-                        ]
-                        
-                        for keyword in industry_keywords:
-                            company_name = company_name.replace(keyword, '').strip()
-                        
-                        # Clean up extra whitespace
-                        company_name = ' '.join(company_name.split())
-                        
                         if company_name:
                             booth_data[booth] = {
                                 'company': company_name,
@@ -557,14 +1282,11 @@ class CareerFairPDFReader:
                             }
                 
                 # Check for orphaned company names
-                elif (any(indicator in line.lower() for indicator in ['pte', 'ltd', 'inc', 'corp', 'singapore']) 
-                      and len(line) > 5):
+                elif len(line) > 5 and COMPANY_SUFFIX_PATTERN.search(line):
                     orphaned_companies.append({
                         'company': line,
                         'line_number': i
                     })
-                
-                i += 1
             
             # Match orphaned companies to booths without company names
             booths_without_companies = [booth for booth, data in booth_data.items() if not data['company']]
@@ -575,6 +1297,9 @@ class CareerFairPDFReader:
                 if i < len(orphaned_companies):
                     booth_data[booth]['company'] = orphaned_companies[i]['company']
             
+            # One vision call per page answers most uncached booths before the per-booth calls below
+            self._prefill_from_page_batch(booth_data, venue_context)
+            
             # Create final company list with OpenAI parsing for both company name and industry
             for booth, data in booth_data.items():
                 if data['company'] or booth:  # Process all booths, even without parsed company names
@@ -624,21 +1349,7 @@ class CareerFairPDFReader:
     
     def get_venue_companies(self, venue_name):
         """Get companies for a specific venue based on page mappings"""
-        venue_page_mappings = {
-            # Day 1 venues
-            'SRC Hall A': [11, 12],   # Pages after SRC Hall A map (page 10)
-            'SRC Hall B': [14, 15],   # Pages after SRC Hall B map (page 13)
-            'SRC Hall C': [17, 18],   # Pages after SRC Hall C map (page 16)
-            'EA Atrium': [20, 21],    # Pages after EA Atrium map (page 19)
-            
-            # Day 2 venues
-            'SRC Hall A Day 2': [23, 24],   # Pages after SRC Hall A Day 2 map (page 22)
-            'SRC Hall B Day 2': [26, 27],   # Pages after SRC Hall B Day 2 map (page 25)
-            'SRC Hall C Day 2': [29, 30],   # Pages after SRC Hall C Day 2 map (page 28)
-            'EA Atrium Day 2': [32, 33, 34] # Pages after EA Atrium Day 2 map (page 31)
-        }
-        
-        pages = venue_page_mappings.get(venue_name, [])
+        pages = VENUE_PAGES.get(venue_name, ())
         all_companies = []
         
         for page_num in pages:
@@ -653,7 +1364,7 @@ class CareerFairPDFReader:
     
     def analyze_resume_match(self, resume_content, user_preferences=""):
         """Analyze resume and user preferences to find matching companies"""
-        if not OPENAI_AVAILABLE or not openai_client:
+        if not OPENAI_AVAILABLE:
             return []
         
         try:
@@ -666,8 +1377,7 @@ class CareerFairPDFReader:
             
             # Get all companies from all venues using cached data only to avoid API calls
             all_companies = []
-            venues = ['SRC Hall A', 'SRC Hall B', 'SRC Hall C', 'EA Atrium',
-                     'SRC Hall A Day 2', 'SRC Hall B Day 2', 'SRC Hall C Day 2', 'EA Atrium Day 2']
+            venues = ALL_VENUES
             
             for venue in venues:
                 companies = self._get_cached_venue_companies(venue)
@@ -718,7 +1428,10 @@ Respond ONLY with valid JSON:
 }}"""
 
             # Call OpenAI for analysis with optimized settings
-            response = openai_client.chat.completions.create(
+            client = get_openai_client()
+            if client is None:
+                return []
+            response = client.chat.completions.create(
                 model="gpt-4o-mini",  # Use mini for faster/cheaper analysis
                 messages=[
                     {
@@ -779,21 +1492,13 @@ Respond ONLY with valid JSON:
     def extract_text_from_pdf(self, pdf_file):
         """Extract text content from uploaded PDF resume"""
         try:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-                temp_file.write(pdf_file.read())
-                temp_path = temp_file.name
-            
-            # Extract text using PyPDF
-            reader = PdfReader(temp_path)
+            # Read the upload from memory instead of round-tripping it through a temp file
+            reader = PdfReader(io.BytesIO(pdf_file.read()))
             text_content = ""
             
             for page in reader.pages:
                 text_content += page.extract_text() + "\n"
             
-            # Clean up temp file
-            os.unlink(temp_path)
-            
             return text_content.strip()
             
         except Exception as e:
@@ -803,7 +1508,7 @@ Respond ONLY with valid JSON:
     def extract_company_name_with_openai(self, booth_number, venue_context=None):
         """Use OpenAI vision to extract clean company name from PDF layout"""
         
-        if not OPENAI_AVAILABLE or not openai_client:
+        if not OPENAI_AVAILABLE:
             return "Unknown"
         
         try:
@@ -814,43 +1519,50 @@ Respond ONLY with valid JSON:
             
             # Check cache first (use company-specific cache key) - include venue context for Day 2
             cache_suffix = "_day2" if venue_context and "Day 2" in venue_context else ""
-            cache_key = self._get_company_cache_key(booth_number, page_num, cache_suffix)
-            if cache_key in self.vision_cache:
-                cached_result = self.vision_cache[cache_key]
+            cache_key = self._get_cache_key(booth_number, page_num) + cache_suffix
+            if cache_key in self._company_cache:
+                cached_result = self._company_cache[cache_key]
                 return cached_result
             
-            # Analyze with OpenAI vision
-            company_name = self._analyze_company_name_with_openai_vision(booth_number, page_num)
+            # Most rows read cleanly from the PDF text layer; only the rest go to OpenAI vision
+            text_row = self._extract_booth_rows(page_num).get(booth_number)
+            company_name = text_row[0] if text_row else self._analyze_company_name_tiered(booth_number, page_num)
             
             if company_name:
                 # Cache the result
-                self.vision_cache[cache_key] = company_name
-                self._save_cache()
+                self._company_cache[cache_key] = company_name
+                self._journal_cache_entry(f"company_{cache_key}", company_name)
                 return company_name
             else:
                 # Cache "Unknown" result to avoid retrying indefinitely
-                self.vision_cache[cache_key] = "Unknown"
-                self._save_cache()
+                self._company_cache[cache_key] = "Unknown"
+                self._journal_cache_entry(f"company_{cache_key}", "Unknown")
                 return "Unknown"
                 
         except Exception:
             return "Unknown"
 
-    def _analyze_company_name_with_openai_vision(self, booth_number, page_num, max_retries=5):
-        """Use OpenAI vision to analyze company name from PDF layout with exponential backoff"""
+    def _analyze_company_name_tiered(self, booth_number, page_num):
+        """Extract a company name with gpt-4o-mini, escalating to gpt-4o only when mini fails"""
+        company_name = self._analyze_company_name_with_openai_vision(booth_number, page_num, max_retries=2, model="gpt-4o-mini")
+        if company_name and company_name != "Unknown":
+            return company_name
+        return self._analyze_company_name_with_openai_vision(booth_number, page_num, model="gpt-4o")
+    
+    def _analyze_company_name_with_openai_vision(self, booth_number, page_num, max_retries=5, model="gpt-4o-mini"):
+        """Use OpenAI vision to analyze company name from PDF layout with retries"""
         
-        import time
-        import random
+        # Rate limits, timeouts and 5xx errors are retried inside the OpenAI client (honoring
+        # Retry-After); this loop only re-asks when the answer itself is unusable
+        client = get_openai_client()
+        if client is None:
+            return "Unknown"
         
         for attempt in range(max_retries):
             try:
-                # Convert PDF page to optimized image
-                image_data = self._convert_pdf_page_to_image(page_num)
+                # A tile around the booth is enough to read its row and briefcase icon
+                image_data = self._convert_pdf_page_to_image(page_num, booth_number)
                 if not image_data:
-                    if attempt < max_retries - 1:
-                        wait_time = (2 ** attempt) + random.uniform(0, 1)
-                        time.sleep(wait_time)
-                        continue
                     return "Unknown"
                 
                 # Create prompt for company name extraction
@@ -863,13 +1575,13 @@ For example:
 - If you see "Engineering & ManufacturingA15 Siemens", the company name is "Siemens"  
 - If you see "ChemicalsA20 BASF Singapore", the company name is "BASF Singapore"
 
-Look carefully around booth {booth_number} and extract ONLY the company/business name. Ignore industry labels like "Financial Services", "Engineering & Manufacturing", etc.
+Look carefully around booth {booth_number} and extract ONLY the company/business name. Keep industry labels like "Financial Services", "Engineering & Manufacturing", etc. out of the company name, but report the label shown for this booth separately.
 
-Respond with ONLY the clean company name, nothing else."""
+Respond with JSON only: {{"company": "<clean company name>", "industry_prefix": "<industry label, or empty if none>"}}"""
 
                 # Call OpenAI with optimized settings
-                response = openai_client.chat.completions.create(
-                    model="gpt-4o",  # Use full GPT-4o for better text extraction
+                response = client.chat.completions.create(
+                    model=model,  # gpt-4o-mini first; gpt-4o as the fallback tier
                     messages=[
                         {
                             "role": "user",
@@ -881,7 +1593,7 @@ Respond with ONLY the clean company name, nothing else."""
                                 {
                                     "type": "image_url",
                                     "image_url": {
-                                        "url": f"data:image/png;base64,{image_data}",
+                                        "url": f"data:image/jpeg;base64,{image_data}",
                                         "detail": "high"
                                     }
                                 }
@@ -890,28 +1602,27 @@ Respond with ONLY the clean company name, nothing else."""
                     ],
                     max_tokens=100,  # Allow more tokens for company names
                     temperature=0.1,
+                    response_format={"type": "json_object"},
                     timeout=20
                 )
                 
                 # Parse and clean response
-                company_name = response.choices[0].message.content.strip()
+                try:
+                    answer = json.loads(response.choices[0].message.content)
+                except ValueError:
+                    answer = {}
+                company_name = str(answer.get('company') or '').strip()
                 
-                # Basic validation - company name shouldn't be an industry
-                industry_keywords = [
-                    'Banking & Finance', 'Technology & IT', 'Consulting',
-                    'Engineering & Manufacturing', 'Energy & Renewables',
-                    'Public Sector', 'Pharmaceutical, Healthcare, Biomedical Sciences',
-                    'Chemicals', 'Education', 'Luxury, Retail & Consumer Goods',
-                    'Real Estate & Construction', 'Financial Services', 'Banks (Local/Asia)',
-                    'Transport, Maritime', 'Healthcare'
-                ]
+                # Keep the industry label the model already read for determine_industry_with_openai
+                industry = _match_valid_industry(answer.get('industry_prefix'))
+                if industry:
+                    self._industry_hints[(booth_number, page_num)] = industry
                 
-                # If the response is just an industry keyword, retry with exponential backoff
-                if company_name in industry_keywords:
+                # Basic validation - company name shouldn't be an industry
+                # If the response is just an industry keyword, ask again straight away (or give up on the last attempt)
+                if company_name in INDUSTRY_LABEL_SET:
                     if attempt < max_retries - 1:
-                        wait_time = (2 ** attempt) + random.uniform(0, 1)
-                        print(f"Got industry keyword instead of company name for booth {booth_number}, retrying in {wait_time:.1f}s")
-                        time.sleep(wait_time)
+                        print(f"Got industry keyword instead of company name for booth {booth_number}, retrying")
                         continue
                     return "Unknown"
                 
@@ -919,48 +1630,18 @@ Respond with ONLY the clean company name, nothing else."""
                 if len(company_name) > 2 and company_name.lower() not in ['unknown', 'n/a', 'none']:
                     return company_name
                 
-                # If no valid company name found, retry with exponential backoff
+                # If no valid company name found, ask again straight away (or give up on the last attempt)
                 if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) + random.uniform(0, 1)
-                    print(f"No valid company name found for booth {booth_number}, retrying in {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
+                    print(f"No valid company name found for booth {booth_number}, retrying (attempt {attempt + 1}/{max_retries})")
                     continue
                 else:
                     print(f"Failed to extract company name for booth {booth_number} after {max_retries} attempts")
                     return "Unknown"
                 
             except Exception as e:
-                error_msg = str(e)
-                
-                # Handle rate limiting with longer exponential backoff
-                if "rate_limit_exceeded" in error_msg or "429" in error_msg:
-                    wait_time = (2 ** attempt) * 5 + random.uniform(0, 5)
-                    print(f"Rate limit hit for company extraction booth {booth_number}, waiting {wait_time:.1f}s")
-                    time.sleep(wait_time)
-                    continue
-                
-                # Handle timeout errors with moderate backoff
-                if "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
-                    wait_time = (2 ** attempt) * 2 + random.uniform(0, 2)
-                    print(f"Timeout for company extraction booth {booth_number}, retrying in {wait_time:.1f}s")
-                    time.sleep(wait_time)
-                    continue
-                
-                # Handle other API errors with standard backoff
-                if "api" in error_msg.lower() or "openai" in error_msg.lower():
-                    wait_time = (2 ** attempt) + random.uniform(0, 2)
-                    print(f"API error for company extraction booth {booth_number}: {error_msg}. Retrying in {wait_time:.1f}s")
-                    time.sleep(wait_time)
-                    continue
-                
-                # For unexpected errors, retry with minimal backoff on early attempts
-                if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) + random.uniform(0, 1)
-                    print(f"Unexpected error for company extraction booth {booth_number}: {error_msg}. Retrying in {wait_time:.1f}s")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    print(f"Final attempt failed for company extraction booth {booth_number}: {error_msg}")
+                # The client has already retried transient errors; anything left is not worth re-asking
+                print(f"Company extraction failed for booth {booth_number}: {e}")
+                return "Unknown"
         
         print(f"All retry attempts exhausted for company extraction booth {booth_number}")
         return "Unknown"
@@ -968,7 +1649,7 @@ Respond with ONLY the clean company name, nothing else."""
     def determine_industry_with_openai(self, booth_number, company_name, venue_context=None):
         """Use OpenAI vision to determine industry from PDF table layout with retry logic"""
         
-        if not OPENAI_AVAILABLE or not openai_client:
+        if not OPENAI_AVAILABLE:
             return "Unknown"
         
         try:
@@ -979,40 +1660,48 @@ Respond with ONLY the clean company name, nothing else."""
             
             # Check cache first (use industry-specific cache key) - include venue context for Day 2
             cache_suffix = "_day2" if venue_context and "Day 2" in venue_context else ""
-            cache_key = self._get_industry_cache_key(booth_number, page_num, cache_suffix)
+            cache_key = self._get_cache_key(booth_number, page_num) + cache_suffix
             
-            if cache_key in self.vision_cache:
-                cached_result = self.vision_cache[cache_key]
+            if cache_key in self._industry_cache:
+                cached_result = self._industry_cache[cache_key]
                 return cached_result  # Return cached result, even if "Unknown"
             
-            # Analyze with OpenAI vision using retry logic
-            industry = self._analyze_industry_with_openai_vision(booth_number, company_name, page_num)
+            # Most rows read cleanly from the PDF text layer; only the rest go to OpenAI vision
+            text_row = self._extract_booth_rows(page_num).get(booth_number)
+            industry = text_row[1] if text_row else self._industry_hints.pop((booth_number, page_num), None)
+            if not industry:
+                industry = self._analyze_industry_tiered(booth_number, company_name, page_num)
             
             # Cache the result (even if it's "Unknown" to avoid future API calls)
-            self.vision_cache[cache_key] = industry
-            self._save_cache()
+            self._industry_cache[cache_key] = industry
+            self._journal_cache_entry(f"industry_{cache_key}", industry)
             return industry
                 
         except Exception as e:
             print(f"Error determining industry for booth {booth_number}: {str(e)}")
             return "Unknown"
     
-    def _analyze_industry_with_openai_vision(self, booth_number, company_name, page_num, max_retries=5):
-        """Use OpenAI vision to analyze industry information from PDF layout with exponential backoff"""
+    def _analyze_industry_tiered(self, booth_number, company_name, page_num):
+        """Classify industry with low-detail gpt-4o-mini, escalating to high-detail gpt-4o only when mini fails"""
+        industry = self._analyze_industry_with_openai_vision(booth_number, company_name, page_num, max_retries=2, model="gpt-4o-mini", detail="low")
+        if industry and industry != "Unknown":
+            return industry
+        return self._analyze_industry_with_openai_vision(booth_number, company_name, page_num, model="gpt-4o", detail="high")
+    
+    def _analyze_industry_with_openai_vision(self, booth_number, company_name, page_num, max_retries=5, model="gpt-4o-mini", detail="low"):
+        """Use OpenAI vision to analyze industry information from PDF layout with retries"""
         
-        import time
-        import random
+        # Rate limits, timeouts and 5xx errors are retried inside the OpenAI client (honoring
+        # Retry-After); this loop only re-asks when the answer itself is unusable
+        client = get_openai_client()
+        if client is None:
+            return "Unknown"
         
         for attempt in range(max_retries):
             try:
                 # Convert PDF page to optimized image
                 image_data = self._convert_pdf_page_to_image(page_num)
                 if not image_data:
-                    if attempt < max_retries - 1:
-                        # Wait with exponential backoff for PDF conversion issues
-                        wait_time = (2 ** attempt) + random.uniform(0, 1)
-                        time.sleep(wait_time)
-                        continue
                     return "Unknown"
                 
                 # Create prompt for industry extraction
@@ -1044,8 +1733,8 @@ The industry might be:
 Look carefully at the layout around booth {booth_number} and respond with ONLY the exact industry name from the list above, or "Unknown" if no clear industry is shown."""
 
                 # Call OpenAI with optimized settings - using full GPT-4o for better layout understanding
-                response = openai_client.chat.completions.create(
-                    model="gpt-4o",  # Full GPT-4o for better complex layout parsing
+                response = client.chat.completions.create(
+                    model=model,  # gpt-4o-mini first; gpt-4o as the fallback tier
                     messages=[
                         {
                             "role": "user",
@@ -1057,8 +1746,8 @@ Look carefully at the layout around booth {booth_number} and respond with ONLY t
                                 {
                                     "type": "image_url",
                                     "image_url": {
-                                        "url": f"data:image/png;base64,{image_data}",
-                                        "detail": "high"
+                                        "url": f"data:image/jpeg;base64,{image_data}",
+                                        "detail": detail  # Closed label set, so low detail usually suffices
                                     }
                                 }
                             ]
@@ -1073,67 +1762,22 @@ Look carefully at the layout around booth {booth_number} and respond with ONLY t
                 industry = response.choices[0].message.content.strip()
                 
                 # Validate against known industries (including new categories from page 12)
-                valid_industries = [
-                    'Banking & Finance', 'Technology & IT', 'Consulting',
-                    'Engineering & Manufacturing', 'Energy & Renewables',
-                    'Public Sector', 'Pharmaceutical, Healthcare, Biomedical Sciences',
-                    'Chemicals', 'Education', 'Luxury, Retail & Consumer Goods',
-                    'Real Estate & Construction', 'Financial Services', 'Banks (Local/Asia)',
-                    'Transport, Maritime', 'Healthcare (standalone)'
-                ]
-                
-                # Check for exact matches first
-                for valid_industry in valid_industries:
-                    if valid_industry == industry.strip():
-                        return valid_industry
+                matched_industry = _match_valid_industry(industry)
+                if matched_industry:
+                    return matched_industry
                 
-                # Check for partial matches
-                for valid_industry in valid_industries:
-                    if valid_industry.lower() in industry.lower():
-                        return valid_industry
-                
-                # If no match found, retry with exponential backoff (unless it's the last attempt)
+                # If no match found, ask again (unless it's the last attempt)
                 if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) + random.uniform(0, 1)
-                    print(f"Retrying industry extraction for booth {booth_number} in {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
+                    print(f"Retrying industry extraction for booth {booth_number} (attempt {attempt + 1}/{max_retries})")
                     continue
                 else:
                     print(f"Failed to extract valid industry for booth {booth_number} after {max_retries} attempts")
                     return "Unknown"
                 
             except Exception as e:
-                error_msg = str(e)
-                
-                # Handle rate limiting with longer exponential backoff
-                if "rate_limit_exceeded" in error_msg or "429" in error_msg:
-                    wait_time = (2 ** attempt) * 5 + random.uniform(0, 5)  # 5, 10, 20, 40, 80 seconds + jitter
-                    print(f"Rate limit hit for booth {booth_number}, waiting {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-                    continue
-                
-                # Handle timeout errors with moderate backoff
-                if "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
-                    wait_time = (2 ** attempt) * 2 + random.uniform(0, 2)  # 2, 4, 8, 16, 32 seconds + jitter
-                    print(f"Timeout for booth {booth_number}, retrying in {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-                    continue
-                
-                # Handle other API errors with standard backoff
-                if "api" in error_msg.lower() or "openai" in error_msg.lower():
-                    wait_time = (2 ** attempt) + random.uniform(0, 2)
-                    print(f"API error for booth {booth_number}: {error_msg}. Retrying in {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-                    continue
-                
-                # For unexpected errors, retry with minimal backoff on early attempts
-                if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) + random.uniform(0, 1)
-                    print(f"Unexpected error for booth {booth_number}: {error_msg}. Retrying in {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    print(f"Final attempt failed for booth {booth_number}: {error_msg}")
+                # The client has already retried transient errors; anything left is not worth re-asking
+                print(f"Industry extraction failed for booth {booth_number}: {e}")
+                return "Unknown"
         
         print(f"All retry attempts exhausted for booth {booth_number}")
         return "Unknown"
@@ -1141,7 +1785,7 @@ Look carefully at the layout around booth {booth_number} and respond with ONLY t
     def determine_education_level(self, raw_line, company_name, booth_number=None, venue_context=None):
         """Determine education level using OpenAI vision analysis with caching"""
         
-        if not OPENAI_AVAILABLE or not openai_client:
+        if not OPENAI_AVAILABLE:
             return "Unknown"
         
         try:
@@ -1153,16 +1797,17 @@ Look carefully at the layout around booth {booth_number} and respond with ONLY t
             # Check cache first - include venue context in cache key for Day 2
             cache_suffix = "_day2" if venue_context and "Day 2" in venue_context else ""
             cache_key = self._get_cache_key(booth_number, page_num) + cache_suffix
-            if cache_key in self.vision_cache:
-                return self.vision_cache[cache_key]
+            if cache_key in self._education_cache:
+                return self._education_cache[cache_key]
             
-            # Analyze with OpenAI vision
-            education_level = self._analyze_with_openai_vision(booth_number, page_num)
+            # The briefcase colour is usually readable locally; only unclear icons go to OpenAI vision
+            education_level = (self._classify_briefcase_color(booth_number, page_num)
+                               or self._analyze_with_openai_vision(booth_number, page_num))
             
             if education_level:
                 # Cache the result
-                self.vision_cache[cache_key] = education_level
-                self._save_cache()
+                self._education_cache[cache_key] = education_level
+                self._journal_cache_entry(cache_key, education_level)
                 return education_level
             else:
                 return "Unknown"
@@ -1177,50 +1822,77 @@ Look carefully at the layout around booth {booth_number} and respond with ONLY t
         if not booth_number:
             return None
             
-        # Extract booth number for more precise mapping
-        booth_prefix = booth_number[0]
+        prefix, digits = booth_number[0], booth_number[1:]
+        booth_num = int(digits) if digits.isdigit() else 0
+        is_day2 = bool(venue_context and "Day 2" in venue_context)
+        return _BOOTH_PAGE.get((is_day2, prefix, booth_num <= 22 if prefix == 'A' else None))
+    
+    def _classify_briefcase_color(self, booth_number, page_num):
+        """Classify a booth's briefcase icon by sampling its pixels, or None unless the colour is a clear match
+        
+        Light pink is Undergraduate, dark pink is Both and orange is Postgraduate. Results are cached
+        permanently, so the sampler is only used once it reproduces BRIEFCASE_REFERENCE_BOOTHS.
+        """
+        if self._briefcase_calibrated is None:
+            self._briefcase_calibrated = all(
+                self._sample_briefcase_color(booth, page) == level
+                for (booth, page), level in BRIEFCASE_REFERENCE_BOOTHS.items()
+            )
+            if not self._briefcase_calibrated:
+                print("Briefcase colours do not match the reference booths; using OpenAI vision for education levels")
+        
+        if not self._briefcase_calibrated:
+            return None
+        return self._sample_briefcase_color(booth_number, page_num)
+    
+    def _sample_briefcase_color(self, booth_number, page_num):
+        """Match the briefcase fill right of a booth label against BRIEFCASE_COLOURS"""
         try:
-            booth_num = int(booth_number[1:])
-        except:
-            booth_num = 0
-        
-        # If we have venue context (Day 2), use Day 2 pages
-        if venue_context and "Day 2" in venue_context:
-            # Day 2 booth mappings
-            if booth_prefix == 'A':
-                if booth_num <= 22:
-                    return 23  # A01-A22 on page 23 (Day 2)
-                else:
-                    return 24  # A23+ on page 24 (Day 2)
-            elif booth_prefix == 'B':
-                return 26  # SRC Hall B Day 2
-            elif booth_prefix == 'C':
-                return 29  # SRC Hall C Day 2  
-            elif booth_prefix == 'D':
-                return 32  # EA Atrium Day 2
-        else:
-            # Day 1 booth mappings (default)
-            if booth_prefix == 'A':
-                if booth_num <= 22:
-                    return 11  # A01-A22 on page 11 (Day 1)
-                else:
-                    return 12  # A23-A38 on page 12 (Day 1)
-            elif booth_prefix == 'B':
-                return 14  # SRC Hall B Day 1
-            elif booth_prefix == 'C':
-                return 17  # SRC Hall C Day 1
-            elif booth_prefix == 'D':
-                return 20  # EA Atrium Day 1
+            import fitz  # PyMuPDF
+            
+            with _RENDER_LOCK:
+                if self._fitz_doc is None:
+                    self._fitz_doc = fitz.open(str(self.pdf_path))
+                page = self._fitz_doc[page_num - 1]
+                hits = page.search_for(booth_number)
+                if not hits:
+                    return None
+                label = hits[0]
+                clip = fitz.Rect(label.x1, label.y0 - 2, label.x1 + BRIEFCASE_ICON_WIDTH, label.y1 + 2)
+                pix = page.get_pixmap(matrix=fitz.Matrix(2.0, 2.0), clip=clip, alpha=False)
+            
+            pixels = np.frombuffer(pix.samples, np.uint8).reshape(pix.h, pix.w, pix.n)[..., :3].reshape(-1, 3).astype(np.int16)
+            # The table background is navy (blue-dominant) and the text and rules are near-white,
+            # so the red-dominant pixels are the briefcase fill
+            red = pixels[:, 0]
+            fill = pixels[(red > 100) & (red - pixels[:, 1:].min(axis=1) > 40)]
+            if len(fill) < BRIEFCASE_MIN_PIXELS:
+                return None
+            
+            red, green, blue = fill.mean(axis=0) / 255.0
+            hue, saturation, _ = colorsys.rgb_to_hsv(red, green, blue)
+            hue *= 360
+            
+            for education_level, (hue_low, hue_high), (saturation_low, saturation_high) in BRIEFCASE_COLOURS:
+                if hue_low <= hue <= hue_high and saturation_low <= saturation <= saturation_high:
+                    return education_level
+        except Exception:
+            pass
         
         return None
     
     def _analyze_with_openai_vision(self, booth_number, page_num, max_retries=3):
         """Use OpenAI vision to analyze education level icons with retries"""
         
+        # Transient API errors are retried inside the OpenAI client; this loop only re-asks on unclear answers
+        client = get_openai_client()
+        if client is None:
+            return None
+        
         for attempt in range(max_retries):
             try:
-                # Convert PDF page to optimized image
-                image_data = self._convert_pdf_page_to_image(page_num)
+                # A tile around the booth is enough to read its row and briefcase icon
+                image_data = self._convert_pdf_page_to_image(page_num, booth_number)
                 if not image_data:
                     continue
                 
@@ -1238,7 +1910,7 @@ Compare the briefcase color at booth {booth_number} to nearby booths. Some booth
 What color is the briefcase at booth {booth_number}? Respond with exactly one word: "Undergraduate", "Postgraduate", or "Both"."""
 
                 # Call OpenAI with optimized settings
-                response = openai_client.chat.completions.create(
+                response = client.chat.completions.create(
                     model="gpt-4o-mini",  # Cost-effective vision model
                     messages=[
                         {
@@ -1251,7 +1923,7 @@ What color is the briefcase at booth {booth_number}? Respond with exactly one wo
                                 {
                                     "type": "image_url",
                                     "image_url": {
-                                        "url": f"data:image/png;base64,{image_data}",
+                                        "url": f"data:image/jpeg;base64,{image_data}",
                                         "detail": "high"  # Use high detail for better color analysis
                                     }
                                 }
@@ -1276,78 +1948,173 @@ What color is the briefcase at booth {booth_number}? Respond with exactly one wo
                 if attempt < max_retries - 1:
                     continue
                 
-            except Exception as e:
-                error_msg = str(e)
-                
-                # Handle rate limiting with exponential backoff
-                if "rate_limit_exceeded" in error_msg or "429" in error_msg:
-                    wait_time = (2 ** attempt) * 1  # 1, 2, 4 seconds
-                    time.sleep(wait_time)
-                    continue
-                
-                # For other errors, wait a bit and retry if not the last attempt
-                if attempt < max_retries - 1:
-                    time.sleep(1)
+            except Exception:
+                break
         
         return None
     
-    def _convert_pdf_page_to_image(self, page_num):
-        """Convert PDF page to base64 image with optimization"""
+    def _convert_pdf_page_to_image(self, page_num, booth_number=None):
+        """Convert PDF page to base64 image with optimization
+        
+        With booth_number, only a full-width band around that booth's row is rendered, which
+        costs far fewer image tokens; falls back to the whole page if the booth label is not found.
+        """
+        # Every booth on a page shares the same rendered image
+        cache_key = (page_num, booth_number) if booth_number else page_num
+        if cache_key in self._page_image_cache:
+            return self._page_image_cache[cache_key]
+        
+        # Second tier: pages rendered by an earlier process
+        tile_suffix = f"_{booth_number}" if booth_number else ""
+        disk_path = PAGE_IMAGE_CACHE_DIR / f"{self.pdf_path.stem}_{int(self._pdf_mtime)}_{page_num}{tile_suffix}.jpg"
+        try:
+            if disk_path.exists():
+                base64_image = base64.b64encode(disk_path.read_bytes()).decode('utf-8')
+                self._page_image_cache[cache_key] = base64_image
+                return base64_image
+        except Exception:
+            pass
+        
         try:
             import fitz  # PyMuPDF
             
-            # Open PDF and get page
-            doc = fitz.open(str(self.pdf_path))
-            page = doc[page_num - 1]  # Convert to 0-indexed
-            
-            # Use higher resolution for better color detection
-            mat = fitz.Matrix(3.0, 3.0)  # 3x zoom for better color analysis
-            pix = page.get_pixmap(matrix=mat)
-            
-            # Convert to PNG bytes
-            img_data = pix.tobytes("png")
-            doc.close()
-            
-            # Optimize image size for token efficiency
-            image = Image.open(io.BytesIO(img_data))
+            # PyMuPDF is not thread-safe, and preloading renders from worker threads
+            with _RENDER_LOCK:
+                # Reuse the document opened in _load_pdf instead of re-parsing the PDF per page
+                if self._fitz_doc is None:
+                    self._fitz_doc = fitz.open(str(self.pdf_path))
+                page = self._fitz_doc[page_num - 1]  # Convert to 0-indexed
+                
+                clip = None
+                if booth_number:
+                    hits = page.search_for(booth_number)
+                    if hits:
+                        clip = fitz.Rect(
+                            page.rect.x0, max(page.rect.y0, hits[0].y0 - BOOTH_TILE_MARGIN),
+                            page.rect.x1, min(page.rect.y1, hits[0].y1 + BOOTH_TILE_MARGIN)
+                        )
+                
+                if booth_number and clip is None:
+                    img_bytes = None
+                else:
+                    # Rasterize straight to at most 1200px wide (reduces tokens) and encode
+                    # as JPEG in PyMuPDF, skipping a PNG -> PIL -> resize -> re-encode round-trip
+                    max_width = 1200
+                    scale = min(3.0, max_width / page.rect.width)
+                    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), clip=clip)
+                    img_bytes = pix.tobytes("jpg", jpg_quality=75)
             
-            # Resize if too large (reduce tokens)
-            max_width = 1200
-            if image.width > max_width:
-                ratio = max_width / image.width
-                new_height = int(image.height * ratio)
-                image = image.resize((max_width, new_height), Image.Resampling.LANCZOS)
+            if img_bytes is None:
+                # Booth label not found on the page, send the whole page instead
+                return self._convert_pdf_page_to_image(page_num)
             
-            # Convert back to bytes
-            output = io.BytesIO()
-            image.save(output, format='PNG', optimize=True)
-            img_bytes = output.getvalue()
+            # Write atomically so a concurrent reader never sees a partial image
+            try:
+                disk_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = disk_path.with_name(disk_path.name + '.tmp')
+                temp_path.write_bytes(img_bytes)
+                temp_path.replace(disk_path)
+            except Exception:
+                pass
             
             # Convert to base64
             base64_image = base64.b64encode(img_bytes).decode('utf-8')
             
+            self._page_image_cache[cache_key] = base64_image
             return base64_image
             
         except Exception:
             return None
     
+    def _prerender_pages(self, pages):
+        """Render a set of pages into the image caches in a single pass"""
+        for page_num in pages:
+            self._convert_pdf_page_to_image(page_num)
+    
+    def _extract_booth_rows(self, page_num):
+        """Read {booth_number: (company_name, industry)} for a page from the PDF text layer
+        
+        Results are cached permanently, so only rows that pass _is_clean_text_row are returned;
+        every other booth is left to the vision model.
+        """
+        if page_num in self._booth_rows_cache:
+            return self._booth_rows_cache[page_num]
+        
+        rows = {}
+        try:
+            with _RENDER_LOCK:
+                if self._fitz_doc is None:
+                    import fitz  # PyMuPDF
+                    self._fitz_doc = fitz.open(str(self.pdf_path))
+                blocks = self._fitz_doc[page_num - 1].get_text("dict")["blocks"]
+            
+            lines = []
+            labels = []
+            sector_columns = []
+            for block in blocks:
+                for line in block.get("lines", ()):
+                    texts = []
+                    for span in line["spans"]:
+                        # NFKC folds ligatures such as "ﬁ" into plain letters
+                        text = unicodedata.normalize("NFKC", span["text"]).strip()
+                        if not text:
+                            continue
+                        if BOOTH_NUMBER_PATTERN.fullmatch(text):
+                            labels.append((text, span["bbox"]))
+                        elif text == "Sector":
+                            sector_columns.append(span["bbox"][0])
+                        # Bare numbers are page numbers, not part of a row
+                        elif not text.isdigit():
+                            texts.append(text)
+                    if texts:
+                        lines.append((line["bbox"], ' '.join(texts)))
+            
+            # Company and sector cells are told apart by the table's single Sector column
+            if len(sector_columns) == 1:
+                sector_x = sector_columns[0] - 5
+                labels.sort(key=lambda label: label[1][1])
+                centres = [(bbox[1] + bbox[3]) / 2 for _, bbox in labels]
+                lines.sort(key=lambda line: (line[0][1], line[0][0]))
+                
+                for i, (booth, (x0, y0, x1, y1)) in enumerate(labels):
+                    # A row runs halfway to the neighbouring booth labels, so it never reaches the next row's text
+                    top = (centres[i - 1] + centres[i]) / 2 if i else y0 - (y1 - y0)
+                    bottom = (centres[i] + centres[i + 1]) / 2 if i + 1 < len(labels) else centres[i] + (centres[i] - top)
+                    
+                    company_lines = []
+                    sector_lines = []
+                    for (bx0, by0, _, by1), text in lines:
+                        if bx0 >= x1 and top <= (by0 + by1) / 2 < bottom:
+                            (sector_lines if bx0 >= sector_x else company_lines).append(text)
+                    
+                    company_name = ' '.join(' '.join(company_lines).split())
+                    sector = ' '.join(' '.join(sector_lines).split()).strip(' ,')
+                    industry = PDF_SECTOR_INDUSTRIES.get(sector)
+                    if booth not in rows and self._is_clean_text_row(company_lines, company_name, industry):
+                        rows[booth] = (company_name, industry)
+        except Exception:
+            pass
+        
+        self._booth_rows_cache[page_num] = rows
+        return rows
+    
+    @staticmethod
+    def _is_clean_text_row(company_lines, company_name, industry):
+        """Whether a text-layer row is unambiguous enough to cache instead of asking the vision model"""
+        return bool(
+            industry
+            # A wrapped name cannot be told apart from text spilling in from a neighbouring row
+            and len(company_lines) == 1
+            and 2 < len(company_name) <= 100
+            and company_name not in INDUSTRY_LABEL_SET
+            and not BOOTH_NUMBER_PATTERN.search(company_name)
+            and not SECTOR_LABEL_PATTERN.search(company_name)
+            and not any(word.isdigit() for word in company_name.split())
+        )
+    
     def _get_cached_venue_companies(self, venue_name):
         """Get companies for a specific venue using only cached data (no OpenAI calls)"""
-        venue_page_mappings = {
-            # Day 1 venues
-            'SRC Hall A': [11, 12],   
-            'SRC Hall B': [14, 15],   
-            'SRC Hall C': [17, 18],   
-            'EA Atrium': [20, 21],    
-            
-            # Day 2 venues
-            'SRC Hall A Day 2': [23, 24],   
-            'SRC Hall B Day 2': [26, 27],   
-            'SRC Hall C Day 2': [29, 30],   
-            'EA Atrium Day 2': [32, 33, 34] 
-        }
-        
-        pages = venue_page_mappings.get(venue_name, [])
+        pages = VENUE_PAGES.get(venue_name, ())
         all_companies = []
         
         for page_num in pages:
@@ -1367,13 +2134,10 @@ What color is the briefcase at booth {booth_number}? Respond with exactly one wo
             lines = [line.strip() for line in text.split('\n') if line.strip()]
             companies = []
             
-            # Extract booth numbers from the page
-            booth_numbers = []
+            # Extract unique booth numbers from the page
+            booth_numbers = set()
             for line in lines:
-                booth_matches = re.findall(r'([A-Z]\d{2,3})', line)
-                booth_numbers.extend(booth_matches)
-            
-            booth_numbers = list(set(booth_numbers))
+                booth_numbers.update(BOOTH_NUMBER_PATTERN.findall(line))
             
             # For each booth, get cached data only
             for booth_number in booth_numbers:
@@ -1381,18 +2145,12 @@ What color is the briefcase at booth {booth_number}? Respond with exactly one wo
                 if not page_num:
                     continue
                 
-                # Get cached company name
+                # Company, industry and education buckets share one booth key
                 cache_suffix = "_day2" if venue_context and "Day 2" in venue_context else ""
-                company_cache_key = self._get_company_cache_key(booth_number, page_num, cache_suffix)
-                company_name = self.vision_cache.get(company_cache_key, "Unknown Company")
-                
-                # Get cached industry
-                industry_cache_key = self._get_industry_cache_key(booth_number, page_num, cache_suffix)
-                industry = self.vision_cache.get(industry_cache_key, "Unknown")
-                
-                # Get cached education level
-                education_cache_key = self._get_cache_key(booth_number, page_num) + cache_suffix
-                education_level = self.vision_cache.get(education_cache_key, "Unknown")
+                booth_key = self._get_cache_key(booth_number, page_num) + cache_suffix
+                company_name = self._company_cache.get(booth_key, "Unknown Company")
+                industry = self._industry_cache.get(booth_key, "Unknown")
+                education_level = self._education_cache.get(booth_key, "Unknown")
                 
                 # Get user interaction data
                 user_interaction = self.get_user_interaction(booth_number)
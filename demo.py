@@ -1,13 +1,20 @@
 """
 Demo script to showcase the new modular Career Fair Buddy
 Shows how to use the components programmatically
+
+Run a subset of demos by name, e.g. `python demo.py utilities cache_management`;
+each demo imports only the modules it uses.
 """
+import io
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 
-# Add src to path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+# The demos import the `src` package, so the project root (not src/ itself) must be importable;
+# add it once, even if this module is imported again
+project_root = str(Path(__file__).resolve().parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 def demo_configuration():
     """Demo the configuration system"""
@@ -65,14 +72,12 @@ def demo_cache_management():
     cache.set_industry("A01", 11, "Technology & IT", False)
     cache.set_education_level("A01", 11, "Both", False)
     
-    # Retrieve data
-    company = cache.get_company_name("A01", 11, False)
-    industry = cache.get_industry("A01", 11, False)
-    education = cache.get_education_level("A01", 11, False)
+    # Retrieve all three fields with one lookup of the booth key
+    fields = cache.get_booth_fields("A01", 11, False)
     
-    print(f"🏢 Company: {company}")
-    print(f"🏭 Industry: {industry}")
-    print(f"🎓 Education: {education}")
+    print(f"🏢 Company: {fields['company']}")
+    print(f"🏭 Industry: {fields['industry']}")
+    print(f"🎓 Education: {fields['education']}")
     
     # Get stats
     stats = cache.get_stats()
@@ -86,7 +91,7 @@ def demo_utilities():
     
     from src.utils import (
         extract_booth_numbers, 
-        validate_booth_number,
+        validate_booth_numbers,
         get_venue_from_booth,
         format_file_size
     )
@@ -97,7 +102,7 @@ def demo_utilities():
     print(f"📍 Extracted booths: {booths}")
     
     # Test validation
-    valid_booths = [booth for booth in booths if validate_booth_number(booth)]
+    valid_booths = validate_booth_numbers(booths)
     print(f"✅ Valid booths: {valid_booths}")
     
     # Test venue mapping
@@ -129,9 +134,7 @@ def demo_integration():
         
         # Show full venue names
         for venue in venues[:2]:  # Show first 2
-            full_name = Config.get_full_venue_name(venue, day)
-            clean_name = Config.get_clean_venue_name(full_name)
-            detected_day = Config.get_day_from_venue(full_name)
+            full_name, clean_name, detected_day = Config.resolve_venue(venue, day)
             print(f"    {venue} → '{full_name}' → '{clean_name}' ({detected_day})")
     
     print()
@@ -145,37 +148,60 @@ def demo_integration():
     print(f"  Performance: {'✅ OK' if metrics['performance_ok'] else '⚠️ Warning'}")
     print()
 
+# Demos by command-line name, in the order they run by default
+DEMOS = {
+    "configuration": demo_configuration,
+    "user_management": demo_user_management,
+    "cache_management": demo_cache_management,
+    "utilities": demo_utilities,
+    "integration": demo_integration
+}
+
+RULE = "=" * 50
+
+HEADER = f"""🎯 Career Fair Buddy - Modular Architecture Demo
+{RULE}
+
+"""
+
+FOOTER = f"""{RULE}
+✨ Demo complete! The modular architecture provides:
+   • Clean separation of concerns
+   • Easy testing and debugging
+   • Flexible day-based venue management
+   • Robust user data isolation
+   • Intelligent caching system
+   • Mobile-responsive UI components
+
+🚀 To run the app: streamlit run main.py
+"""
+
 def main():
-    """Run all demos"""
-    print("🎯 Career Fair Buddy - Modular Architecture Demo")
-    print("=" * 50)
-    print()
-    
-    demos = [
-        demo_configuration,
-        demo_user_management,
-        demo_cache_management,
-        demo_utilities,
-        demo_integration
-    ]
-    
-    for demo in demos:
+    """Run the demos named on the command line, or all of them"""
+    sys.stdout.write(HEADER)
+    
+    selected = sys.argv[1:] or list(DEMOS)
+    unknown = [name for name in selected if name not in DEMOS]
+    if unknown:
+        print(f"❌ Unknown demo(s): {', '.join(unknown)}. Choose from: {', '.join(DEMOS)}")
+        return
+    
+    errors = []
+    for name in selected:
+        # Collect each demo's output and write it in one go instead of one write per print
+        output = io.StringIO()
         try:
-            demo()
+            with redirect_stdout(output):
+                DEMOS[name]()
         except Exception as e:
-            print(f"❌ Demo error: {e}")
-            print()
-    
-    print("=" * 50)
-    print("✨ Demo complete! The modular architecture provides:")
-    print("   • Clean separation of concerns")
-    print("   • Easy testing and debugging")
-    print("   • Flexible day-based venue management")
-    print("   • Robust user data isolation")
-    print("   • Intelligent caching system")
-    print("   • Mobile-responsive UI components")
-    print()
-    print("🚀 To run the app: streamlit run main.py")
+            errors.append((name, e))
+        sys.stdout.write(output.getvalue())
+    
+    # Failures are reported together so the successful demos' output stays uninterrupted
+    if errors:
+        sys.stdout.write("".join(f"❌ Demo error in {name}: {e}\n" for name, e in errors) + "\n")
+    
+    sys.stdout.write(FOOTER)
 
 if __name__ == "__main__":
     main()
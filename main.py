@@ -4,6 +4,7 @@ A streamlined, modular version of the original streamlit_app.py
 """
 import streamlit as st
 import sys
+import threading
 from pathlib import Path
 
 # Add src directory to path for imports
@@ -31,6 +32,104 @@ st.set_page_config(
 )
 
 
+# Widest map image sent to the browser
+MAP_IMAGE_MAX_WIDTH = 800
+
+# JPEG quality for map images; the line-art layouts stay legible and the payload is a fraction of a PNG's
+MAP_IMAGE_JPEG_QUALITY = 85
+
+# Reruns the decorated function on its own when its widgets change (st.fragment since Streamlit 1.37,
+# experimental_fragment in 1.33-1.36); older versions rerun the whole app as before
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# PyMuPDF documents are not thread-safe, and Streamlit runs each session on its own thread
+_PDF_RENDER_LOCK = threading.Lock()
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _get_fitz_doc(pdf_path: str, pdf_mtime: float):
+    """Open the PDF once and share the handle across reruns and sessions until the PDF changes"""
+    import fitz  # PyMuPDF
+    return fitz.open(pdf_path)
+
+
+@st.cache_data(show_spinner=False)
+def _render_pdf_page_jpeg(pdf_path: str, pdf_mtime: float, page_number: int, max_width: int) -> bytes:
+    """Render one PDF page as JPEG bytes; cached across reruns and sessions until the PDF changes"""
+    import fitz  # PyMuPDF
+    
+    # Second tier: pages rendered by an earlier process; the mtime in the name orphans stale files
+    disk_path = Config.MAP_IMAGE_CACHE_DIR / f"{Path(pdf_path).stem}_{int(pdf_mtime)}_{page_number}_{max_width}.jpg"
+    if disk_path.exists():
+        return disk_path.read_bytes()
+    
+    doc = _get_fitz_doc(pdf_path, pdf_mtime)
+    with _PDF_RENDER_LOCK:
+        page = doc[page_number - 1]  # Convert to 0-indexed
+        
+        # Render straight at display size: 2x zoom for good quality, capped so the width fits max_width
+        zoom = min(2.0, max_width / page.rect.width)
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        
+        # Convert to JPEG bytes
+        jpeg_bytes = pix.tobytes("jpg", jpg_quality=MAP_IMAGE_JPEG_QUALITY)
+    
+    try:
+        # Written to a temp file and swapped in, so a concurrent reader never sees a partial image
+        disk_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = disk_path.with_name(disk_path.name + '.tmp')
+        temp_path.write_bytes(jpeg_bytes)
+        temp_path.replace(disk_path)
+    except Exception as e:
+        print(f"Warning: Could not cache map page {disk_path.name}: {e}")
+    
+    return jpeg_bytes
+
+
+@st.cache_data(show_spinner=False)
+def _cached_venue_company_data(venue_name: str, pdf_mtime: float, cache_entries: int, _pdf_reader) -> list:
+    """Company data for a venue without user interactions; reparsed only when the PDF or the OpenAI cache changes"""
+    return _pdf_reader.get_venue_company_data(venue_name)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_filtered_company_data(
+    venue_name: str,
+    pdf_mtime: float,
+    cache_entries: int,
+    search_term: str,
+    education_filter: str,
+    _pdf_reader
+) -> list:
+    """Filtered company data for a venue; a rerun that leaves the search and filter unchanged reuses the result"""
+    companies = _cached_venue_company_data(venue_name, pdf_mtime, cache_entries, _pdf_reader)
+    return CareerFairApp.filter_companies(companies, search_term, education_filter)
+
+
+# Interaction field -> widget key prefix for the controls on a company card
+_INTERACTION_WIDGET_PREFIXES = {
+    'visited': 'visited',
+    'resume_shared': 'resume',
+    'interested': 'interested',
+    'applied_online': 'applied',
+    'comments': 'comments'
+}
+
+
+def _queue_card_changes(booth_number: str, widget_keys: dict, saved: dict) -> None:
+    """Card form submit callback: queue the changed fields to be written once at the start of the rerun"""
+    submitted = {field: st.session_state[widget_key] for field, widget_key in widget_keys.items()}
+    # Saving an unchanged card is the common case; one dict comparison settles it
+    if submitted == saved:
+        return
+    
+    st.session_state.setdefault('_pending_writes', []).extend(
+        (booth_number, field, value)
+        for field, value in submitted.items()
+        if value != saved[field]
+    )
+
+
 class CareerFairApp:
     """Main Career Fair Buddy application class"""
     
@@ -39,6 +138,7 @@ class CareerFairApp:
         self.setup_user_id()
         self.mobile_manager = MobileManager()
         self.pdf_reader = None
+        self.cache_stats = None
         
         # Apply custom CSS
         st.markdown(get_custom_css(), unsafe_allow_html=True)
@@ -115,7 +215,8 @@ class CareerFairApp:
         
         if st.button("Export My Data", help="Download your interaction data as CSV"):
             if self.pdf_reader:
-                csv_data = self.pdf_reader.export_user_data()
+                # Built from the reader's chunked export; download_button needs the whole payload up front
+                csv_data = b"".join(self.pdf_reader.iter_export_user_data_chunks())
                 
                 st.download_button(
                     label="Download CSV",
@@ -140,11 +241,11 @@ class CareerFairApp:
             # Initialize with user ID
             self.pdf_reader = CareerFairPDFReader(user_id=st.session_state.user_id)
             
-            # Display cache stats
-            cache_stats = self.pdf_reader.get_cache_stats()
+            # Display cache stats (kept for the rest of this rerun)
+            self.cache_stats = self.pdf_reader.get_cache_stats()
             st.sidebar.write("### 💾 Cache Status")
-            st.sidebar.write(f"**Entries:** {cache_stats['total_entries']}")
-            st.sidebar.write(f"**Size:** {cache_stats['file_size_formatted']}")
+            st.sidebar.write(f"**Entries:** {self.cache_stats['total_entries']}")
+            st.sidebar.write(f"**Size:** {self.cache_stats['file_size_formatted']}")
             
         except FileNotFoundError as e:
             st.error(f"📄 PDF file not found: {e}")
@@ -158,20 +259,38 @@ class CareerFairApp:
             return
         
         try:
+            # Parsed company data is shared across reruns; interactions are always read fresh
+            companies_key = (
+                venue_name,
+                self.pdf_reader.pdf_path.stat().st_mtime,
+                self.cache_stats['total_entries']
+            )
             with st.spinner(f"Loading companies for {venue_name}..."):
-                companies = self.pdf_reader.get_venue_companies(venue_name)
+                companies = _cached_venue_company_data(*companies_key, self.pdf_reader)
             
             if not companies:
                 st.warning(f"No companies found for {venue_name}")
                 return
             
             # Get day and clean venue name for display
-            day = Config.get_day_from_venue(venue_name)
-            clean_venue = Config.get_clean_venue_name(venue_name)
+            day, clean_venue = Config.split_venue_name(venue_name)
             
             st.write(f"### 🏢 Companies in {clean_venue}")
             st.write(f"**{day}** • Found **{len(companies)}** companies")
             
+            self.display_company_browser(companies_key, len(companies))
+            
+        except Exception as e:
+            st.error(f"Error loading companies: {e}")
+    
+    @_fragment
+    def display_company_browser(self, companies_key: tuple, total_companies: int):
+        """Search, filter and company cards for a venue; typing a search or saving a card reruns only this part"""
+        venue_name = companies_key[0]
+        try:
+            # A fragment rerun skips run() and main(), so apply and save queued card changes here as well
+            self.apply_pending_writes()
+            
             # Search and filter
             search_col, filter_col = st.columns([2, 1])
             
@@ -189,20 +308,25 @@ class CareerFairApp:
                     key=f"education_filter_{venue_name}"
                 )
             
-            # Filter companies
-            filtered_companies = self.filter_companies(companies, search_term, education_filter)
+            # Filter companies, then attach interactions to just the ones shown
+            filtered_companies = self.pdf_reader.attach_user_interactions(
+                _cached_filtered_company_data(*companies_key, search_term, education_filter, self.pdf_reader)
+            )
             
             # Show filter results
-            if len(filtered_companies) != len(companies):
-                st.info(f"Showing {len(filtered_companies)} of {len(companies)} companies")
+            if len(filtered_companies) != total_companies:
+                st.info(f"Showing {len(filtered_companies)} of {total_companies} companies")
             
             # Display companies
             self.display_company_list(filtered_companies, venue_name)
             
         except Exception as e:
             st.error(f"Error loading companies: {e}")
+        finally:
+            self.pdf_reader.flush()
     
-    def filter_companies(self, companies: list, search_term: str, education_filter: str = "All") -> list:
+    @staticmethod
+    def filter_companies(companies: list, search_term: str, education_filter: str = "All") -> list:
         """Filter companies based on search term and education level"""
         filtered = companies
         
@@ -211,9 +335,7 @@ class CareerFairApp:
             search_lower = search_term.lower()
             filtered = [
                 company for company in filtered
-                if (search_lower in company['name'].lower() or
-                    search_lower in company['industry'].lower() or
-                    search_lower in company['booth_number'].lower())
+                if search_lower in company['_search_blob']
             ]
         
         # Apply education filter
@@ -279,7 +401,7 @@ class CareerFairApp:
             else:
                 company_display = f'🏢 {company["name"]}'
             
-            # Company header with consistent layout
+            # Company header and details in one block, so the static part of a card is a single element
             st.markdown(f"""
             <div style="
                 background: #f8f9fa;
@@ -291,81 +413,81 @@ class CareerFairApp:
                 <h4 style="margin: 0; color: #495057;">{company_display}</h4>
                 <p style="margin: 0; color: #6c757d;">📍 Booth {company['booth_number']}</p>
             </div>
+            <div style="display: flex; flex-wrap: wrap; margin-bottom: 0.5rem;">
+                <div style="flex: 1 1 50%;"><b>🎓 Education:</b> {company['education_level']}</div>
+                <div style="flex: 1 1 50%;"><b>🏭 Industry:</b> {company['industry']}</div>
+            </div>
             """, unsafe_allow_html=True)
             
-            # Company details in consistent format
-            detail_col1, detail_col2 = st.columns(2)
-            with detail_col1:
-                st.markdown(f"**🎓 Education:** {company['education_level']}")
-            with detail_col2:
-                st.markdown(f"**🏭 Industry:** {company['industry']}")
-            
-            # Interaction checkboxes in consistent grid
-            st.markdown("**Track Your Interactions:**")
-            
             booth_number = company['booth_number']
             # Create unique keys by including venue name
             venue_key = venue_name.replace(" ", "_").replace("-", "_")
             unique_key_base = f"{booth_number}_{venue_key}"
             
-            # First row of interactions
-            inter_col1, inter_col2 = st.columns(2)
+            widget_keys = {
+                field: f"{prefix}_{unique_key_base}"
+                for field, prefix in _INTERACTION_WIDGET_PREFIXES.items()
+            }
             
-            with inter_col1:
-                visited = st.checkbox(
-                    "✅ Visited", 
-                    value=company['visited'],
-                    key=f"visited_{unique_key_base}"
-                )
+            # Interaction widgets in a form: toggling them does not rerun the app, saving does once
+            with st.form(f"card_{unique_key_base}", clear_on_submit=False):
+                st.markdown("**Track Your Interactions:**")
                 
-                resume_shared = st.checkbox(
-                    "📄 Resume Shared", 
-                    value=company['resume_shared'],
-                    key=f"resume_{unique_key_base}"
-                )
-            
-            with inter_col2:
-                interested = st.checkbox(
-                    "⭐ Interested", 
-                    value=company['interested'],
-                    key=f"interested_{unique_key_base}"
-                )
+                # First row of interactions
+                inter_col1, inter_col2 = st.columns(2)
                 
-                applied_online = st.checkbox(
-                    "🌐 Applied Online",
-                    value=company['applied_online'],
-                    key=f"applied_{unique_key_base}"
+                with inter_col1:
+                    st.checkbox(
+                        "✅ Visited", 
+                        value=company['visited'],
+                        key=widget_keys['visited']
+                    )
+                    
+                    st.checkbox(
+                        "📄 Resume Shared", 
+                        value=company['resume_shared'],
+                        key=widget_keys['resume_shared']
+                    )
+                
+                with inter_col2:
+                    st.checkbox(
+                        "⭐ Interested", 
+                        value=company['interested'],
+                        key=widget_keys['interested']
+                    )
+                    
+                    st.checkbox(
+                        "🌐 Applied Online",
+                        value=company['applied_online'],
+                        key=widget_keys['applied_online']
+                    )
+                
+                # Comments section with consistent height
+                st.text_area(
+                    "💭 Notes & Comments",
+                    value=company['comments'],
+                    key=widget_keys['comments'],
+                    height=80,
+                    placeholder="Add your notes about this company..."
                 )
-            
-            # Comments section with consistent height
-            comments = st.text_area(
-                "💭 Notes & Comments",
-                value=company['comments'],
-                key=f"comments_{unique_key_base}",
-                height=80,
-                placeholder="Add your notes about this company..."
-            )
-            
-            # Update data if changed
-            if (visited != company['visited'] or 
-                interested != company['interested'] or
-                resume_shared != company['resume_shared'] or
-                applied_online != company['applied_online'] or
-                comments != company['comments']):
                 
-                self.pdf_reader.update_user_interaction(
-                    booth_number,
-                    visited=visited,
-                    interested=interested,
-                    resume_shared=resume_shared,
-                    applied_online=applied_online,
-                    comments=comments
+                # Changed fields are queued here and saved by apply_pending_writes() on the rerun
+                saved = {field: company[field] for field in widget_keys}
+                st.form_submit_button(
+                    "💾 Save",
+                    on_click=_queue_card_changes,
+                    args=(booth_number, widget_keys, saved)
                 )
-                # Data automatically saved
         
         # Consistent spacing between cards
         st.markdown("---")
     
+    def apply_pending_writes(self):
+        """Apply the queued (booth_number, field, value) interaction changes in one batch"""
+        rows = st.session_state.pop('_pending_writes', None)
+        if rows:
+            self.pdf_reader.bulk_update_interactions(rows)
+    
     def display_resume_matcher(self):
         """Display resume matching functionality"""
         st.write("### 🎯 Resume Matcher")
@@ -404,9 +526,12 @@ class CareerFairApp:
                 if matches:
                     st.write(f"### 🎯 Top {len(matches)} Matches")
                     
+                    # Resolve each match's (day, clean venue) once for the grouping and the cards
+                    match_venues = [Config.split_venue_name(m.get('venue', 'Unknown')) for m in matches]
+                    
                     # Group matches by day
-                    day1_matches = [m for m in matches if "Day 2" not in m.get('venue', '')]
-                    day2_matches = [m for m in matches if "Day 2" in m.get('venue', '')]
+                    day1_matches = [m for m, (day, _) in zip(matches, match_venues) if day == "Day 1"]
+                    day2_matches = [m for m, (day, _) in zip(matches, match_venues) if day == "Day 2"]
                     
                     # Display day summary
                     if day1_matches and day2_matches:
@@ -416,11 +541,7 @@ class CareerFairApp:
                         with col2:
                             st.info(f"📅 **Day 2**: {len(day2_matches)} matches")
                     
-                    for i, match in enumerate(matches, 1):
-                        # Determine day for display
-                        day = Config.get_day_from_venue(match.get('venue', ''))
-                        clean_venue = Config.get_clean_venue_name(match.get('venue', 'Unknown'))
-                        
+                    for i, (match, (day, clean_venue)) in enumerate(zip(matches, match_venues), 1):
                         with st.expander(f"{i}. {match['name']} - {match.get('match_percentage', 0)}% match ({day})"):
                             col1, col2 = st.columns([2, 1])
                             
@@ -446,35 +567,11 @@ class CareerFairApp:
                     st.warning("No suitable matches found. Try adjusting your preferences or upload a different resume.")
     
     def convert_pdf_page_to_image(self, page_number: int):
-        """Convert PDF page to image for display"""
+        """Convert PDF page to JPEG image bytes for display"""
         try:
-            import fitz  # PyMuPDF
-            import io
-            from PIL import Image
-            
-            # Open PDF and get page
-            doc = fitz.open(str(Config.PDF_FILE_PATH))
-            page = doc[page_number - 1]  # Convert to 0-indexed
-            
-            # Use appropriate resolution for display
-            mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for good quality
-            pix = page.get_pixmap(matrix=mat)
-            
-            # Convert to PNG bytes
-            img_data = pix.tobytes("png")
-            doc.close()
-            
-            # Convert to PIL Image
-            image = Image.open(io.BytesIO(img_data))
-            
-            # Optimize size for web display
-            max_width = 800
-            if image.width > max_width:
-                ratio = max_width / image.width
-                new_height = int(image.height * ratio)
-                image = image.resize((max_width, new_height), Image.Resampling.LANCZOS)
-            
-            return image
+            # Keyed on the PDF's mtime so an updated guide is re-rendered
+            pdf_mtime = Config.PDF_FILE_PATH.stat().st_mtime
+            return _render_pdf_page_jpeg(str(Config.PDF_FILE_PATH), pdf_mtime, page_number, MAP_IMAGE_MAX_WIDTH)
             
         except Exception as e:
             st.error(f"Error converting PDF page {page_number}: {e}")
@@ -543,6 +640,9 @@ class CareerFairApp:
             st.error("Please check configuration and try refreshing the page.")
             return
         
+        # Write the interaction changes queued by widget callbacks before any card reads them
+        self.apply_pending_writes()
+        
         # Main navigation
         tab1, tab2, tab3 = st.tabs(["🏢 Companies", "🎯 Resume Matcher", "🗺️ Maps"])
         
@@ -659,12 +759,17 @@ class CareerFairApp:
 
 def main():
     """Main entry point"""
+    app = None
     try:
         app = CareerFairApp()
         app.run()
     except Exception as e:
         st.error(f"Application error: {e}")
         st.write("Please refresh the page and try again.")
+    finally:
+        # The next script run loads interactions from disk, so write this run's changes now
+        if app is not None and app.pdf_reader is not None:
+            app.pdf_reader.flush()
 
 
 if __name__ == "__main__":
@@ -3,34 +3,122 @@ Cache management for OpenAI API responses
 Handles caching, loading, and saving of vision analysis results
 """
 import json
+import os
+import sqlite3
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 from .config import Config
 from .utils import get_cache_key, format_file_size
 
+# Use orjson for the full JSON cache file when installed (several times faster than stdlib json)
+try:
+    import orjson
+    
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
 
 class CacheManager:
     """Manages OpenAI vision cache for faster loading and reduced API calls"""
     
-    def __init__(self, cache_file: Optional[Path] = None):
+    ENTRY_TYPES = ('education', 'company', 'industry', 'website', 'other')
+    
+    def __init__(self, cache_file: Optional[Path] = None, db_file: Optional[Path] = None):
         self.cache_file = cache_file or Path(Config.OPENAI_CACHE_FILE)
+        self.db_file = db_file or Path(Config.OPENAI_CACHE_DB)
+        # OpenAIService may write results from several worker threads at once
+        self._lock = threading.RLock()
+        self._dirty_keys = set()
+        self._db = self._open_db()
         self.cache: Dict[str, Any] = self._load_cache()
+        # Per-type entry counts, kept current by set() so get_stats() never scans the cache
+        self._entry_counts = dict.fromkeys(self.ENTRY_TYPES, 0)
+        for key in self.cache:
+            self._entry_counts[self._entry_type(key)] += 1
+    
+    @staticmethod
+    def _entry_type(key: str) -> str:
+        """Classify a cache key by its prefix"""
+        if key.startswith('industry_'):
+            return 'industry'
+        if key.startswith('company_'):
+            return 'company'
+        if key.startswith('website_'):
+            return 'website'
+        if key.startswith('content_') or '_' not in key:
+            return 'other'
+        return 'education'
+    
+    def _open_db(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite store that receives incremental cache writes"""
+        try:
+            db = sqlite3.connect(str(self.db_file), check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            # WAL stays consistent without an fsync per commit; only a power loss can drop the last saves
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("CREATE TABLE IF NOT EXISTS cache (k TEXT PRIMARY KEY, v TEXT)")
+            db.commit()
+            return db
+        except Exception as e:
+            print(f"Warning: Could not open cache database, falling back to JSON only: {e}")
+            return None
     
     def _load_cache(self) -> Dict[str, Any]:
-        """Load cache from file"""
+        """Load cache from the JSON file, then apply newer entries from the database"""
+        cache = {}
         try:
             if self.cache_file.exists():
-                with open(self.cache_file, 'r') as f:
-                    return json.load(f)
+                cache = _json_loads(self.cache_file.read_bytes())
         except Exception as e:
             print(f"Warning: Could not load cache file: {e}")
-        return {}
+        
+        if self._db is not None:
+            try:
+                for key, value in self._db.execute("SELECT k, v FROM cache"):
+                    cache[key] = json.loads(value)
+            except Exception as e:
+                print(f"Warning: Could not read cache database: {e}")
+        return cache
     
     def save_cache(self) -> bool:
-        """Save cache to file"""
+        """Persist entries changed since the last save
+        
+        Only the changed rows are upserted into SQLite, so saving after every result stays cheap;
+        the shared JSON file is rewritten by export_json().
+        """
+        if self._db is None:
+            return self.export_json()
+        
+        try:
+            with self._lock:
+                if not self._dirty_keys:
+                    return True
+                rows = [(key, json.dumps(self.cache[key])) for key in self._dirty_keys if key in self.cache]
+                self._db.executemany("INSERT OR REPLACE INTO cache (k, v) VALUES (?, ?)", rows)
+                self._db.commit()
+                self._dirty_keys.clear()
+            return True
+        except Exception as e:
+            print(f"Error: Could not save cache database: {e}")
+            return False
+    
+    def export_json(self) -> bool:
+        """Write the full cache to the JSON file shared with the legacy app and deployments"""
         try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.cache, f, indent=2)
+            with self._lock:
+                temp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+                temp_file.write_bytes(_json_dumps(self.cache))
+                os.replace(temp_file, self.cache_file)
             return True
         except Exception as e:
             print(f"Error: Could not save cache file: {e}")
@@ -42,7 +130,11 @@ class CacheManager:
     
     def set(self, key: str, value: Any) -> None:
         """Set value in cache"""
-        self.cache[key] = value
+        with self._lock:
+            if key not in self.cache:
+                self._entry_counts[self._entry_type(key)] += 1
+            self.cache[key] = value
+            self._dirty_keys.add(key)
     
     def has(self, key: str) -> bool:
         """Check if key exists in cache"""
@@ -50,9 +142,15 @@ class CacheManager:
     
     def clear(self) -> None:
         """Clear all cache"""
-        self.cache = {}
-        if self.cache_file.exists():
-            self.cache_file.unlink()
+        with self._lock:
+            self.cache = {}
+            self._entry_counts = dict.fromkeys(self.ENTRY_TYPES, 0)
+            self._dirty_keys.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM cache")
+                self._db.commit()
+            if self.cache_file.exists():
+                self.cache_file.unlink()
     
     def get_education_key(self, booth_number: str, page_num: int, is_day2: bool = False) -> str:
         """Get cache key for education level"""
@@ -74,6 +172,35 @@ class CacheManager:
         suffix = "_day2" if is_day2 else ""
         return f"website_{get_cache_key(booth_number, page_num, suffix)}"
     
+    def get_content_key(self, image_hash: str, booth_number: str) -> str:
+        """Get cache key for a booth analysis addressed by the rendered page's content hash"""
+        return f"content_{image_hash}_{booth_number}"
+    
+    def get_booth_analysis(self, image_hash: str, booth_number: str) -> Optional[Dict[str, Any]]:
+        """Get the cached {company, industry, education} analysis for a booth on an identical page render"""
+        return self.get(self.get_content_key(image_hash, booth_number))
+    
+    def set_booth_analysis(self, image_hash: str, booth_number: str, analysis: Dict[str, Any]) -> None:
+        """Cache a booth analysis under the rendered page's content hash"""
+        self.set(self.get_content_key(image_hash, booth_number), analysis)
+    
+    def get_booth_fields(self, booth_number: str, page_num: int, is_day2: bool = False) -> Dict[str, Optional[str]]:
+        """Get cached company, industry and education for a booth, formatting the booth key only once"""
+        base_key = get_cache_key(booth_number, page_num, "_day2" if is_day2 else "")
+        return {
+            'company': self.cache.get("company_" + base_key),
+            'industry': self.cache.get("industry_" + base_key),
+            'education': self.cache.get(base_key)
+        }
+    
+    def set_booth_fields(self, booth_number: str, page_num: int, fields: Dict[str, str], is_day2: bool = False) -> None:
+        """Cache any of company, industry and education for a booth in one locked update"""
+        base_key = get_cache_key(booth_number, page_num, "_day2" if is_day2 else "")
+        keys = {'company': "company_" + base_key, 'industry': "industry_" + base_key, 'education': base_key}
+        with self._lock:
+            for field, value in fields.items():
+                self.set(keys[field], value)
+    
     def get_education_level(self, booth_number: str, page_num: int, is_day2: bool = False) -> Optional[str]:
         """Get cached education level"""
         key = self.get_education_key(booth_number, page_num, is_day2)
@@ -116,36 +243,22 @@ class CacheManager:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get comprehensive cache statistics"""
-        education_entries = 0
-        company_entries = 0
-        industry_entries = 0
-        website_entries = 0
-        other_entries = 0
-        
-        for key in self.cache.keys():
-            if key.startswith('industry_'):
-                industry_entries += 1
-            elif key.startswith('company_'):
-                company_entries += 1
-            elif key.startswith('website_'):
-                website_entries += 1
-            elif '_' in key and not key.startswith(('industry_', 'company_', 'website_')):
-                education_entries += 1
-            else:
-                other_entries += 1
-        
-        file_size = 0
-        if self.cache_file.exists():
+        # One stat call answers both whether the file exists and how big it is
+        try:
             file_size = self.cache_file.stat().st_size
+            file_exists = True
+        except OSError:
+            file_size = 0
+            file_exists = False
         
         return {
             'total_entries': len(self.cache),
-            'education_entries': education_entries,
-            'company_entries': company_entries,
-            'industry_entries': industry_entries,
-            'website_entries': website_entries,
-            'other_entries': other_entries,
-            'file_exists': self.cache_file.exists(),
+            'education_entries': self._entry_counts['education'],
+            'company_entries': self._entry_counts['company'],
+            'industry_entries': self._entry_counts['industry'],
+            'website_entries': self._entry_counts['website'],
+            'other_entries': self._entry_counts['other'],
+            'file_exists': file_exists,
             'file_path': str(self.cache_file),
             'file_size_bytes': file_size,
             'file_size_formatted': format_file_size(file_size)
@@ -158,7 +271,7 @@ class CacheManager:
         if venue_name:
             venues = [venue_name]
         else:
-            venues = list(Config.VENUE_PAGE_MAPPINGS.keys())
+            venues = Config.ALL_VENUES
         
         total_booths = 0
         cached_education = 0
@@ -190,11 +303,12 @@ class CacheManager:
                     continue
                 
                 # Check cache status
-                if self.get_education_level(booth_number, page_num, is_day2):
+                fields = self.get_booth_fields(booth_number, page_num, is_day2)
+                if fields['education']:
                     cached_education += 1
-                if self.get_company_name(booth_number, page_num, is_day2):
+                if fields['company']:
                     cached_companies += 1
-                if self.get_industry(booth_number, page_num, is_day2):
+                if fields['industry']:
                     cached_industries += 1
         
         if total_booths == 0:
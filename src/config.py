@@ -3,7 +3,14 @@ Configuration settings for Career Fair Buddy
 Centralizes all configuration and environment variables
 """
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+
+_NO_VENUES: Mapping[str, tuple] = MappingProxyType({})
 
 
 class Config:
@@ -19,7 +26,12 @@ class Config:
     
     # Cache files
     OPENAI_CACHE_FILE = "openai_vision_cache.json"
+    OPENAI_CACHE_DB = "openai_vision_cache.db"  # Incremental store layered over the JSON cache
+    PAGE_IMAGE_CACHE_DIR = Path(".cache") / "pages"  # Rendered PDF pages (JPEG) sent to the vision API
+    MAP_IMAGE_CACHE_DIR = Path(".cache") / "maps"  # Rendered venue map pages (JPEG) shown in the app
+    BOOTH_INDEX_FILE = "booth_index.json"  # Page -> booth numbers, shared with the legacy app
     USER_DATA_PREFIX = "user_interactions_"
+    USER_DATA_SAVE_DELAY = 2.0  # Seconds interaction updates are coalesced before being written
     
     # OpenAI configuration
     OPENAI_API_KEY = None
@@ -27,41 +39,46 @@ class Config:
     OPENAI_MODEL_MINI = "gpt-4o-mini"
     OPENAI_MAX_RETRIES = 5
     OPENAI_TIMEOUT = 20
+    OPENAI_MAX_CONCURRENT_REQUESTS = 8  # Parallel vision calls when parsing a page
+    OPENAI_MAX_CONNECTIONS = 32
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS = 16
+    BOOTH_TILE_MARGIN = 60  # PDF points kept above and below a booth row in single-booth images
     
     # System limits and thresholds
     MAX_USERS_WARNING = 20000
     MAX_STORAGE_WARNING_MB = 400
     ACTIVITY_WINDOW_HOURS = 24
+    SYSTEM_METRICS_TTL = 5.0  # Seconds a system metrics scan of the user files is reused
     
-    # Venue mappings organized by day
-    VENUE_PAGE_MAPPINGS = {
+    # Venue mappings organized by day (read-only, since the venue helpers below hand out shared references)
+    VENUE_PAGE_MAPPINGS = MappingProxyType({
         # Day 1 venues
-        'SRC Hall A': [11, 12],
-        'SRC Hall B': [14, 15], 
-        'SRC Hall C': [17, 18],
-        'EA Atrium': [20, 21],
+        'SRC Hall A': (11, 12),
+        'SRC Hall B': (14, 15), 
+        'SRC Hall C': (17, 18),
+        'EA Atrium': (20, 21),
         # Day 2 venues
-        'SRC Hall A Day 2': [23, 24],
-        'SRC Hall B Day 2': [26, 27],
-        'SRC Hall C Day 2': [29, 30],
-        'EA Atrium Day 2': [32, 33, 34]
-    }
+        'SRC Hall A Day 2': (23, 24),
+        'SRC Hall B Day 2': (26, 27),
+        'SRC Hall C Day 2': (29, 30),
+        'EA Atrium Day 2': (32, 33, 34)
+    })
     
     # Day-based organization for easier navigation
-    DAY_VENUES = {
-        'Day 1': {
-            'SRC Hall A': [11, 12],
-            'SRC Hall B': [14, 15], 
-            'SRC Hall C': [17, 18],
-            'EA Atrium': [20, 21]
-        },
-        'Day 2': {
-            'SRC Hall A': [23, 24],
-            'SRC Hall B': [26, 27],
-            'SRC Hall C': [29, 30],
-            'EA Atrium': [32, 33, 34]
-        }
-    }
+    DAY_VENUES = MappingProxyType({
+        'Day 1': MappingProxyType({
+            'SRC Hall A': (11, 12),
+            'SRC Hall B': (14, 15), 
+            'SRC Hall C': (17, 18),
+            'EA Atrium': (20, 21)
+        }),
+        'Day 2': MappingProxyType({
+            'SRC Hall A': (23, 24),
+            'SRC Hall B': (26, 27),
+            'SRC Hall C': (29, 30),
+            'EA Atrium': (32, 33, 34)
+        })
+    })
     
     # All venues list for backward compatibility
     ALL_VENUES = list(VENUE_PAGE_MAPPINGS.keys())
@@ -75,6 +92,10 @@ class Config:
         'Real Estate & Construction', 'Financial Services', 'Banks (Local/Asia)',
         'Transport, Maritime', 'Healthcare'
     ]
+    VALID_INDUSTRY_SET = frozenset(VALID_INDUSTRIES)
+    # One case-insensitive scan finds an industry anywhere in a model answer
+    VALID_INDUSTRY_PATTERN = re.compile('|'.join(re.escape(industry) for industry in VALID_INDUSTRIES), re.IGNORECASE)
+    VALID_INDUSTRY_BY_LOWER = {industry.lower(): industry for industry in VALID_INDUSTRIES}
     
     # Education levels
     EDUCATION_LEVELS = ["Undergraduate", "Postgraduate", "Both"]
@@ -130,29 +151,61 @@ class Config:
         
         return issues
     
-    @classmethod
-    def get_venues_for_day(cls, day: str) -> dict:
+    @staticmethod
+    def get_venues_for_day(day: str) -> Mapping[str, tuple]:
         """Get venues for a specific day"""
-        return cls.DAY_VENUES.get(day, {})
+        return Config.DAY_VENUES.get(day, _NO_VENUES)
     
-    @classmethod
-    def get_day_from_venue(cls, venue_name: str) -> str:
+    # The venue name helpers below are pure functions called on every Streamlit rerun
+    # with the same few arguments, so their results are memoized
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def get_day_from_venue(venue_name: str) -> str:
         """Get day from venue name"""
         if "Day 2" in venue_name:
             return "Day 2"
         return "Day 1"
     
-    @classmethod
-    def get_clean_venue_name(cls, venue_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def get_clean_venue_name(venue_name: str) -> str:
         """Get clean venue name without day suffix"""
         return venue_name.replace(" Day 2", "")
     
-    @classmethod
-    def get_full_venue_name(cls, clean_name: str, day: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def split_venue_name(venue_name: str) -> Tuple[str, str]:
+        """Get (day, clean venue name) for a full venue name in one lookup"""
+        return Config.get_day_from_venue(venue_name), Config.get_clean_venue_name(venue_name)
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def get_full_venue_name(clean_name: str, day: str) -> str:
         """Get full venue name with day suffix"""
         if day == "Day 2":
             return f"{clean_name} Day 2"
         return clean_name
+    
+    @staticmethod
+    def resolve_venue(clean_name: str, day: str) -> Tuple[str, str, str]:
+        """Get (full venue name, clean venue name, day) for a venue on a day"""
+        resolved = _VENUE_RESOLUTION.get((clean_name, day))
+        if resolved is None:
+            resolved = _resolve_venue(clean_name, day)
+        return resolved
+
+
+def _resolve_venue(clean_name: str, day: str) -> Tuple[str, str, str]:
+    full_name = Config.get_full_venue_name(clean_name, day)
+    return full_name, Config.get_clean_venue_name(full_name), Config.get_day_from_venue(full_name)
+
+
+# Every known (venue, day) pair resolved once at import
+_VENUE_RESOLUTION: Mapping[Tuple[str, str], Tuple[str, str, str]] = MappingProxyType({
+    (clean_name, day): _resolve_venue(clean_name, day)
+    for day, venues in Config.DAY_VENUES.items()
+    for clean_name in venues
+})
 
 
 # Initialize configuration
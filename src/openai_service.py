@@ -3,16 +3,47 @@ OpenAI integration service
 Handles all OpenAI API calls for vision analysis with retry logic
 """
 import base64
-import io
+import hashlib
+import json
+import os
 import time
-import random
-from typing import Optional, Dict, Any
-from PIL import Image
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, List
 import fitz  # PyMuPDF
 
 from .config import Config
 from .cache_manager import CacheManager
-from .utils import exponential_backoff_wait, is_valid_education_level, is_valid_industry
+from .utils import is_valid_education_level, is_valid_industry
+
+# PyMuPDF is not thread-safe, so page rendering is serialized across worker threads
+_RENDER_LOCK = threading.Lock()
+
+# One pooled keep-alive client per process, shared by every OpenAIService instance
+_shared_client = None
+_client_lock = threading.Lock()
+
+
+def _get_shared_client():
+    """Create the process-wide OpenAI client on first use"""
+    global _shared_client
+    with _client_lock:
+        if _shared_client is None:
+            import httpx
+            from openai import OpenAI
+            _shared_client = OpenAI(
+                api_key=Config.OPENAI_API_KEY,
+                # Jittered backoff on 429/5xx/timeouts that respects Retry-After headers
+                max_retries=Config.OPENAI_MAX_RETRIES,
+                http_client=httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=Config.OPENAI_MAX_CONNECTIONS,
+                        max_keepalive_connections=Config.OPENAI_MAX_KEEPALIVE_CONNECTIONS
+                    ),
+                    timeout=Config.OPENAI_TIMEOUT * 3
+                )
+            )
+        return _shared_client
 
 
 class OpenAIService:
@@ -21,6 +52,12 @@ class OpenAIService:
     def __init__(self, cache_manager: CacheManager):
         self.cache_manager = cache_manager
         self.client = None
+        # Rendered pages keyed by (pdf_path, page_num, booth tile or None) -> (pdf mtime, base64 JPEG, image hash)
+        self._page_image_cache: Dict[tuple, tuple] = {}
+        # Open PyMuPDF documents keyed by pdf_path -> (pdf mtime, document)
+        self._documents: Dict[str, tuple] = {}
+        # PDF mtimes recorded when the reader loaded each file, so image lookups do not stat it per booth
+        self._pdf_mtimes: Dict[str, float] = {}
         self.available = self._setup_client()
     
     def _setup_client(self) -> bool:
@@ -30,8 +67,7 @@ class OpenAIService:
             return False
         
         try:
-            from openai import OpenAI
-            self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+            self.client = _get_shared_client()
             print("✅ OpenAI client initialized successfully")
             return True
         except ImportError as e:
@@ -90,8 +126,12 @@ class OpenAIService:
         if cached:
             return cached
         
-        # Analyze with OpenAI
-        result = self._analyze_company_with_vision(booth_number, page_num, pdf_path)
+        # Analyze with gpt-4o-mini first and escalate to gpt-4o only when it fails
+        result = self._analyze_company_with_vision(
+            booth_number, page_num, pdf_path, model=Config.OPENAI_MODEL_MINI, max_attempts=2
+        )
+        if not result or result == "Unknown":
+            result = self._analyze_company_with_vision(booth_number, page_num, pdf_path, model=Config.OPENAI_MODEL)
         
         if result and result != "Unknown":
             self.cache_manager.set_company_name(booth_number, page_num, result, is_day2)
@@ -118,8 +158,13 @@ class OpenAIService:
         if cached:
             return cached
         
-        # Analyze with OpenAI
-        result = self._analyze_industry_with_vision(booth_number, company_name, page_num, pdf_path)
+        # Low-detail gpt-4o-mini is enough for a closed label set; escalate to gpt-4o only when it fails
+        result = self._analyze_industry_with_vision(
+            booth_number, company_name, page_num, pdf_path,
+            model=Config.OPENAI_MODEL_MINI, detail="low", max_attempts=2
+        )
+        if not result:
+            result = self._analyze_industry_with_vision(booth_number, company_name, page_num, pdf_path, model=Config.OPENAI_MODEL)
         
         if result and is_valid_industry(result):
             self.cache_manager.set_industry(booth_number, page_num, result, is_day2)
@@ -129,6 +174,162 @@ class OpenAIService:
         self.cache_manager.save_cache()
         return result or "Unknown"
     
+    def analyze_booth(
+        self, 
+        booth_number: str, 
+        page_num: int, 
+        pdf_path: str,
+        is_day2: bool = False
+    ) -> Dict[str, str]:
+        """Get company name, industry and education level for a booth with at most one vision call"""
+        result = self.cache_manager.get_booth_fields(booth_number, page_num, is_day2)
+        
+        missing = [field for field, value in result.items() if not value]
+        if not missing:
+            return result
+        
+        if not self.is_available():
+            return {field: value or "Unknown" for field, value in result.items()}
+        
+        # An identical page render (e.g. the same layout on Day 1 and Day 2) may already have been analyzed
+        image_hash = self._get_page_image_hash(page_num, pdf_path)
+        analysis = self.cache_manager.get_booth_analysis(image_hash, booth_number) if image_hash else None
+        if not analysis:
+            analysis = self._analyze_booth_with_vision(booth_number, page_num, pdf_path) or {}
+            if image_hash and any(analysis.values()):
+                self.cache_manager.set_booth_analysis(image_hash, booth_number, analysis)
+        
+        # Only fill in the fields that were not cached; failures are cached as "Unknown" too
+        for field in missing:
+            result[field] = analysis.get(field) or "Unknown"
+        
+        self.cache_manager.set_booth_fields(booth_number, page_num, {field: result[field] for field in missing}, is_day2)
+        
+        self.cache_manager.save_cache()
+        return result
+    
+    def analyze_page_booths(
+        self, 
+        page_num: int, 
+        booth_numbers: List[str], 
+        pdf_path: str,
+        is_day2: bool = False
+    ) -> int:
+        """Analyze every uncached booth on one page with a single vision call
+        
+        Validated fields are cached; anything the model misses is left for analyze_booth to retry.
+        Returns the number of booths that received at least one field.
+        """
+        if not self.is_available():
+            return 0
+        
+        pending = [
+            booth_number for booth_number in booth_numbers
+            if not all(self.cache_manager.get_booth_fields(booth_number, page_num, is_day2).values())
+        ]
+        if not pending:
+            return 0
+        
+        page_results = self._analyze_page_with_vision(page_num, pending, pdf_path)
+        updated = self._store_page_results(page_num, page_results, is_day2)
+        
+        if updated:
+            self.cache_manager.save_cache()
+        return updated
+    
+    def prewarm_cache_via_batch(
+        self, 
+        page_booths: Dict[Any, List[str]], 
+        pdf_path: str,
+        poll_interval: float = 30.0
+    ) -> int:
+        """Fill the cache for many pages through the OpenAI Batch API (half price, up to 24h turnaround)
+        
+        page_booths maps (page_num, is_day2) to the booth numbers analyzed on that page.
+        Blocks until the batch finishes; returns the number of booths that received data.
+        """
+        if not self.is_available():
+            return 0
+        
+        requests = {}
+        for (page_num, is_day2), booth_numbers in page_booths.items():
+            pending = [
+                booth_number for booth_number in booth_numbers
+                if not all(self.cache_manager.get_booth_fields(booth_number, page_num, is_day2).values())
+            ]
+            if not pending:
+                continue
+            body = self._build_page_request(page_num, pending, pdf_path)
+            if body:
+                custom_id = f"page_{page_num}{'_day2' if is_day2 else ''}"
+                requests[custom_id] = (page_num, is_day2, pending, body)
+        
+        if not requests:
+            print("✅ Cache already complete, no batch needed")
+            return 0
+        
+        try:
+            batch_input = "".join(
+                json.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body
+                }) + "\n"
+                for custom_id, (_, _, _, body) in requests.items()
+            )
+            input_file = self.client.files.create(
+                file=("batch_input.jsonl", batch_input.encode("utf-8")),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            print(f"📦 Submitted batch {batch.id} with {len(requests)} page requests")
+            
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
+            
+            if batch.status != "completed" or not batch.output_file_id:
+                print(f"❌ Batch {batch.id} ended with status {batch.status}")
+                return 0
+            
+            output = self.client.files.content(batch.output_file_id).text
+        except Exception as e:
+            print(f"❌ Batch prewarm failed: {e}")
+            return 0
+        
+        updated = 0
+        for line in output.splitlines():
+            try:
+                result = json.loads(line)
+                page_num, is_day2, booth_numbers, _ = requests[result["custom_id"]]
+                content = result["response"]["body"]["choices"][0]["message"]["content"]
+                page_results = self._parse_page_response(content, booth_numbers)
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue  # Failed request; analyze_booth will retry these booths on demand
+            updated += self._store_page_results(page_num, page_results, is_day2)
+        
+        self.cache_manager.save_cache()
+        print(f"✅ Batch prewarm cached data for {updated} booths")
+        return updated
+    
+    def _store_page_results(self, page_num: int, page_results: Dict[str, Dict[str, Optional[str]]], is_day2: bool) -> int:
+        """Cache validated page analysis fields without overwriting existing entries"""
+        updated = 0
+        for booth_number, analysis in page_results.items():
+            cached = self.cache_manager.get_booth_fields(booth_number, page_num, is_day2)
+            self.cache_manager.set_booth_fields(booth_number, page_num, {
+                field: value for field, value in analysis.items()
+                if value and field in cached and not cached[field]
+            }, is_day2)
+            if any(analysis.values()):
+                updated += 1
+        return updated
+    
     def analyze_company_website(
         self, 
         booth_number: str, 
@@ -277,12 +478,191 @@ class OpenAIService:
         
         return ""
     
+    def _match_education_level(self, text: str) -> Optional[str]:
+        """Map a model response onto one of the known education levels"""
+        for valid_response in Config.EDUCATION_LEVELS:
+            if valid_response.lower() in text.lower():
+                return valid_response
+        return None
+    
+    def _match_industry(self, text: str) -> Optional[str]:
+        """Map a model response onto one of the known industries"""
+        match = Config.VALID_INDUSTRY_PATTERN.search(text)
+        return Config.VALID_INDUSTRY_BY_LOWER[match.group(0).lower()] if match else None
+    
+    def _clean_company_response(self, text: str) -> Optional[str]:
+        """Return the company name from a model response, or None if it is not usable"""
+        company_name = text.strip()
+        
+        # Basic validation - company name shouldn't be an industry
+        if company_name in Config.VALID_INDUSTRY_SET:
+            return None
+        
+        if len(company_name) > 2 and company_name.lower() not in ['unknown', 'n/a', 'none']:
+            return company_name
+        return None
+    
+    def _analyze_booth_with_vision(self, booth_number: str, page_num: int, pdf_path: str) -> Optional[Dict[str, str]]:
+        """Analyze company name, industry and education level in a single vision call with retry logic"""
+        for attempt in range(Config.OPENAI_MAX_RETRIES):
+            try:
+                image_data = self._convert_pdf_page_to_image(page_num, pdf_path)
+                if not image_data:
+                    continue
+                
+                industry_list = "\n- ".join(Config.VALID_INDUSTRIES)
+                prompt = f"""Look carefully at this career fair page and find booth {booth_number}.
+
+1. COMPANY NAME: the main business name for this booth, NOT the industry category.
+   For example, if you see "Financial ServicesA34 DRW Trading Group", the company name is "DRW Trading Group".
+
+2. INDUSTRY: the industry category for this booth. It may be on the same line as the booth number,
+   on a line above or below, or a section header. It must be one of:
+- {industry_list}
+   Use "Unknown" if no clear industry is shown.
+
+3. EDUCATION LEVEL: each booth has a small briefcase icon next to it. The COLOR is critical:
+   - LIGHT PINK briefcase (pale/soft pink) = "Undergraduate"
+   - DARK PINK briefcase (deeper/richer pink) = "Both"
+   - ORANGE briefcase = "Postgraduate"
+   Compare the briefcase color at booth {booth_number} to nearby booths.
+
+Respond ONLY with a JSON object:
+{{"company": "...", "industry": "...", "education": "Undergraduate" | "Postgraduate" | "Both"}}"""
+                
+                response = self.client.chat.completions.create(
+                    model=Config.OPENAI_MODEL,
+                    messages=[{
+                        "role": "user",
+                        "content": [
+                            {"type": "text", "text": prompt},
+                            {
+                                "type": "image_url",
+                                "image_url": {
+                                    "url": f"data:image/jpeg;base64,{image_data}",
+                                    "detail": "high"
+                                }
+                            }
+                        ]
+                    }],
+                    response_format={"type": "json_object"},
+                    max_tokens=150,
+                    temperature=0.1,
+                    timeout=Config.OPENAI_TIMEOUT
+                )
+                
+                try:
+                    data = json.loads(response.choices[0].message.content)
+                except (TypeError, ValueError):
+                    data = {}
+                
+                analysis = {
+                    'company': self._clean_company_response(str(data.get('company', ''))),
+                    'industry': self._match_industry(str(data.get('industry', ''))),
+                    'education': self._match_education_level(str(data.get('education', '')))
+                }
+                
+                # Retry while nothing usable came back
+                if any(analysis.values()) or attempt >= Config.OPENAI_MAX_RETRIES - 1:
+                    return analysis
+                
+            except Exception:
+                # The client has already retried rate limits, timeouts and 5xx errors
+                break
+        
+        return None
+    
+    def _build_page_request(self, page_num: int, booth_numbers: List[str], pdf_path: str) -> Optional[Dict[str, Any]]:
+        """Build the chat completion body for analyzing several booths on one page"""
+        image_data = self._convert_pdf_page_to_image(page_num, pdf_path)
+        if not image_data:
+            return None
+        
+        booth_list = ", ".join(booth_numbers)
+        industry_list = "\n- ".join(Config.VALID_INDUSTRIES)
+        prompt = f"""Look carefully at this career fair page and find each of these booths: {booth_list}.
+
+For EACH booth, extract:
+
+1. "company": the main business name for the booth, NOT the industry category.
+   For example, if you see "Financial ServicesA34 DRW Trading Group", the company name is "DRW Trading Group".
+
+2. "industry": the industry category, exactly one of:
+- {industry_list}
+   Use "Unknown" if no clear industry is shown.
+
+3. "education": the COLOR of the small briefcase icon next to the booth:
+   - LIGHT PINK briefcase (pale/soft pink) = "Undergraduate"
+   - DARK PINK briefcase (deeper/richer pink) = "Both"
+   - ORANGE briefcase = "Postgraduate"
+
+Respond ONLY with a JSON object:
+{{"booths": [{{"booth": "A01", "company": "...", "industry": "...", "education": "Both"}}]}}"""
+        
+        return {
+            "model": Config.OPENAI_MODEL,
+            "messages": [{
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt},
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:image/jpeg;base64,{image_data}",
+                            "detail": "high"
+                        }
+                    }
+                ]
+            }],
+            "response_format": {"type": "json_object"},
+            "max_tokens": 60 * len(booth_numbers) + 100,  # Roughly one short JSON object per booth
+            "temperature": 0.1
+        }
+    
+    def _parse_page_response(self, content: str, booth_numbers: List[str]) -> Dict[str, Dict[str, Optional[str]]]:
+        """Validate a page analysis response into {booth: {company, industry, education}}"""
+        page_data = json.loads(content)
+        requested_booths = set(booth_numbers)
+        results = {}
+        
+        for entry in page_data.get('booths', []):
+            if not isinstance(entry, dict):
+                continue
+            
+            booth_number = str(entry.get('booth', '')).strip().upper()
+            if booth_number not in requested_booths:
+                continue
+            
+            results[booth_number] = {
+                'company': self._clean_company_response(str(entry.get('company') or '')),
+                'industry': self._match_industry(str(entry.get('industry') or '')),
+                'education': self._match_education_level(str(entry.get('education') or ''))
+            }
+        
+        return results
+    
+    def _analyze_page_with_vision(self, page_num: int, booth_numbers: List[str], pdf_path: str) -> Dict[str, Dict[str, Optional[str]]]:
+        """Analyze several booths on one page in a single vision call"""
+        request = self._build_page_request(page_num, booth_numbers, pdf_path)
+        if not request:
+            return {}
+        
+        try:
+            response = self.client.chat.completions.create(
+                **request,
+                timeout=Config.OPENAI_TIMEOUT * 2
+            )
+            return self._parse_page_response(response.choices[0].message.content, booth_numbers)
+        except Exception as e:
+            print(f"Batch analysis failed for page {page_num}, falling back to per-booth calls: {e}")
+            return {}
+    
     def _analyze_education_with_vision(self, booth_number: str, page_num: int, pdf_path: str) -> Optional[str]:
         """Analyze education level using OpenAI vision with retry logic"""
         for attempt in range(Config.OPENAI_MAX_RETRIES):
             try:
-                # Convert PDF page to image
-                image_data = self._convert_pdf_page_to_image(page_num, pdf_path)
+                # A tile around the booth is enough to read its row and briefcase icon
+                image_data = self._convert_pdf_page_to_image(page_num, pdf_path, booth_number)
                 if not image_data:
                     continue
                 
@@ -307,7 +687,7 @@ What color is the briefcase at booth {booth_number}? Respond with exactly one wo
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:image/png;base64,{image_data}",
+                                    "url": f"data:image/jpeg;base64,{image_data}",
                                     "detail": "high"
                                 }
                             }
@@ -321,27 +701,35 @@ What color is the briefcase at booth {booth_number}? Respond with exactly one wo
                 classification = response.choices[0].message.content.strip()
                 
                 # Validate response
-                for valid_response in Config.EDUCATION_LEVELS:
-                    if valid_response.lower() in classification.lower():
-                        return valid_response
+                education_level = self._match_education_level(classification)
+                if education_level:
+                    return education_level
                 
                 # If response is unclear, try again
                 if attempt < Config.OPENAI_MAX_RETRIES - 1:
                     continue
                 
-            except Exception as e:
-                if self._should_retry(e, attempt):
-                    self._handle_retry_wait(e, attempt)
-                    continue
+            except Exception:
+                # The client has already retried rate limits, timeouts and 5xx errors
                 break
         
         return None
     
-    def _analyze_company_with_vision(self, booth_number: str, page_num: int, pdf_path: str) -> Optional[str]:
+    def _analyze_company_with_vision(
+        self, 
+        booth_number: str, 
+        page_num: int, 
+        pdf_path: str,
+        model: str = Config.OPENAI_MODEL,
+        detail: str = "high",
+        max_attempts: Optional[int] = None
+    ) -> Optional[str]:
         """Analyze company name using OpenAI vision with retry logic"""
-        for attempt in range(Config.OPENAI_MAX_RETRIES):
+        max_attempts = max_attempts or Config.OPENAI_MAX_RETRIES
+        for attempt in range(max_attempts):
             try:
-                image_data = self._convert_pdf_page_to_image(page_num, pdf_path)
+                # A tile around the booth is enough to read its row and briefcase icon
+                image_data = self._convert_pdf_page_to_image(page_num, pdf_path, booth_number)
                 if not image_data:
                     continue
                 
@@ -359,7 +747,7 @@ Look carefully around booth {booth_number} and extract ONLY the company/business
 Respond with ONLY the clean company name, nothing else."""
                 
                 response = self.client.chat.completions.create(
-                    model=Config.OPENAI_MODEL,
+                    model=model,
                     messages=[{
                         "role": "user",
                         "content": [
@@ -367,8 +755,8 @@ Respond with ONLY the clean company name, nothing else."""
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:image/png;base64,{image_data}",
-                                    "detail": "high"
+                                    "url": f"data:image/jpeg;base64,{image_data}",
+                                    "detail": detail
                                 }
                             }
                         ]
@@ -381,28 +769,37 @@ Respond with ONLY the clean company name, nothing else."""
                 company_name = response.choices[0].message.content.strip()
                 
                 # Basic validation - company name shouldn't be an industry
-                if company_name in Config.VALID_INDUSTRIES:
-                    if attempt < Config.OPENAI_MAX_RETRIES - 1:
+                if company_name in Config.VALID_INDUSTRY_SET:
+                    if attempt < max_attempts - 1:
                         continue
                     return "Unknown"
                 
-                if len(company_name) > 2 and company_name.lower() not in ['unknown', 'n/a', 'none']:
-                    return company_name
+                cleaned_name = self._clean_company_response(company_name)
+                if cleaned_name:
+                    return cleaned_name
                 
-                if attempt < Config.OPENAI_MAX_RETRIES - 1:
+                if attempt < max_attempts - 1:
                     continue
                 
-            except Exception as e:
-                if self._should_retry(e, attempt):
-                    self._handle_retry_wait(e, attempt)
-                    continue
+            except Exception:
+                # The client has already retried rate limits, timeouts and 5xx errors
                 break
         
         return None
     
-    def _analyze_industry_with_vision(self, booth_number: str, company_name: str, page_num: int, pdf_path: str) -> Optional[str]:
+    def _analyze_industry_with_vision(
+        self, 
+        booth_number: str, 
+        company_name: str, 
+        page_num: int, 
+        pdf_path: str,
+        model: str = Config.OPENAI_MODEL,
+        detail: str = "high",
+        max_attempts: Optional[int] = None
+    ) -> Optional[str]:
         """Analyze industry using OpenAI vision with retry logic"""
-        for attempt in range(Config.OPENAI_MAX_RETRIES):
+        max_attempts = max_attempts or Config.OPENAI_MAX_RETRIES
+        for attempt in range(max_attempts):
             try:
                 image_data = self._convert_pdf_page_to_image(page_num, pdf_path)
                 if not image_data:
@@ -423,7 +820,7 @@ The industry might be:
 Look carefully at the layout around booth {booth_number} and respond with ONLY the exact industry name from the list above, or "Unknown" if no clear industry is shown."""
                 
                 response = self.client.chat.completions.create(
-                    model=Config.OPENAI_MODEL,
+                    model=model,
                     messages=[{
                         "role": "user",
                         "content": [
@@ -431,8 +828,8 @@ Look carefully at the layout around booth {booth_number} and respond with ONLY t
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:image/png;base64,{image_data}",
-                                    "detail": "high"
+                                    "url": f"data:image/jpeg;base64,{image_data}",
+                                    "detail": detail
                                 }
                             }
                         ]
@@ -444,23 +841,15 @@ Look carefully at the layout around booth {booth_number} and respond with ONLY t
                 
                 industry = response.choices[0].message.content.strip()
                 
-                # Check for exact matches first
-                for valid_industry in Config.VALID_INDUSTRIES:
-                    if valid_industry == industry.strip():
-                        return valid_industry
-                
-                # Check for partial matches
-                for valid_industry in Config.VALID_INDUSTRIES:
-                    if valid_industry.lower() in industry.lower():
-                        return valid_industry
+                matched_industry = self._match_industry(industry)
+                if matched_industry:
+                    return matched_industry
                 
-                if attempt < Config.OPENAI_MAX_RETRIES - 1:
+                if attempt < max_attempts - 1:
                     continue
                 
-            except Exception as e:
-                if self._should_retry(e, attempt):
-                    self._handle_retry_wait(e, attempt)
-                    continue
+            except Exception:
+                # The client has already retried rate limits, timeouts and 5xx errors
                 break
         
         return None
@@ -509,10 +898,8 @@ Website URL:"""
                 if attempt < Config.OPENAI_MAX_RETRIES - 1:
                     continue
                 
-            except Exception as e:
-                if self._should_retry(e, attempt):
-                    self._handle_retry_wait(e, attempt)
-                    continue
+            except Exception:
+                # The client has already retried rate limits, timeouts and 5xx errors
                 break
         
         return None
@@ -543,69 +930,113 @@ Website URL:"""
         
         return True
     
-    def _convert_pdf_page_to_image(self, page_num: int, pdf_path: str) -> Optional[str]:
-        """Convert PDF page to base64 image"""
+    def _convert_pdf_page_to_image(self, page_num: int, pdf_path: str, booth_number: Optional[str] = None) -> Optional[str]:
+        """Convert PDF page to base64 image (memoized per page until the PDF changes)
+        
+        With booth_number, only a full-width band around that booth's row is rendered, which
+        costs far fewer image tokens; falls back to the whole page if the booth label is not found.
+        """
         try:
-            doc = fitz.open(pdf_path)
-            page = doc[page_num - 1]  # Convert to 0-indexed
-            
-            # Use higher resolution for better analysis
-            mat = fitz.Matrix(3.0, 3.0)
-            pix = page.get_pixmap(matrix=mat)
+            mtime = self._pdf_mtimes.get(pdf_path)
+            if mtime is None:
+                mtime = os.path.getmtime(pdf_path)
+            cache_key = (pdf_path, page_num, booth_number)
+            cached = self._page_image_cache.get(cache_key)
+            if cached and cached[0] == mtime:
+                return cached[1]
             
-            img_data = pix.tobytes("png")
-            doc.close()
+            # Second tier: pages rendered by an earlier process
+            tile_suffix = f"_{booth_number}" if booth_number else ""
+            disk_path = Config.PAGE_IMAGE_CACHE_DIR / f"{Path(pdf_path).stem}_{int(mtime)}_{page_num}{tile_suffix}.jpg"
+            if disk_path.exists():
+                img_bytes = disk_path.read_bytes()
+                image_data = base64.b64encode(img_bytes).decode('utf-8')
+                self._page_image_cache[cache_key] = (mtime, image_data, self._hash_image(img_bytes))
+                return image_data
             
-            # Optimize image size
-            image = Image.open(io.BytesIO(img_data))
+            img_bytes = self._render_page(page_num, pdf_path, mtime, booth_number)
+            if img_bytes is None:
+                return self._convert_pdf_page_to_image(page_num, pdf_path) if booth_number else None
+            self._write_page_image(disk_path, img_bytes)
             
-            max_width = 1200
-            if image.width > max_width:
-                ratio = max_width / image.width
-                new_height = int(image.height * ratio)
-                image = image.resize((max_width, new_height), Image.Resampling.LANCZOS)
-            
-            output = io.BytesIO()
-            image.save(output, format='PNG', optimize=True)
-            img_bytes = output.getvalue()
-            
-            return base64.b64encode(img_bytes).decode('utf-8')
+            image_data = base64.b64encode(img_bytes).decode('utf-8')
+            self._page_image_cache[cache_key] = (mtime, image_data, self._hash_image(img_bytes))
+            return image_data
             
         except Exception as e:
             print(f"Error converting PDF page {page_num}: {e}")
             return None
     
-    def _should_retry(self, error: Exception, attempt: int) -> bool:
-        """Determine if we should retry based on error type and attempt number"""
-        if attempt >= Config.OPENAI_MAX_RETRIES - 1:
-            return False
-        
-        error_msg = str(error).lower()
-        
-        # Always retry rate limits, timeouts, and API errors
-        retry_indicators = [
-            "rate_limit_exceeded", "429", "timeout", "timed out", 
-            "api", "openai", "connection", "network"
-        ]
-        
-        return any(indicator in error_msg for indicator in retry_indicators)
+    def register_pdf(self, pdf_path: str, mtime: float) -> None:
+        """Record the mtime of a freshly loaded PDF; rendered images are keyed by it until the next load"""
+        self._pdf_mtimes[pdf_path] = mtime
     
-    def _handle_retry_wait(self, error: Exception, attempt: int) -> None:
-        """Handle waiting between retries based on error type"""
-        error_msg = str(error).lower()
-        
-        if "rate_limit_exceeded" in error_msg or "429" in error_msg:
-            # Longer wait for rate limits
-            wait_time = (2 ** attempt) * 5 + random.uniform(0, 5)
-        elif "timeout" in error_msg or "timed out" in error_msg:
-            # Moderate wait for timeouts
-            wait_time = (2 ** attempt) * 2 + random.uniform(0, 2)
-        else:
-            # Standard exponential backoff
-            wait_time = (2 ** attempt) + random.uniform(0, 2)
+    @staticmethod
+    def _hash_image(img_bytes: bytes) -> str:
+        """Content hash of a rendered image, used to share answers between identical renders"""
+        return hashlib.blake2b(img_bytes, digest_size=16).hexdigest()
+    
+    def _get_page_image_hash(self, page_num: int, pdf_path: str) -> Optional[str]:
+        """Content hash of the full rendered page, rendering it if needed"""
+        if not self._convert_pdf_page_to_image(page_num, pdf_path):
+            return None
+        cached = self._page_image_cache.get((pdf_path, page_num, None))
+        return cached[2] if cached else None
+    
+    def _render_page(self, page_num: int, pdf_path: str, mtime: float, booth_number: Optional[str] = None) -> Optional[bytes]:
+        """Render a page (or the band around booth_number) to JPEG bytes; None if the booth is not on the page"""
+        with _RENDER_LOCK:
+            doc = self._get_document(pdf_path, mtime)
+            page = doc[page_num - 1]  # Convert to 0-indexed
+            
+            clip = None
+            if booth_number:
+                hits = page.search_for(booth_number)
+                if not hits:
+                    return None
+                margin = Config.BOOTH_TILE_MARGIN
+                clip = fitz.Rect(
+                    page.rect.x0, max(page.rect.y0, hits[0].y0 - margin),
+                    page.rect.x1, min(page.rect.y1, hits[0].y1 + margin)
+                )
+            
+            # Rasterize straight to at most 1200px wide and let PyMuPDF encode the JPEG,
+            # skipping a PNG -> PIL -> resize -> re-encode round-trip
+            max_width = 1200
+            scale = min(3.0, max_width / page.rect.width)
+            pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), clip=clip)
+            return pix.tobytes("jpg", jpg_quality=75)
+    
+    def _get_document(self, pdf_path: str, mtime: float):
+        """Return an open document for pdf_path, reopening it only when the file changed (call under _RENDER_LOCK)"""
+        opened = self._documents.get(pdf_path)
+        if opened and opened[0] == mtime:
+            return opened[1]
+        if opened:
+            opened[1].close()
         
-        print(f"Retrying in {wait_time:.1f}s (attempt {attempt + 1}/{Config.OPENAI_MAX_RETRIES})")
-        time.sleep(wait_time)
+        doc = fitz.open(pdf_path)
+        self._documents[pdf_path] = (mtime, doc)
+        return doc
+    
+    def prerender_pages(self, page_nums: List[int], pdf_path: str) -> None:
+        """Render a set of pages into the image caches in a single pass over the open document"""
+        for page_num in page_nums:
+            self._convert_pdf_page_to_image(page_num, pdf_path)
+    
+    def release_page_images(self) -> None:
+        """Drop in-memory page images after a bulk run; later requests re-read them from the disk cache"""
+        self._page_image_cache.clear()
+    
+    def _write_page_image(self, disk_path: Path, img_bytes: bytes) -> None:
+        """Atomically write a rendered page to the on-disk image cache"""
+        try:
+            disk_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = disk_path.with_name(disk_path.name + '.tmp')
+            temp_path.write_bytes(img_bytes)
+            temp_path.replace(disk_path)
+        except Exception as e:
+            print(f"Warning: Could not cache rendered page {disk_path.name}: {e}")
     
     def analyze_resume_match(self, resume_content: str, companies: list, user_preferences: str = "") -> list:
         """Analyze resume for company matches"""
@@ -670,20 +1101,29 @@ Respond ONLY with valid JSON:
                     json_text = response_text[json_start:json_end]
                     result = json.loads(json_text)
                     
+                    # Index the companies once instead of scanning the list for every match;
+                    # the first company with a given name or booth wins, as in a linear scan
+                    index_by_name = {}
+                    index_by_booth = {}
+                    for i, company in enumerate(companies):
+                        index_by_name.setdefault(company['name'], i)
+                        index_by_booth.setdefault(company['booth_number'], i)
+                    
                     # Enhance matches with full company data
                     enhanced_matches = []
                     for match in result.get('matches', []):
-                        for company in companies:
-                            if (company['name'] == match['company_name'] or 
-                                company['booth_number'] == match['booth_number']):
-                                enhanced_match = {
-                                    **company,
-                                    'match_percentage': match.get('match_percentage', 0),
-                                    'explanation': match.get('explanation', ''),
-                                    'alignment_factors': match.get('alignment_factors', [])
-                                }
-                                enhanced_matches.append(enhanced_match)
-                                break
+                        candidates = [
+                            i for i in (index_by_name.get(match['company_name']), index_by_booth.get(match['booth_number']))
+                            if i is not None
+                        ]
+                        if candidates:
+                            enhanced_match = {
+                                **companies[min(candidates)],
+                                'match_percentage': match.get('match_percentage', 0),
+                                'explanation': match.get('explanation', ''),
+                                'alignment_factors': match.get('alignment_factors', [])
+                            }
+                            enhanced_matches.append(enhanced_match)
                     
                     return enhanced_matches
             except json.JSONDecodeError:
@@ -3,11 +3,13 @@ PDF Reader for Career Fair documents
 Handles PDF processing, text extraction, and company data parsing
 """
 import re
-import tempfile
-import os
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from pypdf import PdfReader
+import fitz  # PyMuPDF
 
 from .config import Config
 from .cache_manager import CacheManager
@@ -17,10 +19,16 @@ from .utils import (
     extract_booth_numbers, 
     sort_companies_by_booth, 
     get_booth_page_mapping,
-    clean_company_name
+    clean_company_name,
+    build_search_blob
 )
 
 
+# Extracted page text per (PDF path, mtime), shared by every reader in the process because
+# Streamlit builds a new reader on each script run
+_PAGE_TEXT_CACHE: Dict[tuple, Dict[int, str]] = {}
+
+
 class CareerFairPDFReader:
     """Main PDF reader class for career fair documents"""
     
@@ -28,6 +36,7 @@ class CareerFairPDFReader:
         """Initialize the PDF reader with optional user ID for multi-user support"""
         self.pdf_path = Path(pdf_path) if pdf_path else Config.PDF_FILE_PATH
         self.reader = None
+        self.document = None
         self.total_pages = 0
         
         # Initialize components
@@ -44,76 +53,110 @@ class CareerFairPDFReader:
         """Load the PDF file"""
         try:
             self.reader = PdfReader(str(self.pdf_path))
-            self.total_pages = len(self.reader.pages)
+            # PyMuPDF handles text extraction; it is far faster than pypdf's extract_text
+            self.document = fitz.open(str(self.pdf_path))
+            self.total_pages = self.document.page_count
             print(f"📄 Loaded PDF with {self.total_pages} pages")
+            pdf_mtime = self.pdf_path.stat().st_mtime
         except Exception as e:
             raise Exception(f"Error loading PDF: {str(e)}")
+        
+        # Stat the PDF once per load instead of once per rendered image
+        self.openai_service.register_pdf(str(self.pdf_path), pdf_mtime)
+        
+        # Page text is fixed for a given PDF, so each page is only extracted once per process
+        text_key = (str(self.pdf_path.resolve()), pdf_mtime)
+        if text_key not in _PAGE_TEXT_CACHE:
+            _PAGE_TEXT_CACHE.clear()
+            _PAGE_TEXT_CACHE[text_key] = {}
+        self._page_text_cache = _PAGE_TEXT_CACHE[text_key]
+        
+        self._pdf_mtime = pdf_mtime
+        self._booth_page_index = self._load_booth_index()
+    
+    def _load_booth_index(self) -> Dict[int, List[str]]:
+        """Load the page -> booth numbers index, discarding it if the PDF has changed"""
+        try:
+            index_file = Path(Config.BOOTH_INDEX_FILE)
+            if index_file.exists():
+                with open(index_file, 'r') as f:
+                    index_data = json.load(f)
+                if index_data.get('pdf_mtime') == self._pdf_mtime:
+                    return {int(page): booths for page, booths in index_data.get('pages', {}).items()}
+        except Exception:
+            pass
+        return {}
+    
+    def _save_booth_index(self) -> None:
+        """Save the page -> booth numbers index to file"""
+        try:
+            with open(Config.BOOTH_INDEX_FILE, 'w') as f:
+                json.dump({'pdf_mtime': self._pdf_mtime, 'pages': self._booth_page_index}, f, indent=2)
+        except Exception as e:
+            print(f"Warning: Could not save booth index: {e}")
+    
+    def get_page_booths(self, page_num: int) -> List[str]:
+        """Booth numbers printed on a page, scanning the page text only the first time"""
+        if page_num not in self._booth_page_index:
+            self._booth_page_index[page_num] = sorted(extract_booth_numbers(self.get_page_text(page_num)))
+        return self._booth_page_index[page_num]
     
     def get_page_text(self, page_number: int) -> str:
         """Extract text from a specific page (1-indexed)"""
         if page_number < 1 or page_number > self.total_pages:
             raise ValueError(f"Page number must be between 1 and {self.total_pages}")
         
+        if page_number in self._page_text_cache:
+            return self._page_text_cache[page_number]
+        
         try:
-            page = self.reader.pages[page_number - 1]  # Convert to 0-indexed
-            text = page.extract_text()
+            page = self.document.load_page(page_number - 1)  # Convert to 0-indexed
+            text = page.get_text("text")
+            self._page_text_cache[page_number] = text
             return text
         except Exception as e:
             raise Exception(f"Error extracting text from page {page_number}: {str(e)}")
     
     def parse_company_table(self, page_number: int, venue_context: Optional[str] = None) -> List[Dict[str, Any]]:
         """Parse company information from a specific page"""
+        return self.attach_user_interactions(self._parse_company_data(page_number, venue_context))
+    
+    def _parse_company_data(self, page_number: int, venue_context: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Parse the PDF/OpenAI company data on a page, without user interactions"""
         try:
             text = self.get_page_text(page_number)
             lines = [line.strip() for line in text.split('\\n') if line.strip()]
-            companies = []
             
             # Extract booth numbers from the page
             booth_numbers = extract_booth_numbers(text)
-            booth_numbers = list(set(booth_numbers))
             
             is_day2 = venue_context and "Day 2" in venue_context
             
-            # Process each booth
+            # Group booths by the page they are analyzed on
+            booths_by_page = {}
             for booth_number in booth_numbers:
                 page_num = get_booth_page_mapping(booth_number, is_day2)
-                if not page_num:
-                    continue
-                
-                # Get data using OpenAI service (with caching)
-                company_name = self.openai_service.analyze_company_name(
-                    booth_number, page_num, str(self.pdf_path), is_day2
-                )
-                
-                industry = self.openai_service.analyze_industry(
-                    booth_number, company_name, page_num, str(self.pdf_path), is_day2
-                )
-                
-                education_level = self.openai_service.analyze_education_level(
-                    booth_number, page_num, str(self.pdf_path), is_day2
-                )
-                
-                # Get website URL
-                website = self.openai_service.analyze_company_website(
-                    booth_number, company_name, page_num, is_day2
-                )
-                
-                # Get user interaction data
-                user_interaction = self.user_manager.get_interaction(booth_number)
+                if page_num:
+                    booths_by_page.setdefault(page_num, []).append(booth_number)
+            
+            booth_pages = [
+                (booth_number, page_num)
+                for page_num, page_booths in booths_by_page.items()
+                for booth_number in page_booths
+            ]
+            
+            # OpenAI calls are network-bound, so run them concurrently
+            with ThreadPoolExecutor(max_workers=Config.OPENAI_MAX_CONCURRENT_REQUESTS) as executor:
+                # Fill the cache for each page with one batched vision call before the per-booth pass
+                list(executor.map(
+                    lambda item: self.openai_service.analyze_page_booths(item[0], item[1], str(self.pdf_path), is_day2),
+                    booths_by_page.items()
+                ))
                 
-                companies.append({
-                    'name': company_name,
-                    'booth_number': booth_number,
-                    'education_level': education_level,
-                    'industry': industry,
-                    'website': website,
-                    'visited': user_interaction['visited'],
-                    'resume_shared': user_interaction['resume_shared'],
-                    'apply_online': user_interaction['apply_online'],
-                    'interested': user_interaction['interested'],
-                    'comments': user_interaction['comments'],
-                    'raw_text': f"Booth {booth_number}"
-                })
+                companies = list(executor.map(
+                    lambda item: self._build_company_entry(item[0], item[1], is_day2),
+                    booth_pages
+                ))
             
             return sort_companies_by_booth(companies)
             
@@ -121,14 +164,48 @@ class CareerFairPDFReader:
             print(f"Error parsing companies from page {page_number}: {str(e)}")
             return []
     
+    def _build_company_entry(self, booth_number: str, page_num: int, is_day2: bool) -> Dict[str, Any]:
+        """Build the company entry for one booth (runs in _parse_company_data worker threads)"""
+        # Get name, industry and education from one OpenAI call (with caching)
+        booth_data = self.openai_service.analyze_booth(
+            booth_number, page_num, str(self.pdf_path), is_day2
+        )
+        company_name = booth_data['company']
+        
+        # Get website URL
+        website = self.openai_service.analyze_company_website(
+            booth_number, company_name, page_num, is_day2
+        )
+        
+        return {
+            'name': company_name,
+            'booth_number': booth_number,
+            'education_level': booth_data['education'],
+            'industry': booth_data['industry'],
+            'website': website,
+            'raw_text': f"Booth {booth_number}",
+            '_search_blob': build_search_blob(company_name, booth_data['industry'], booth_number)
+        }
+    
+    def attach_user_interactions(self, companies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return copies of the company entries with the user's interaction data added"""
+        return [
+            {**company, **self.user_manager.get_interaction(company['booth_number'])}
+            for company in companies
+        ]
+    
     def get_venue_companies(self, venue_name: str) -> List[Dict[str, Any]]:
         """Get companies for a specific venue based on page mappings"""
+        return self.attach_user_interactions(self.get_venue_company_data(venue_name))
+    
+    def get_venue_company_data(self, venue_name: str) -> List[Dict[str, Any]]:
+        """Get the company data for a venue without user interactions (safe to cache across reruns)"""
         pages = Config.VENUE_PAGE_MAPPINGS.get(venue_name, [])
         all_companies = []
         
         for page_num in pages:
             try:
-                companies = self.parse_company_table(page_num, venue_name)
+                companies = self._parse_company_data(page_num, venue_name)
                 all_companies.extend(companies)
             except Exception as e:
                 print(f"Warning: Could not parse companies from page {page_num}: {str(e)}")
@@ -156,7 +233,6 @@ class CareerFairPDFReader:
         try:
             text = self.get_page_text(page_number)
             booth_numbers = extract_booth_numbers(text)
-            booth_numbers = list(set(booth_numbers))
             
             companies = []
             is_day2 = venue_context and "Day 2" in venue_context
@@ -167,28 +243,22 @@ class CareerFairPDFReader:
                     continue
                 
                 # Get cached data only
-                company_name = self.cache_manager.get_company_name(booth_number, page_num, is_day2) or "Unknown Company"
-                industry = self.cache_manager.get_industry(booth_number, page_num, is_day2) or "Unknown"
-                education_level = self.cache_manager.get_education_level(booth_number, page_num, is_day2) or "Unknown"
+                cached = self.cache_manager.get_booth_fields(booth_number, page_num, is_day2)
+                company_name = cached['company'] or "Unknown Company"
+                industry = cached['industry'] or "Unknown"
+                education_level = cached['education'] or "Unknown"
                 website = self.cache_manager.get_company_website(booth_number, page_num, is_day2) or ""
                 
-                # Get user interaction data
-                user_interaction = self.user_manager.get_interaction(booth_number)
-                
                 companies.append({
                     'name': company_name,
                     'booth_number': booth_number,
                     'education_level': education_level,
                     'industry': industry,
-                    'visited': user_interaction['visited'],
-                    'resume_shared': user_interaction['resume_shared'],
-                    'apply_online': user_interaction['apply_online'],
-                    'interested': user_interaction['interested'],
-                    'comments': user_interaction['comments'],
-                    'raw_text': f"Booth {booth_number}"
+                    'raw_text': f"Booth {booth_number}",
+                    '_search_blob': build_search_blob(company_name, industry, booth_number)
                 })
             
-            return sort_companies_by_booth(companies)
+            return self.attach_user_interactions(sort_companies_by_booth(companies))
             
         except Exception as e:
             print(f"Error parsing companies from page {page_number}: {str(e)}")
@@ -198,6 +268,14 @@ class CareerFairPDFReader:
         """Update user interaction data for a specific booth"""
         return self.user_manager.update_interaction(booth_number, **kwargs)
     
+    def bulk_update_interactions(self, rows: List[tuple]) -> None:
+        """Apply queued (booth_number, field, value) interaction changes with a single save"""
+        self.user_manager.bulk_update_interactions(rows)
+    
+    def flush(self) -> None:
+        """Persist pending user interaction changes to disk"""
+        self.user_manager.flush()
+    
     def get_user_interaction(self, booth_number: str) -> Dict[str, Any]:
         """Get user interaction data for a specific booth"""
         return self.user_manager.get_interaction(booth_number)
@@ -210,7 +288,7 @@ class CareerFairPDFReader:
         
         # Get all companies from all venues using cached data
         all_companies = []
-        for venue in Config.VENUE_PAGE_MAPPINGS.keys():
+        for venue in Config.ALL_VENUES:
             companies = self.get_cached_venue_companies(venue)
             for company in companies:
                 company['venue'] = venue
@@ -227,21 +305,13 @@ class CareerFairPDFReader:
     def extract_text_from_pdf(self, pdf_file) -> str:
         """Extract text content from uploaded PDF resume"""
         try:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-                temp_file.write(pdf_file.read())
-                temp_path = temp_file.name
-            
-            # Extract text using PyPDF
-            reader = PdfReader(temp_path)
+            # Read the upload from memory instead of round-tripping it through a temp file
+            reader = PdfReader(io.BytesIO(pdf_file.read()))
             text_content = ""
             
             for page in reader.pages:
                 text_content += page.extract_text() + "\\n"
             
-            # Clean up temp file
-            os.unlink(temp_path)
-            
             return text_content.strip()
             
         except Exception as e:
@@ -256,12 +326,16 @@ class CareerFairPDFReader:
         """Check cache completion status"""
         return self.cache_manager.check_completeness(venue_name)
     
-    def preload_all_openai_data(self, venue_name: Optional[str] = None) -> Dict[str, Any]:
-        """Preload all OpenAI data for complete offline operation"""
+    def preload_all_openai_data(self, venue_name: Optional[str] = None, verbose: bool = False) -> Dict[str, Any]:
+        """Preload all OpenAI data for complete offline operation
+        
+        Per-booth status lines are only printed when verbose is True; otherwise progress is
+        reported every 50 booths.
+        """
         if not self.openai_service.is_available():
             return {'error': 'OpenAI service not available'}
         
-        venues = [venue_name] if venue_name else list(Config.VENUE_PAGE_MAPPINGS.keys())
+        venues = [venue_name] if venue_name else Config.ALL_VENUES
         
         total_stats = {
             'education_cache_hits': 0,
@@ -270,84 +344,123 @@ class CareerFairPDFReader:
             'company_api_calls': 0,
             'industry_cache_hits': 0,
             'industry_api_calls': 0,
+            'page_batch_booths': 0,
             'total_booths_processed': 0
         }
         
-        for venue in venues:
-            print(f"🏢 Processing {venue}...")
+        booths_by_page = self._collect_booths_by_page(venues)
+        
+        # Render the pages the booths map to in one pass before any vision calls
+        self.openai_service.prerender_pages(sorted({page_num for page_num, _ in booths_by_page}), str(self.pdf_path))
+        
+        # The vision calls are network-bound, so overlap them; results are tallied on this thread
+        with ThreadPoolExecutor(max_workers=Config.OPENAI_MAX_CONCURRENT_REQUESTS) as executor:
+            # One vision call per page answers most booths; the per-booth pass only fills the gaps
+            total_stats['page_batch_booths'] += sum(executor.map(
+                lambda item: self.openai_service.analyze_page_booths(item[0][0], item[1], str(self.pdf_path), item[0][1]),
+                booths_by_page.items()
+            ))
             
-            pages = Config.VENUE_PAGE_MAPPINGS.get(venue, [])
-            booth_numbers = []
+            futures = {
+                executor.submit(self._preload_booth, booth_number, page_num, is_day2): booth_number
+                for (page_num, is_day2), booths in booths_by_page.items()
+                for booth_number in booths
+            }
             
-            # Extract all booth numbers from pages
-            for page_num in pages:
+            for future in as_completed(futures):
+                booth_number = futures[future]
                 try:
-                    text = self.get_page_text(page_num)
-                    booth_matches = extract_booth_numbers(text)
-                    booth_numbers.extend(booth_matches)
+                    booth_stats, status = future.result()
                 except Exception as e:
-                    print(f"⚠️ Warning: Could not extract booths from page {page_num}: {e}")
-            
-            # Remove duplicates and sort
-            booth_numbers = sorted(list(set(booth_numbers)))
-            print(f"📍 Found {len(booth_numbers)} booths: {booth_numbers[:5]}{'...' if len(booth_numbers) > 5 else ''}")
-            
-            is_day2 = "Day 2" in venue
-            
-            # Process each booth for all three data types
-            for booth_number in booth_numbers:
-                page_num = get_booth_page_mapping(booth_number, is_day2)
-                if not page_num:
+                    print(f"⚠️ Warning: Could not preload booth {booth_number}: {e}")
                     continue
                 
-                print(f"🔄 Processing {booth_number}...", end=" ")
-                
-                # 1. Education Level
-                if self.cache_manager.get_education_level(booth_number, page_num, is_day2):
-                    total_stats['education_cache_hits'] += 1
-                    print("📚✓", end=" ")
-                else:
-                    education_level = self.openai_service.analyze_education_level(
-                        booth_number, page_num, str(self.pdf_path), is_day2
-                    )
-                    total_stats['education_api_calls'] += 1
-                    print(f"📚{education_level[:1] if education_level != 'Unknown' else '❌'}", end=" ")
-                
-                # 2. Company Name
-                if self.cache_manager.get_company_name(booth_number, page_num, is_day2):
-                    total_stats['company_cache_hits'] += 1
-                    print("🏢✓", end=" ")
-                else:
-                    company_name = self.openai_service.analyze_company_name(
-                        booth_number, page_num, str(self.pdf_path), is_day2
-                    )
-                    total_stats['company_api_calls'] += 1
-                    print("🏢✓" if company_name != "Unknown" else "🏢❌", end=" ")
-                
-                # 3. Industry
-                if self.cache_manager.get_industry(booth_number, page_num, is_day2):
-                    total_stats['industry_cache_hits'] += 1
-                    print("🏭✓")
-                else:
-                    # Get the cached company name for industry analysis
-                    cached_company = self.cache_manager.get_company_name(booth_number, page_num, is_day2) or "Unknown Company"
-                    industry = self.openai_service.analyze_industry(
-                        booth_number, cached_company, page_num, str(self.pdf_path), is_day2
-                    )
-                    total_stats['industry_api_calls'] += 1
-                    print("🏭✓" if industry != "Unknown" else "🏭❌")
-                
+                for stat, count in booth_stats.items():
+                    total_stats[stat] += count
                 total_stats['total_booths_processed'] += 1
+                if verbose:
+                    print(f"🔄 {booth_number}: {status}")
+                elif total_stats['total_booths_processed'] % 50 == 0:
+                    print(f"🔄 Processed {total_stats['total_booths_processed']}/{len(futures)} booths")
                 
                 # Save cache every 10 booths
                 if total_stats['total_booths_processed'] % 10 == 0:
                     self.cache_manager.save_cache()
         
-        # Final save
+        # Final save, and refresh the shared JSON cache once for the whole run
         self.cache_manager.save_cache()
+        self.cache_manager.export_json()
+        
+        # Each page was rendered once for the whole run; free the images now
+        self.openai_service.release_page_images()
         
         return total_stats
     
+    def _collect_booths_by_page(self, venues: List[str]) -> Dict[tuple, List[str]]:
+        """Map (page_num, is_day2) to the booths analyzed on that page, listing each booth once across venues"""
+        booths_by_page: Dict[tuple, List[str]] = {}
+        indexed_pages = len(self._booth_page_index)
+        
+        for venue in venues:
+            print(f"🏢 Processing {venue}...")
+            
+            venue_booths = set()
+            
+            # Extract all unique booth numbers from pages
+            for page_num in Config.VENUE_PAGE_MAPPINGS.get(venue, []):
+                try:
+                    venue_booths.update(self.get_page_booths(page_num))
+                except Exception as e:
+                    print(f"⚠️ Warning: Could not extract booths from page {page_num}: {e}")
+            
+            booth_numbers = sorted(venue_booths)
+            print(f"📍 Found {len(booth_numbers)} booths: {booth_numbers[:5]}{'...' if len(booth_numbers) > 5 else ''}")
+            
+            is_day2 = "Day 2" in venue
+            for booth_number in booth_numbers:
+                page_num = get_booth_page_mapping(booth_number, is_day2)
+                if page_num:
+                    booths = booths_by_page.setdefault((page_num, is_day2), [])
+                    if booth_number not in booths:
+                        booths.append(booth_number)
+        
+        # Later runs read the booth lists back instead of rescanning the pages
+        if len(self._booth_page_index) > indexed_pages:
+            self._save_booth_index()
+        
+        return booths_by_page
+    
+    def _preload_booth(self, booth_number: str, page_num: int, is_day2: bool):
+        """Fill the cache for one booth (runs in preload worker threads); returns (stats, status line)"""
+        stats = {}
+        status = []
+        cached = self.cache_manager.get_booth_fields(booth_number, page_num, is_day2)
+        
+        # One combined vision call fills every missing field instead of one call per field
+        result = cached
+        if not all(cached.values()):
+            result = self.openai_service.analyze_booth(booth_number, page_num, str(self.pdf_path), is_day2)
+        
+        for field, icon in (('education', "📚"), ('company', "🏢"), ('industry', "🏭")):
+            if cached[field]:
+                stats[f'{field}_cache_hits'] = 1
+                status.append(f"{icon}✓")
+            elif result[field] == "Unknown":
+                stats[f'{field}_api_calls'] = 1
+                status.append(f"{icon}❌")
+            else:
+                stats[f'{field}_api_calls'] = 1
+                status.append(f"{icon}{result[field][:1]}" if field == 'education' else f"{icon}✓")
+        
+        return stats, ' '.join(status)
+    
+    def prewarm_cache_via_batch(self, venue_name: Optional[str] = None) -> int:
+        """Fill the OpenAI cache for venues through the Batch API instead of live calls"""
+        venues = [venue_name] if venue_name else Config.ALL_VENUES
+        page_booths = self._collect_booths_by_page(venues)
+        
+        return self.openai_service.prewarm_cache_via_batch(page_booths, str(self.pdf_path))
+    
     def clear_cache(self):
         """Clear the OpenAI vision cache"""
         self.cache_manager.clear()
@@ -360,6 +473,10 @@ class CareerFairPDFReader:
         """Export user data to CSV format"""
         return self.user_manager.export_to_csv()
     
+    def iter_export_user_data_chunks(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Yield the user data CSV export in UTF-8 chunks"""
+        return self.user_manager.iter_csv_chunks(chunk_size)
+    
     @property
     def user_id(self) -> str:
         """Get current user ID"""
@@ -2,22 +2,53 @@
 User management for multi-user support
 Handles user ID generation, data storage, and interactions
 """
+import atexit
+import csv
+import io
 import json
+import os
+import threading
+import time
 import uuid
+import weakref
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
 from .config import Config
 from .utils import format_file_size
 
 
+# Managers with unsaved interaction changes, flushed on interpreter exit
+_PENDING_MANAGERS = weakref.WeakSet()
+
+
+def _flush_pending_managers():
+    """Write out any interaction data whose deferred save has not run yet"""
+    for manager in list(_PENDING_MANAGERS):
+        manager.flush()
+
+
+atexit.register(_flush_pending_managers)
+
 class UserManager:
     """Manages user data and interactions"""
     
+    # Last get_system_metrics() result and when it was computed (time.monotonic)
+    _metrics_cache: Optional[Dict[str, Any]] = None
+    _metrics_cache_time = 0.0
+    
     def __init__(self, user_id: Optional[str] = None):
         self.user_id = user_id or self.generate_user_id()
         self.user_data_file = Path(f"{Config.USER_DATA_PREFIX}{self.user_id}.json")
         self.user_data = self._load_user_data()
+        # Interaction updates are coalesced into one deferred save instead of a write per click
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False
+        # Bumped on every update so get_user_summary() only recounts after a change
+        self._version = 0
+        self._summary_counts: Optional[Dict[str, int]] = None
+        self._summary_version = -1
     
     @staticmethod
     def generate_user_id() -> str:
@@ -37,8 +68,12 @@ class UserManager:
     def _save_user_data(self) -> bool:
         """Save user interaction data to file"""
         try:
-            with open(self.user_data_file, 'w') as f:
-                json.dump(self.user_data, f, indent=2)
+            # Compact JSON written to a temp file and swapped in, so a crash never truncates the data
+            temp_file = self.user_data_file.with_name(self.user_data_file.name + '.tmp')
+            with open(temp_file, 'w') as f:
+                json.dump(self.user_data, f, separators=(',', ':'))
+            os.replace(temp_file, self.user_data_file)
+            UserManager._metrics_cache = None
             return True
         except Exception as e:
             print(f"Error: Could not save user data: {e}")
@@ -66,67 +101,135 @@ class UserManager:
         comments: Optional[str] = None
     ) -> Dict[str, Any]:
         """Update user interaction data for a specific booth"""
-        if booth_number not in self.user_data:
-            self.user_data[booth_number] = {
-                'visited': False,
-                'resume_shared': False,
-                'applied_online': False,
-                'interested': False,
-                'comments': '',
-                'last_updated': datetime.now().isoformat()
-            }
+        # Held while mutating so a deferred save never serializes a half-updated dict
+        with self._save_lock:
+            entry = self._apply_changes(booth_number, (
+                ('visited', visited),
+                ('resume_shared', resume_shared),
+                ('applied_online', applied_online),
+                ('interested', interested),
+                ('comments', comments),
+            ))
+        
+        self._schedule_save()
+        return entry
+    
+    def bulk_update_interactions(self, rows: Iterable[Tuple[str, str, Any]]) -> None:
+        """Apply (booth_number, field, value) changes in order, with one deferred save for all of them"""
+        rows = list(rows)
+        if not rows:
+            return
+        
+        with self._save_lock:
+            for booth_number, field, value in rows:
+                self._apply_changes(booth_number, ((field, value),))
+        
+        self._schedule_save()
+    
+    def _apply_changes(self, booth_number: str, changes: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
+        """Set the given (field, value) pairs on a booth's entry; the caller holds _save_lock"""
+        entry = self.user_data.setdefault(booth_number, {
+            'visited': False,
+            'resume_shared': False,
+            'applied_online': False,
+            'interested': False,
+            'comments': ''
+        })
         
         # Update only the provided fields
-        if visited is not None:
-            self.user_data[booth_number]['visited'] = visited
-        if resume_shared is not None:
-            self.user_data[booth_number]['resume_shared'] = resume_shared
-        if applied_online is not None:
-            self.user_data[booth_number]['applied_online'] = applied_online
-        if interested is not None:
-            self.user_data[booth_number]['interested'] = interested
-        if comments is not None:
-            self.user_data[booth_number]['comments'] = comments
+        for field, value in changes:
+            if value is not None:
+                entry[field] = value
         
         # Update timestamp
-        self.user_data[booth_number]['last_updated'] = datetime.now().isoformat()
-        
-        self._save_user_data()
-        return self.user_data[booth_number]
+        entry['last_updated'] = datetime.now().isoformat()
+        self._version += 1
+        return entry
+    
+    def _schedule_save(self) -> None:
+        """Mark the data dirty and make sure a save runs within USER_DATA_SAVE_DELAY seconds"""
+        with self._save_lock:
+            self._dirty = True
+            _PENDING_MANAGERS.add(self)
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(Config.USER_DATA_SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def flush(self) -> bool:
+        """Save pending interaction changes now"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            saved = self._save_user_data()
+            if saved:
+                self._dirty = False
+                _PENDING_MANAGERS.discard(self)
+            return saved
     
     def get_user_summary(self) -> Dict[str, Any]:
         """Get summary of user interactions"""
-        total_booths = len(self.user_data)
-        visited_count = sum(1 for data in self.user_data.values() if data.get('visited', False))
-        interested_count = sum(1 for data in self.user_data.values() if data.get('interested', False))
-        resume_shared_count = sum(1 for data in self.user_data.values() if data.get('resume_shared', False))
-        applied_online_count = sum(1 for data in self.user_data.values() if data.get('applied_online', False))
-
+        if self._summary_version != self._version:
+            counts = {
+                'total_interactions': len(self.user_data),
+                'visited_booths': 0,
+                'interested_booths': 0,
+                'resumes_shared': 0,
+                'online_applications': 0
+            }
+            
+            # Single pass over the interactions for all counters
+            for data in self.user_data.values():
+                if data.get('visited', False):
+                    counts['visited_booths'] += 1
+                if data.get('interested', False):
+                    counts['interested_booths'] += 1
+                if data.get('resume_shared', False):
+                    counts['resumes_shared'] += 1
+                if data.get('applied_online', False):
+                    counts['online_applications'] += 1
+            
+            self._summary_counts = counts
+            self._summary_version = self._version
+        
         return {
             'user_id': self.user_id,
-            'total_interactions': total_booths,
-            'visited_booths': visited_count,
-            'interested_booths': interested_count,
-            'resumes_shared': resume_shared_count,
-            'online_applications': applied_online_count,
+            **self._summary_counts,
             'data_file': str(self.user_data_file),
             'file_exists': self.user_data_file.exists()
         }
     
     def export_to_csv(self) -> str:
         """Export user data to CSV format"""
-        if not self.user_data:
-            return "booth_number,visited,resume_shared,applied_online,interested,comments,last_updated\n"
-        
-        csv_lines = ["booth_number,visited,resume_shared,applied_online,interested,comments,last_updated"]
+        return b"".join(self.iter_csv_chunks()).decode('utf-8')
+    
+    def iter_csv_chunks(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Yield the CSV export as UTF-8 chunks of about chunk_size bytes, one row written at a time"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(['booth_number', 'visited', 'resume_shared', 'applied_online', 'interested', 'comments', 'last_updated'])
         
-        for booth_number, data in self.user_data.items():
-            line = f"{booth_number},{data.get('visited', False)},{data.get('resume_shared', False)}," \
-                   f"{data.get('applied_online', False)},{data.get('interested', False)}," \
-                   f"\"{data.get('comments', '')}\",{data.get('last_updated', '')}"
-            csv_lines.append(line)
+        # Snapshot the items so a concurrent update cannot change the dict mid-export
+        for booth_number, data in list(self.user_data.items()):
+            writer.writerow([
+                booth_number,
+                data.get('visited', False),
+                data.get('resume_shared', False),
+                data.get('applied_online', False),
+                data.get('interested', False),
+                data.get('comments', ''),
+                data.get('last_updated', '')
+            ])
+            if buffer.tell() >= chunk_size:
+                yield buffer.getvalue().encode('utf-8')
+                buffer.seek(0)
+                buffer.truncate()
         
-        return "\n".join(csv_lines)
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
     
     def get_interested_booths(self) -> List[str]:
         """Get list of booth numbers marked as interested"""
@@ -170,17 +273,30 @@ class UserManager:
     
     @staticmethod
     def get_system_metrics() -> Dict[str, Any]:
-        """Get system-wide user metrics"""
+        """Get system-wide user metrics
+        
+        The scan is reused for Config.SYSTEM_METRICS_TTL seconds, or until this process
+        writes or deletes a user file.
+        """
+        now = time.monotonic()
+        if UserManager._metrics_cache is not None and now - UserManager._metrics_cache_time < Config.SYSTEM_METRICS_TTL:
+            return UserManager._metrics_cache
+        
         user_files = UserManager.get_all_user_files()
         total_users = len(user_files)
-        active_users = UserManager.get_active_users(Config.ACTIVITY_WINDOW_HOURS)
         
-        # Calculate total storage
-        total_storage = sum(
-            file_path.stat().st_size 
-            for file_path in user_files 
-            if file_path.exists()
-        )
+        # One stat per file gives both the storage total and the activity count
+        cutoff_time = (datetime.now() - timedelta(hours=Config.ACTIVITY_WINDOW_HOURS)).timestamp()
+        total_storage = 0
+        active_users = 0
+        for file_path in user_files:
+            try:
+                file_stat = file_path.stat()
+            except OSError:
+                continue
+            total_storage += file_stat.st_size
+            if file_stat.st_mtime > cutoff_time:
+                active_users += 1
         
         # Performance warnings
         warnings = []
@@ -191,15 +307,17 @@ class UserManager:
         if storage_mb > Config.MAX_STORAGE_WARNING_MB:
             warnings.append(f"High storage usage: {storage_mb:.1f}MB (recommended max: {Config.MAX_STORAGE_WARNING_MB}MB)")
         
-        return {
+        UserManager._metrics_cache = {
             'total_users': total_users,
-            'active_users_24h': len(active_users),
+            'active_users_24h': active_users,
             'total_storage_bytes': total_storage,
             'total_storage_formatted': format_file_size(total_storage),
             'storage_mb': round(storage_mb, 1),
             'warnings': warnings,
             'performance_ok': len(warnings) == 0
         }
+        UserManager._metrics_cache_time = now
+        return UserManager._metrics_cache
     
     def cleanup_old_data(self, days: int = 7) -> int:
         """Clean up user data older than specified days"""
@@ -214,4 +332,6 @@ class UserManager:
             except Exception:
                 continue
         
+        if cleaned_count:
+            UserManager._metrics_cache = None
         return cleaned_count
@@ -8,10 +8,40 @@ import random
 from typing import List, Optional, Tuple
 
 
+# Booth numbers look like A01, B23, C105
+BOOTH_NUMBER_PATTERN = re.compile(r'[A-Z]\d{2,3}')
+MATCH_PERCENTAGE_PATTERN = re.compile(r'(\d+)%')
+
+# Industry labels that the PDF layout glues onto the front of company names
+INDUSTRY_KEYWORDS = [
+    'Banking & Finance', 'Technology & IT', 'Consulting',
+    'Engineering & Manufacturing', 'Energy & Renewables',
+    'Public Sector', 'Pharmaceutical, Healthcare, Biomedical Sciences',
+    'Chemicals', 'Education', 'Luxury, Retail & Consumer Goods'
+]
+INDUSTRY_PREFIX_PATTERN = re.compile(
+    r'^(?:(?:' + '|'.join(re.escape(keyword) for keyword in INDUSTRY_KEYWORDS) + r')\s*)+'
+)
+
+# Page holding each booth, keyed by (is_day2, booth letter, A01-A22 half for Hall A)
+_BOOTH_PAGE = {
+    (False, 'A', True): 11, (False, 'A', False): 12,
+    (False, 'B', None): 14, (False, 'C', None): 17, (False, 'D', None): 20,
+    (True, 'A', True): 23, (True, 'A', False): 24,
+    (True, 'B', None): 26, (True, 'C', None): 29, (True, 'D', None): 32
+}
+
+# Venue holding each booth, keyed by (booth letter, is_day2)
+_BOOTH_VENUE = {
+    (prefix, is_day2): f"{hall}{' Day 2' if is_day2 else ''}"
+    for prefix, hall in (('A', 'SRC Hall A'), ('B', 'SRC Hall B'), ('C', 'SRC Hall C'), ('D', 'EA Atrium'))
+    for is_day2 in (False, True)
+}
+
+
 def extract_booth_numbers(text: str) -> List[str]:
-    """Extract booth numbers from text using regex"""
-    booth_matches = re.findall(r'([A-Z]\d{2,3})', text)
-    return list(set(booth_matches))
+    """Extract unique booth numbers from text in page order"""
+    return list(dict.fromkeys(BOOTH_NUMBER_PATTERN.findall(text)))
 
 
 def sort_companies_by_booth(companies: List[dict]) -> List[dict]:
@@ -33,34 +63,11 @@ def get_booth_page_mapping(booth_number: str, is_day2: bool = False) -> Optional
     if not booth_number:
         return None
         
-    booth_prefix = booth_number[0]
-    try:
-        booth_num = int(booth_number[1:])
-    except (IndexError, ValueError):
+    prefix, digits = booth_number[0], booth_number[1:]
+    if not digits.isdigit():
         return None
     
-    if is_day2:
-        # Day 2 booth mappings
-        if booth_prefix == 'A':
-            return 23 if booth_num <= 22 else 24
-        elif booth_prefix == 'B':
-            return 26
-        elif booth_prefix == 'C':
-            return 29
-        elif booth_prefix == 'D':
-            return 32
-    else:
-        # Day 1 booth mappings (default)
-        if booth_prefix == 'A':
-            return 11 if booth_num <= 22 else 12
-        elif booth_prefix == 'B':
-            return 14
-        elif booth_prefix == 'C':
-            return 17
-        elif booth_prefix == 'D':
-            return 20
-    
-    return None
+    return _BOOTH_PAGE.get((is_day2, prefix, int(digits) <= 22 if prefix == 'A' else None))
 
 
 def exponential_backoff_wait(attempt: int, base_wait: float = 1.0, max_wait: float = 60.0) -> None:
@@ -77,17 +84,8 @@ def clean_company_name(raw_name: str) -> str:
     # Remove common patterns
     cleaned = raw_name.strip()
     
-    # Remove industry keywords if they appear at the start
-    industry_keywords = [
-        'Banking & Finance', 'Technology & IT', 'Consulting',
-        'Engineering & Manufacturing', 'Energy & Renewables',
-        'Public Sector', 'Pharmaceutical, Healthcare, Biomedical Sciences',
-        'Chemicals', 'Education', 'Luxury, Retail & Consumer Goods'
-    ]
-    
-    for keyword in industry_keywords:
-        if cleaned.startswith(keyword):
-            cleaned = cleaned[len(keyword):].strip()
+    # Remove industry keywords if they appear at the start (single regex pass)
+    cleaned = INDUSTRY_PREFIX_PATTERN.sub('', cleaned)
     
     # Clean up extra whitespace
     cleaned = ' '.join(cleaned.split())
@@ -104,7 +102,7 @@ def is_valid_education_level(level: str) -> bool:
 def is_valid_industry(industry: str) -> bool:
     """Check if industry is valid"""
     from .config import Config
-    return industry in Config.VALID_INDUSTRIES
+    return industry in Config.VALID_INDUSTRY_SET
 
 
 def get_cache_key(booth_number: str, page_num: int, suffix: str = "") -> str:
@@ -114,13 +112,14 @@ def get_cache_key(booth_number: str, page_num: int, suffix: str = "") -> str:
     return f"{base_key}{suffix}" if suffix else base_key
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    # Each unit is 2**10 times the previous one, so the bit length picks it directly
+    exponent = min((max(int(size_bytes), 1).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (exponent * 10)):.1f} {_SIZE_UNITS[exponent]}"
 
 
 def validate_booth_number(booth_number: str) -> bool:
@@ -129,10 +128,19 @@ def validate_booth_number(booth_number: str) -> bool:
         return False
     
     # Should match pattern like A01, B23, C105, etc.
-    pattern = r'^[A-Z]\d{2,3}$'
-    return bool(re.match(pattern, booth_number))
+    return bool(BOOTH_NUMBER_PATTERN.fullmatch(booth_number))
+
+
+def validate_booth_numbers(booth_numbers: List[str]) -> List[str]:
+    """Keep only the well-formed booth numbers, in order"""
+    fullmatch = BOOTH_NUMBER_PATTERN.fullmatch
+    return [booth for booth in booth_numbers if booth and fullmatch(booth)]
 
 
+def build_search_blob(name: str, industry: str, booth_number: str) -> str:
+    """Lowercased searchable text for a company, so filtering needs one substring test per company"""
+    return f"{name}\t{industry}\t{booth_number}".lower()
+
 def truncate_text(text: str, max_length: int = 100) -> str:
     """Truncate text to maximum length with ellipsis"""
     if len(text) <= max_length:
@@ -153,20 +161,10 @@ def get_venue_from_booth(booth_number: str, is_day2: bool = False) -> str:
     if not booth_number:
         return "Unknown"
     
-    booth_prefix = booth_number[0]
-    day_suffix = " Day 2" if is_day2 else ""
-    
-    venue_map = {
-        'A': f"SRC Hall A{day_suffix}",
-        'B': f"SRC Hall B{day_suffix}",
-        'C': f"SRC Hall C{day_suffix}",
-        'D': f"EA Atrium{day_suffix}"
-    }
-    
-    return venue_map.get(booth_prefix, "Unknown")
+    return _BOOTH_VENUE.get((booth_number[0], bool(is_day2)), "Unknown")
 
 
 def parse_match_percentage(text: str) -> int:
     """Extract match percentage from text"""
-    match = re.search(r'(\d+)%', text)
+    match = MATCH_PERCENTAGE_PATTERN.search(text)
     return int(match.group(1)) if match else 0
@@ -3,7 +3,6 @@ import sys
 import os
 from pathlib import Path
 from PIL import Image
-import tempfile
 import io
 
 # Page configuration for better mobile experience
@@ -216,14 +215,22 @@ class CareerFairApp:
             user_files = list(Path('.').glob('user_interactions_*.json'))
             total_users = len(user_files)
             
+            # Stat each user file once for both its size and its modification time
+            file_stats = []
+            for f in user_files:
+                try:
+                    file_stats.append(f.stat())
+                except OSError:
+                    continue
+            
             # Calculate total storage used by user files
-            total_size = sum(f.stat().st_size for f in user_files if f.exists())
+            total_size = sum(file_stat.st_size for file_stat in file_stats)
             storage_mb = total_size / (1024 * 1024)  # Convert to MB
             
             # Get active users (files modified in last 24 hours)
             from datetime import datetime, timedelta
             cutoff_time = datetime.now().timestamp() - (24 * 60 * 60)  # 24 hours ago
-            active_users = sum(1 for f in user_files if f.stat().st_mtime > cutoff_time)
+            active_users = sum(1 for file_stat in file_stats if file_stat.st_mtime > cutoff_time)
             
             return {
                 'total_users': total_users,
@@ -248,16 +255,17 @@ class CareerFairApp:
                 st.error("PDF reader not available for data export")
                 return
             
-            import pandas as pd
-            from datetime import datetime
-            
             # Get user's interaction data
             user_data = self.pdf_reader.user_data
             
+            # Bail out before importing pandas when there is nothing to export
             if not user_data:
                 st.warning("No data to export - start tracking companies first!")
                 return
             
+            import pandas as pd
+            from datetime import datetime
+            
             # Convert to exportable format
             export_data = []
             for booth_number, data in user_data.items():
@@ -500,20 +508,16 @@ class CareerFairApp:
                 # Display the image
                 st.image(image, caption=f"Page {page_number} - {title}", width='stretch')
                 
-                # Add download button for the image
-                img_buffer = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-                image.save(img_buffer.name, 'PNG')
-                
-                with open(img_buffer.name, 'rb') as f:
-                    st.download_button(
-                        label=f"Download {title} Map",
-                        data=f.read(),
-                        file_name=f"career_fair_map_page_{page_number}.png",
-                        mime="image/png"
-                    )
+                # Add download button for the image, encoded in memory rather than via a temp file
+                img_buffer = io.BytesIO()
+                image.save(img_buffer, format='PNG')
                 
-                # Clean up temp file
-                os.unlink(img_buffer.name)
+                st.download_button(
+                    label=f"Download {title} Map",
+                    data=img_buffer.getvalue(),
+                    file_name=f"career_fair_map_page_{page_number}.png",
+                    mime="image/png"
+                )
             else:
                 st.error(f"Could not load page {page_number}")
                 # Fallback to text content
@@ -697,7 +701,7 @@ class CareerFairApp:
         
         with col2:
             # Industry filter - enhanced for deployment debugging
-            available_industries = list(set([company.get('industry', 'Not specified') for company in companies]))
+            available_industries = list(dict.fromkeys(company.get('industry', 'Not specified') for company in companies))
             
             # Enhanced debugging for deployment issues
             debug_enabled = st.checkbox("🔧 Debug: Show industry extraction details", key=f"debug_industries_{filter_key_base}")
@@ -736,7 +740,7 @@ class CareerFairApp:
                     cleaned_industries.append(str(industry).strip())
             
             # Remove duplicates and sort
-            cleaned_industries = sorted(list(set(cleaned_industries)))
+            cleaned_industries = sorted(set(cleaned_industries))
             
             # Enhanced fallback for deployment issues
             if not cleaned_industries:
@@ -1975,7 +1979,12 @@ class CareerFairApp:
 def main():
     """Main function to run the Streamlit app"""
     app = CareerFairApp()
-    app.run()
+    try:
+        app.run()
+    finally:
+        # Write the interactions from this script run once, including runs ended by st.rerun()
+        if app.pdf_reader is not None:
+            app.pdf_reader.flush()
 
 
 if __name__ == "__main__":